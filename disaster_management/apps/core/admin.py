@@ -1,3 +1,10 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import ExportJob
+
+
+@admin.register(ExportJob)
+class ExportJobAdmin(admin.ModelAdmin):
+    list_display = ('id', 'dataset', 'format', 'start', 'end', 'status', 'rows', 'user', 'created_at')
+    list_filter = ('status', 'dataset', 'format')
+    ordering = ('-created_at',)
@@ -0,0 +1,19 @@
+# Generated by Django 4.2 on 2026-10-17 22:00
+
+import disaster_management.apps.core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_activitylog_time_id_idx'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='exportjob',
+            name='file',
+            field=models.FileField(blank=True, storage=disaster_management.apps.core.models.export_storage, upload_to='exports/'),
+        ),
+    ]
@@ -1,5 +1,6 @@
 from django.db import models
 from django.conf import settings
+from django.core.files.storage import FileSystemStorage
 
 class ActivityLog(models.Model):
     ACTION_CHOICES = [
@@ -19,6 +20,10 @@ class ActivityLog(models.Model):
     description = models.TextField(blank=True)
     timestamp = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # keyset pagination (graphql.pagination): newest-first by (timestamp, id)
+        indexes = [models.Index(fields=["-timestamp", "-id"], name="activitylog_time_id_idx")]
+
     def __str__(self):
         return f"{self.user} - {self.action} {self.model_name} ({self.object_id})"
 
@@ -30,3 +35,39 @@ class ErrorLog(models.Model):
 
     def __str__(self):
         return f"Error in {self.source} @ {self.occurred_at.strftime('%Y-%m-%d %H:%M')}"
+
+
+def export_storage():
+    """Private storage under EXPORT_ROOT (not MEDIA_ROOT, which is publicly served)."""
+    return FileSystemStorage(location=settings.EXPORT_ROOT)
+
+
+class ExportJob(models.Model):
+    """
+    Background bulk export (large ranges / GeoPackage). The artifact lands in
+    export_storage and is downloaded through the export_job_download view.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
+    dataset = models.CharField(max_length=30)
+    format = models.CharField(max_length=10)
+    start = models.DateTimeField()
+    end = models.DateTimeField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='pending')
+    rows = models.PositiveIntegerField(null=True, blank=True)
+    file = models.FileField(upload_to='exports/', storage=export_storage, blank=True)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"{self.dataset}.{self.format} {self.start:%Y-%m-%d}→{self.end:%Y-%m-%d} ({self.status})"
@@ -1,3 +1,167 @@
-from django.shortcuts import render
+from datetime import datetime, time
 
-# Create your views here.
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.http import FileResponse, Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.cache import patch_cache_control
+from django.utils.dateparse import parse_date, parse_datetime
+from django.views.decorators.http import require_GET
+from graphql_jwt.exceptions import JSONWebTokenError
+
+from disaster_management.apps.core.models import ExportJob
+from disaster_management.apps.core.tasks import run_export_job
+from disaster_management.utils.exports import CONTENT_TYPES, EXPORT_DATASETS, EXPORT_FORMATS, STREAM_FORMATS, stream_export
+from disaster_management.utils.vector_tiles import CONTENT_TYPE, get_tile, layer_is_private, tile_in_range
+
+EXPORT_ROLES = {"Admin", "Responder"}
+
+
+@require_GET
+def vector_tile(request, layer, z, x, y):
+    """
+    /tiles/<layer>/<z>/<x>/<y>.mvt – Mapbox Vector Tile for one map layer
+    (forecasts, risk_zones, incidents, shelters), rendered by PostGIS and cached.
+    The incidents layer needs a session or `Authorization: JWT <token>`.
+    """
+    if not tile_in_range(z, x, y):
+        raise Http404("Tile out of range")
+    private = layer_is_private(layer)
+    if private and _request_user(request) is None:
+        return JsonResponse({"error": "Authentication required"}, status=401)
+    tile = get_tile(layer, z, x, y)
+    if tile is None:
+        raise Http404(f"Unknown tile layer '{layer}'")
+
+    response = HttpResponse(tile, content_type=CONTENT_TYPE, status=200 if tile else 204)
+    if private:
+        patch_cache_control(response, private=True, max_age=60)
+    else:
+        patch_cache_control(response, public=True, max_age=60)
+    return response
+
+
+def _request_user(request):
+    """
+    Session user or `Authorization: JWT <token>` (same backend as GraphQL); None
+    when neither authenticates, including an expired or malformed token.
+    """
+    if request.user.is_authenticated:
+        return request.user
+    try:
+        user = authenticate(request=request)
+    except JSONWebTokenError:  # the JWT backend raises instead of returning None
+        return None
+    return user if user is not None and user.is_authenticated else None
+
+
+# --------------- Bulk exports ----------------
+def _export_user(request):
+    """Authenticated (see _request_user) Admins/Responders only."""
+    user = _request_user(request)
+    if user is None:
+        return None, JsonResponse({"error": "Authentication required"}, status=401)
+    if not (user.is_staff or getattr(user, "role", None) in EXPORT_ROLES):
+        return None, JsonResponse({"error": "Not allowed to export"}, status=403)
+    return user, None
+
+
+def _parse_when(value: str):
+    """ISO datetime or date (midnight, local time)."""
+    when = parse_datetime(value or "")
+    if when is None:
+        day = parse_date(value or "")
+        when = datetime.combine(day, time.min) if day else None
+    if when is not None and timezone.is_naive(when):
+        when = timezone.make_aware(when)
+    return when
+
+
+def _parse_range(request):
+    start, end = _parse_when(request.GET.get("start")), _parse_when(request.GET.get("end"))
+    if not start or not end:
+        raise ValueError("start and end are required (ISO date or datetime)")
+    if end <= start:
+        raise ValueError("end must be after start")
+    return start, end
+
+
+@require_GET
+def export_dataset(request, dataset, fmt):
+    """
+    /exports/<dataset>.<fmt>?start=&end= – bulk export of incidents, forecasts,
+    weather_logs or risk_zones as geojson/csv (streamed, constant memory) or gpkg.
+    Ranges over EXPORT_STREAM_MAX_DAYS, gpkg, or ?async=1 become an ExportJob (202).
+    """
+    user, denied = _export_user(request)
+    if denied:
+        return denied
+    if dataset not in EXPORT_DATASETS or fmt not in EXPORT_FORMATS:
+        raise Http404(f"Unknown export '{dataset}.{fmt}'")
+    try:
+        start, end = _parse_range(request)
+    except ValueError as e:
+        return JsonResponse({"error": str(e)}, status=400)
+
+    too_long = (end - start).days > getattr(settings, "EXPORT_STREAM_MAX_DAYS", 31)
+    if fmt not in STREAM_FORMATS or too_long or request.GET.get("async") == "1":
+        job = ExportJob.objects.create(user=user, dataset=dataset, format=fmt, start=start, end=end)
+        run_export_job.delay(job.pk)
+        return JsonResponse(_job_payload(job, request), status=202)
+
+    response = StreamingHttpResponse(stream_export(dataset, fmt, start, end), content_type=CONTENT_TYPES[fmt])
+    response["Content-Disposition"] = f'attachment; filename="{dataset}_{start:%Y%m%d}_{end:%Y%m%d}.{fmt}"'
+    return response
+
+
+def _job_payload(job, request):
+    return {
+        "id": job.pk,
+        "dataset": job.dataset,
+        "format": job.format,
+        "start": job.start.isoformat(),
+        "end": job.end.isoformat(),
+        "status": job.status,
+        "rows": job.rows,
+        "error": job.error or None,
+        "download_url": (
+            request.build_absolute_uri(reverse("export-job-download", args=[job.pk])) if job.file else None
+        ),
+        "status_url": request.build_absolute_uri(reverse("export-job", args=[job.pk])),
+    }
+
+
+def _user_job(request, job_id):
+    """(job, None) for the requesting exporter's own job (any job for staff), else (None, error response)."""
+    user, denied = _export_user(request)
+    if denied:
+        return None, denied
+    job = get_object_or_404(ExportJob, pk=job_id)
+    if job.user_id != user.pk and not user.is_staff:
+        raise Http404("Export job not found")
+    return job, None
+
+
+@require_GET
+def export_job(request, job_id):
+    """/exports/jobs/<id>/ – status of a background export and its download URL once done."""
+    job, denied = _user_job(request, job_id)
+    if denied:
+        return denied
+    return JsonResponse(_job_payload(job, request))
+
+
+@require_GET
+def export_job_download(request, job_id):
+    """/exports/jobs/<id>/download/ – the finished artifact, after the same permission check."""
+    job, denied = _user_job(request, job_id)
+    if denied:
+        return denied
+    if not job.file:
+        raise Http404("Export not ready")
+    return FileResponse(
+        job.file.open("rb"), as_attachment=True,
+        filename=job.file.name.rsplit("/", 1)[-1], content_type=CONTENT_TYPES[job.format],
+    )
@@ -1,6 +1,6 @@
 from django.contrib import admin
 from django.contrib.gis.admin import OSMGeoAdmin
-from .models import ForecastModel, ForecastResult
+from .models import ForecastModel, ForecastResult, PipelineRun, PipelineStage, RiskRaster
 
 
 @admin.register(ForecastModel)
@@ -19,3 +19,26 @@ class ForecastResultAdmin(OSMGeoAdmin):  # Enables map for polygons
     default_lon = 27.8493  # Centered on Zambia
     default_lat = -13.1339
     default_zoom = 6
+
+
+class PipelineStageInline(admin.TabularInline):
+    model = PipelineStage
+    extra = 0
+    fields = ('name', 'status', 'started_at', 'finished_at', 'duration_s', 'result')
+    readonly_fields = fields
+    can_delete = False
+
+
+@admin.register(PipelineRun)
+class PipelineRunAdmin(admin.ModelAdmin):
+    list_display = ('id', 'trigger', 'status', 'started_at', 'finished_at')
+    list_filter = ('status', 'trigger')
+    ordering = ('-started_at',)
+    inlines = [PipelineStageInline]
+
+
+@admin.register(RiskRaster)
+class RiskRasterAdmin(admin.ModelAdmin):
+    list_display = ('as_of', 'resolution', 'bands', 'run', 'path', 'created_at')
+    ordering = ('-as_of',)
+    readonly_fields = ('stats',)
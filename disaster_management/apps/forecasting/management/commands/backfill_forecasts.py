@@ -0,0 +1,59 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+
+from disaster_management.apps.forecasting.backfill import (
+    REPLAYABLE, backfill_chunks, run_backfill_chunk, start_backfill,
+)
+from disaster_management.apps.forecasting.pipeline import finish_pipeline_run
+from disaster_management.apps.forecasting.models import PipelineRun
+
+
+def _aware(value: str) -> datetime:
+    dt = datetime.fromisoformat(value)
+    return timezone.make_aware(dt) if timezone.is_naive(dt) else dt
+
+
+def _run_chunk(args):
+    # Runs in a forked worker process; Django opens a fresh DB connection lazily
+    return run_backfill_chunk(*args)
+
+
+class Command(BaseCommand):
+    help = "Replay hazard forecasters as-of every hour in [start, end), tagged with a backfill PipelineRun."
+
+    def add_arguments(self, parser):
+        parser.add_argument("start", help="ISO date/datetime, e.g. 2025-11-01")
+        parser.add_argument("end", help="ISO date/datetime (exclusive), e.g. 2026-05-01")
+        parser.add_argument("--hazards", nargs="+", choices=[n for n, _, _ in REPLAYABLE],
+                            help="Subset of hazards to replay (default: all)")
+        parser.add_argument("--chunk-hours", type=int, default=24, help="Hours per chunk/job (default 24)")
+        parser.add_argument("--workers", type=int, default=0,
+                            help="Run chunks on a local process pool of this size instead of Celery")
+
+    def handle(self, *args, **opts):
+        start, end = _aware(opts["start"]), _aware(opts["end"])
+        if end <= start:
+            raise CommandError("end must be after start")
+        chunk = timedelta(hours=opts["chunk_hours"])
+        hazards = opts["hazards"]
+
+        if not opts["workers"]:
+            run = start_backfill(start, end, hazards, chunk)
+            self.stdout.write(self.style.SUCCESS(
+                f"Backfill run {run.pk} queued on Celery: {len(backfill_chunks(start, end, chunk))} chunks."
+            ))
+            return
+
+        run = PipelineRun.objects.create(trigger="backfill")
+        jobs = [(run.pk, s.isoformat(), e.isoformat(), hazards) for s, e in backfill_chunks(start, end, chunk)]
+        connections.close_all()  # never share a DB socket with forked children
+        with ProcessPoolExecutor(max_workers=opts["workers"], mp_context=multiprocessing.get_context("fork")) as pool:
+            for done in as_completed(pool.submit(_run_chunk, job) for job in jobs):
+                self.stdout.write(done.result())
+
+        self.stdout.write(self.style.SUCCESS(finish_pipeline_run(run.pk)))
@@ -0,0 +1,18 @@
+# Generated by Django 4.2 on 2026-10-17 09:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasting', '0002_alter_forecastmodel_model_type'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='forecastmodel',
+            name='artifact_path',
+            field=models.CharField(blank=True, help_text='Serialized estimator (joblib), absolute or relative to BASE_DIR; loaded via forecasting.registry', max_length=255),
+        ),
+    ]
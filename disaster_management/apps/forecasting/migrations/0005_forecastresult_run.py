@@ -0,0 +1,19 @@
+# Generated by Django 4.2 on 2026-10-17 10:30
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasting', '0004_pipelinerun_pipelinestage'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='forecastresult',
+            name='run',
+            field=models.ForeignKey(blank=True, help_text='Pipeline or backfill run that produced this result', null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='results', to='forecasting.pipelinerun'),
+        ),
+    ]
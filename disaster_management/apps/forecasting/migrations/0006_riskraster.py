@@ -0,0 +1,36 @@
+# Generated by Django 4.2 on 2026-10-17 11:00
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasting', '0005_forecastresult_run'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RiskRaster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('as_of', models.DateTimeField(db_index=True, help_text='Instant the scores were evaluated for')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('path', models.CharField(help_text='GeoTIFF path relative to MEDIA_ROOT', max_length=255)),
+                ('resolution', models.FloatField(help_text='Cell size in degrees')),
+                ('west', models.FloatField()),
+                ('south', models.FloatField()),
+                ('east', models.FloatField()),
+                ('north', models.FloatField()),
+                ('bands', models.JSONField(default=list)),
+                ('stats', models.JSONField(blank=True, default=dict)),
+                ('run', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='rasters', to='forecasting.pipelinerun')),
+            ],
+            options={
+                'verbose_name': 'Risk Raster',
+                'verbose_name_plural': 'Risk Rasters',
+                'ordering': ['-as_of'],
+            },
+        ),
+    ]
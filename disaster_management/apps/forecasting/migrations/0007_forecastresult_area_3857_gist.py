@@ -0,0 +1,22 @@
+# Generated by Django 4.2 on 2026-10-17 20:00
+
+from django.db import migrations
+
+
+# Web Mercator bbox index for map tiles (utils.vector_tiles._in_tile)
+CREATE_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS forecastresult_area_3857_gist
+    ON forecasting_forecastresult USING GIST ((ST_Transform(affected_area::geometry, 3857)))
+    WHERE affected_area IS NOT NULL
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forecasting', '0006_riskraster'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_INDEX_SQL, "DROP INDEX IF EXISTS forecastresult_area_3857_gist"),
+    ]
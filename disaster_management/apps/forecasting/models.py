@@ -15,6 +15,10 @@ class ForecastModel(models.Model):
     description = models.TextField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     version = models.CharField(max_length=20, blank=True, help_text="Optional version tag (e.g. v1.0, beta)")
+    artifact_path = models.CharField(
+        max_length=255, blank=True,
+        help_text="Serialized estimator (joblib), absolute or relative to BASE_DIR; loaded via forecasting.registry",
+    )
 
     class Meta:
         verbose_name = "Forecast Model"
@@ -44,6 +48,10 @@ class ForecastResult(models.Model):
         blank=True,
         related_name="risk_zones"
     )
+    run = models.ForeignKey(
+        "PipelineRun", null=True, blank=True, on_delete=models.SET_NULL, related_name="results",
+        help_text="Pipeline or backfill run that produced this result",
+    )
 
     class Meta:
         verbose_name = "Forecast Result"
@@ -52,3 +60,71 @@ class ForecastResult(models.Model):
 
     def __str__(self):
         return f"{self.model.name} → {self.area_name or 'Area'} on {self.forecast_date} ({self.risk_level})"
+
+
+class PipelineRun(models.Model):
+    STATUS_CHOICES = [
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('partial', 'Partial'),
+        ('failed', 'Failed'),
+    ]
+
+    trigger = models.CharField(max_length=20, default='beat', help_text="beat, manual, backfill, ...")
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='running')
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Pipeline Run"
+        verbose_name_plural = "Pipeline Runs"
+        ordering = ['-started_at']
+
+    def __str__(self):
+        return f"Pipeline run #{self.pk} ({self.status})"
+
+
+class PipelineStage(models.Model):
+    STATUS_CHOICES = [
+        ('running', 'Running'),
+        ('succeeded', 'Succeeded'),
+        ('failed', 'Failed'),
+    ]
+
+    run = models.ForeignKey(PipelineRun, on_delete=models.CASCADE, related_name='stages')
+    name = models.CharField(max_length=50)
+    task = models.CharField(max_length=200)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='running')
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    duration_s = models.FloatField(null=True, blank=True)
+    result = models.TextField(blank=True)
+
+    class Meta:
+        ordering = ['started_at']
+
+    def __str__(self):
+        return f"{self.run_id}:{self.name} ({self.status})"
+
+
+class RiskRaster(models.Model):
+    """One gridded risk run: a multi-band (flood/drought/heat) tiled GeoTIFF on a fixed grid."""
+    run = models.ForeignKey(PipelineRun, null=True, blank=True, on_delete=models.SET_NULL, related_name='rasters')
+    as_of = models.DateTimeField(db_index=True, help_text="Instant the scores were evaluated for")
+    created_at = models.DateTimeField(auto_now_add=True)
+    path = models.CharField(max_length=255, help_text="GeoTIFF path relative to MEDIA_ROOT")
+    resolution = models.FloatField(help_text="Cell size in degrees")
+    west = models.FloatField()
+    south = models.FloatField()
+    east = models.FloatField()
+    north = models.FloatField()
+    bands = models.JSONField(default=list)
+    stats = models.JSONField(default=dict, blank=True)
+
+    class Meta:
+        verbose_name = "Risk Raster"
+        verbose_name_plural = "Risk Rasters"
+        ordering = ['-as_of']
+
+    def __str__(self):
+        return f"Risk raster {self.as_of:%Y-%m-%d %H:%M} ({self.resolution}°)"
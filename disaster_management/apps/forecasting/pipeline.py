@@ -0,0 +1,166 @@
+# forecasts/pipeline.py
+"""
+Hourly forecast pipeline as a Celery DAG instead of crontab offsets:
+
+    ingest shards ──► ingest ──► features ──► ┌ risk_zones ┐
+                                              │ flood      │
+                                              │ drought    ├──► finish (run status + timings)
+                                              │ heat_wave  │
+                                              │ rain_check │
+                                              └ risk_grid  ┘  (only with RISK_GRID_ENABLED)
+
+Each stage starts as soon as the previous one has committed (chain/chord),
+and every stage records a PipelineStage row with its timing and result.
+Ingestion fans out over the station catalogue as parallel shard tasks; the
+`ingest` stage merges their summaries once all shards have reported.
+Hazard tasks queue their own AlertBatch after their write, so alerts go out
+as soon as each hazard finishes.
+"""
+from __future__ import annotations
+
+import logging
+import time
+from typing import List, Optional, Tuple
+from zoneinfo import ZoneInfo
+
+from celery import chain, chord, current_app, shared_task
+from django.conf import settings
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from disaster_management.apps.forecasting.models import PipelineRun, PipelineStage
+from disaster_management.utils.vector_tiles import invalidate_layer
+
+log = logging.getLogger(__name__)
+
+# Chord callback over the ingest shard summaries; a failure here stops the run
+INGEST_STAGE = ("ingest", "disaster_management.apps.weather.tasks.finish_weather_ingest")
+
+# (stage, task path) – run in order after ingestion; a failure here stops the run
+SERIAL_STAGES: List[Tuple[str, str]] = [
+    ("features", "disaster_management.apps.forecasting.pipeline.warm_features"),
+]
+
+# Stages whose task writes ForecastResult/RiskRaster rows; they get the run id to tag them
+RESULT_STAGES = {"flood", "drought", "heat_wave", "rain_check", "risk_grid"}
+
+# (stage, task path, every N hours) – run in parallel once features are ready
+HAZARD_STAGES: List[Tuple[str, str, int]] = [
+    ("risk_zones", "disaster_management.apps.weather.tasks.calculate_risk_zones", 1),
+    ("flood", "disaster_management.apps.forecasting.tasks.run_flood_prediction", 3),
+    ("drought", "disaster_management.apps.forecasting.tasks.run_drought_prediction", 6),
+    ("heat_wave", "disaster_management.apps.forecasting.tasks.run_heat_wave_forecast", 6),
+    ("rain_check", "disaster_management.apps.forecasting.tasks.run_seasonal_rain_check", 6),
+    ("risk_grid", "disaster_management.apps.forecasting.tasks.run_gridded_risk", 3),
+]
+
+# Stages that only run when switched on in settings
+OPTIONAL_STAGES = {"risk_grid": "RISK_GRID_ENABLED"}
+
+
+def stage_enabled(name: str) -> bool:
+    flag = OPTIONAL_STAGES.get(name)
+    return flag is None or bool(getattr(settings, flag, False))
+
+
+def beat_hour(dt=None) -> int:
+    """Hour of `dt` (default: now) on the beat clock, which the hazard cadences follow."""
+    # Beat runs on the Celery app's timezone (celery.py), not Django's TIME_ZONE (UTC);
+    # read per call, since the app config is not loaded when this module is imported
+    return timezone.localtime(dt or timezone.now(), ZoneInfo(current_app.conf.timezone)).hour
+
+
+def hazards_due(local_hour: int) -> List[Tuple[str, str]]:
+    """Hazard stages whose cadence includes this local hour (keeps the old 1/3/6-hour rhythm)."""
+    return [
+        (name, path) for name, path, every in HAZARD_STAGES
+        if local_hour % every == 0 and stage_enabled(name)
+    ]
+
+
+def warm_features() -> str:
+    """Build the shared WeatherSnapshot once so every hazard stage reads it from cache."""
+    from disaster_management.utils.weather_snapshot import get_weather_snapshot
+    snapshot = get_weather_snapshot()
+    return f"Weather snapshot ready: {len(snapshot)} logs."
+
+
+@shared_task
+def run_pipeline_stage(run_id: int, stage: str, task_path: str, required: bool = False,
+                       kwargs: Optional[dict] = None) -> str:
+    """
+    Execute one stage in-process and record its timing. Required stages re-raise
+    on failure so the chain stops (downstream never sees partial inputs);
+    optional ones are recorded as failed and the rest of the DAG carries on.
+    """
+    row = PipelineStage.objects.create(run_id=run_id, name=stage, task=task_path)
+    t0 = time.perf_counter()
+    try:
+        result = import_string(task_path)(**(kwargs or {}))
+        status = "succeeded"
+    except Exception as e:
+        log.exception("[pipeline] Stage %s failed in run %s", stage, run_id)
+        result, status = f"{type(e).__name__}: {e}", "failed"
+        if required:
+            PipelineRun.objects.filter(pk=run_id).update(status="failed", finished_at=timezone.now())
+    PipelineStage.objects.filter(pk=row.pk).update(
+        status=status,
+        finished_at=timezone.now(),
+        duration_s=time.perf_counter() - t0,
+        result=str(result)[:2000],
+    )
+    if status == "failed" and required:
+        raise RuntimeError(f"Pipeline run {run_id} stopped at required stage '{stage}': {result}")
+    return f"{stage}: {status}"
+
+
+@shared_task
+def run_pipeline_merge(results: list, run_id: int, stage: str, task_path: str, required: bool = False) -> str:
+    """Chord-callback form of run_pipeline_stage: the header results go to the task as `summaries`."""
+    return run_pipeline_stage(run_id, stage, task_path, required, {"summaries": results})
+
+
+@shared_task
+def finish_pipeline_run(run_id: int) -> str:
+    """Chord callback: close the run once every hazard stage has reported."""
+    failed = PipelineStage.objects.filter(run_id=run_id, status="failed").count()
+    status = "partial" if failed else "succeeded"
+    PipelineRun.objects.filter(pk=run_id).update(status=status, finished_at=timezone.now())
+    invalidate_layer("forecasts")
+    return f"Pipeline run {run_id} {status}."
+
+
+def build_pipeline(run_id: int, hazards: List[Tuple[str, str]]):
+    """Celery canvas for one run (immutable signatures: stages share state via the DB, not results)."""
+    from disaster_management.apps.weather.tasks import ingest_weather_shard, shard_count
+
+    shards = shard_count()
+    ingest = chord(
+        [ingest_weather_shard.si(i, shards) for i in range(shards)],
+        run_pipeline_merge.s(run_id, *INGEST_STAGE, True),
+    )
+    serial = [ingest] + [run_pipeline_stage.si(run_id, name, path, True) for name, path in SERIAL_STAGES]
+    parallel = [
+        run_pipeline_stage.si(run_id, name, path, False, {"run_id": run_id} if name in RESULT_STAGES else None)
+        for name, path in hazards
+    ]
+    if not parallel:
+        return chain(*serial, finish_pipeline_run.si(run_id))
+    return chain(*serial, chord(parallel, finish_pipeline_run.si(run_id)))
+
+
+@shared_task
+def run_forecast_pipeline(trigger: str = "beat", hazards: Optional[List[str]] = None) -> str:
+    """
+    Entry point (beat, hourly): record a PipelineRun and launch the DAG.
+    `hazards` overrides the cadence with explicit stage names, e.g. ["flood"].
+    """
+    if hazards is None:
+        due = hazards_due(beat_hour())
+    else:
+        due = [(name, path) for name, path, _ in HAZARD_STAGES if name in hazards]
+
+    run = PipelineRun.objects.create(trigger=trigger)
+    build_pipeline(run.pk, due).apply_async()
+    stages = [INGEST_STAGE[0]] + [n for n, _ in SERIAL_STAGES]
+    return f"Pipeline run {run.pk} started: {' → '.join(stages)} → [{', '.join(n for n, _ in due)}]"
@@ -1,13 +1,17 @@
 # forecasts/predictors/seasonal_outlook.py
-import joblib
 import pandas as pd
 
-MODEL_PATH = "disaster_management/forecasts/ml/seasonal_outlook_model.joblib"
+from disaster_management.apps.forecasting.registry import DEFAULT_ARTIFACTS, load_model, predict_batch
+
+MODEL_NAME = "Seasonal Outlook Predictor"
+MODEL_PATH = DEFAULT_ARTIFACTS[MODEL_NAME]
+FEATURES = ["rain_dec", "rain_jan", "rain_feb", "rain_mar"]
 
 def predict_seasonal_outlook(df):
-    model = joblib.load(MODEL_PATH)
+    model = load_model(MODEL_NAME, path=MODEL_PATH)  # cached per worker; reloaded if the file changes
 
-    features = df[["rain_jan", "rain_feb", "rain_mar", "rain_dec"]]
-    df["prediction"] = model.predict(features)
+    labels, confidence = predict_batch(model, df[FEATURES])
+    df["prediction"] = labels
+    df["confidence"] = confidence
 
-    return df[["city", "year", "prediction"]]
+    return df[["city", "year", "prediction", "confidence"]]
@@ -0,0 +1,101 @@
+# forecasts/registry.py
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+import numpy as np
+import pandas as pd
+from django.conf import settings
+
+# Default artifact per model name, used when the ForecastModel row has no artifact_path yet
+DEFAULT_ARTIFACTS = {
+    "Seasonal Outlook Predictor": "disaster_management/forecasts/ml/seasonal_outlook_model.joblib",
+}
+
+
+@dataclass(frozen=True)
+class _Loaded:
+    model: Any
+    path: str
+    mtime_ns: int
+    size: int
+
+
+_cache: Dict[Tuple[str, str], _Loaded] = {}
+_lock = threading.Lock()
+
+
+def _resolve(path: str) -> str:
+    return path if os.path.isabs(path) else os.path.join(str(settings.BASE_DIR), path)
+
+
+def artifact_path_for(entry) -> str:
+    """Artifact file for a ForecastModel row (its artifact_path, else the registry default)."""
+    path = getattr(entry, "artifact_path", "") or DEFAULT_ARTIFACTS.get(entry.name)
+    if not path:
+        raise LookupError(f"No model artifact registered for '{entry.name}'")
+    return _resolve(path)
+
+
+def load_model(name: str, version: str = "", path: Optional[str] = None):
+    """
+    Return the fitted estimator registered as (name, version).
+    Loaded once per worker process; re-loaded only when the artifact file's
+    mtime or size changes (e.g. after retraining overwrites it).
+    """
+    path = _resolve(path or DEFAULT_ARTIFACTS[name])
+    stat = os.stat(path)
+    key = (name, version or "")
+
+    cached = _cache.get(key)
+    if cached and cached.path == path and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+        return cached.model
+
+    with _lock:
+        cached = _cache.get(key)
+        if cached and cached.path == path and cached.mtime_ns == stat.st_mtime_ns and cached.size == stat.st_size:
+            return cached.model
+        model = joblib.load(path)
+        _cache[key] = _Loaded(model=model, path=path, mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+        return model
+
+
+def get_model(entry):
+    """`load_model` for a ForecastModel row."""
+    return load_model(entry.name, entry.version, artifact_path_for(entry))
+
+
+def clear_cache() -> None:
+    with _lock:
+        _cache.clear()
+
+
+def _feature_matrix(model, features: pd.DataFrame):
+    """Order columns the way the estimator was fitted, when it recorded feature names."""
+    names = getattr(model, "feature_names_in_", None)
+    if names is not None:
+        return features[list(names)]
+    return features
+
+
+def predict_batch(model, features: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Labels and confidences for every row of `features` in one vectorized call.
+    Uses predict_proba when available (label = argmax class, confidence = its
+    probability); otherwise predict with NaN confidence.
+    """
+    if features.empty:
+        return np.array([], dtype=object), np.array([], dtype=float)
+
+    X = _feature_matrix(model, features)
+    if hasattr(model, "predict_proba") and hasattr(model, "classes_"):
+        proba = np.asarray(model.predict_proba(X), dtype=float)
+        idx = proba.argmax(axis=1)
+        return np.asarray(model.classes_)[idx], proba[np.arange(len(idx)), idx]
+
+    labels = np.asarray(model.predict(X))
+    return labels, np.full(len(labels), np.nan)
@@ -1,31 +1,51 @@
 # forecasts/tasks.py
+import os
+
 from celery import shared_task
-from django.utils.timezone import now, timezone
+from django.conf import settings
+from django.utils import timezone
+from django.utils.timezone import now
+from datetime import datetime
 from typing import Dict, List, Tuple
-from disaster_management.apps.forecasting.models import ForecastModel, ForecastResult
-from disaster_management.apps.notifications.models import Notification
+from disaster_management.apps.forecasting.models import ForecastModel, ForecastResult, RiskRaster
+from disaster_management.apps.forecasting import backfill, pipeline  # noqa: F401  registers the pipeline/backfill tasks
+from disaster_management.apps.forecasting.registry import get_model, predict_batch
 from disaster_management.apps.weather.models import WeatherLog
 from disaster_management.models.dummy_flood_predictor import predict
-from disaster_management.utils.climate_constants import MONTHLY_TEMP_BASELINE, RAINY_SEASON_MONTHS, SEASON_CONFIG, ZAMBIA_CITIES, _lusaka_month, _temp_anomaly, get_season
+from disaster_management.utils.climate_constants import MONTHLY_TEMP_BASELINE, RAINY_SEASON_MONTHS, SEASON_CONFIG, ZAMBIA_CITIES, _lusaka_month, _temp_anomaly, get_season, temp_anomaly_array
 from disaster_management.utils.feature_extraction import extract_drought_features, extract_flood_features
+from disaster_management.utils.bulk_copy import copy_bulk_create
+from disaster_management.utils.geometry import footprint_polygon, footprint_wkb
 from django.utils.timezone import now, timedelta
-from django.contrib.gis.geos import Point
 from disaster_management.utils.monthly_rainfall_dataset import build_rainfall_training_set
-from disaster_management.utils.notifications import send_alert, send_seasonal_alert_email
-from disaster_management.utils.risk_scoring import score_drought_df, score_flood_df
-from disaster_management.utils.seasonal_anomaly import detect_drought_anomaly
-from disaster_management.utils.seasonal_rainfall import get_monthly_rainfall_history
+from disaster_management.utils.notifications import AlertBatch
+from disaster_management.utils.risk_grid import DEFAULT_RESOLUTION, points_to_grid, write_risk_raster, zambia_grid
+from disaster_management.utils.risk_scoring import score_drought_df, score_flood_df, score_heat_arrays
+from disaster_management.utils.seasonal_anomaly import detect_drought_anomaly, rainy_days_by_city, rainy_season_threshold
+from disaster_management.utils.rainfall_climatology import average_rain_days, rain_days_by_city_month
+from disaster_management.utils.vector_tiles import invalidate_layer
+from disaster_management.utils.weather_snapshot import get_weather_snapshot
+import numpy as np
 import pandas as pd
 from django.utils.timezone import now
 from disaster_management.apps.weather.models import WeatherLog
 from disaster_management.apps.forecasting.models import ForecastModel, ForecastResult
-import joblib
-from math import cos, radians
-from django.db.models import Q, Count
-from django.db.models.functions import TruncDate, ExtractMonth
 from django.db import transaction
 # --- helpers ---------------------------------------------------------------
 
+def _resolve_as_of(as_of) -> datetime:
+    """
+    Evaluation instant for a hazard run: None → now (live); datetimes or ISO
+    strings (as Celery delivers them) → that instant, for replays/backfills.
+    """
+    if as_of is None:
+        return timezone.now()
+    if isinstance(as_of, str):
+        as_of = datetime.fromisoformat(as_of)
+    if timezone.is_naive(as_of):
+        as_of = timezone.make_aware(as_of)
+    return as_of
+
 def _risk_bucket(score: float) -> tuple[str, float]:
     """
     Map a 0..1 score to ('low'|'medium'|'high', confidence).
@@ -38,23 +58,6 @@ def _risk_bucket(score: float) -> tuple[str, float]:
     return "low", float(score)
 
 
-def _degree_buffer_for_meters(lat_deg: float, meters: float) -> float:
-    """
-    Approximate a degree radius on WGS84 to get about `meters` radius on Earth.
-    Uses latitude to adjust longitudinal scale. We return a single degree radius
-    for GEOS buffer on geographic coords (planar in degrees).
-    """
-    # ~111.32 km per degree latitude; longitude shrinks by cos(latitude)
-    meters_per_deg_lat = 111_320.0
-    meters_per_deg_lon = meters_per_deg_lat * max(0.1, cos(radians(lat_deg)))  # guard near poles
-
-    deg_lat = meters / meters_per_deg_lat
-    deg_lon = meters / meters_per_deg_lon
-    # GEOS buffer on geographic coords is isotropic in degrees;
-    # use the smaller to avoid over-inflating areas east-west.
-    return float(min(deg_lat, deg_lon))
-
-
 def _risk_from_anomaly(avg_anom: float, season: str) -> tuple[str, float]:
     """
     Map average temp anomaly (°C) to risk bucket + confidence.
@@ -77,14 +80,36 @@ def _risk_from_anomaly(avg_anom: float, season: str) -> tuple[str, float]:
     return "low", float(max(0.1, 0.2 + avg_anom / 12.0))
 
 
+def _heat_city_stats(logs) -> pd.DataFrame:
+    """
+    One row per city from a WeatherSnapshot slice, all in NumPy:
+      city, samples, avg_temp, avg_anom, dom_month, lon, lat
+    dom_month = most frequent local month (ties → earliest month);
+    lon/lat = first observation in the window.
+    """
+    names = pd.Series(logs.city_name, dtype=object).fillna("").str.strip().replace("", "Unknown")
+    codes, cities = pd.factorize(names, sort=False)
+    if len(cities) == 0:
+        return pd.DataFrame(columns=["city", "samples", "avg_temp", "avg_anom", "dom_month", "lon", "lat"])
+
+    n = len(cities)
+    months = logs.local_month.astype(np.intp)
+    samples = np.bincount(codes, minlength=n)
+    avg_temp = np.bincount(codes, weights=logs.temperature, minlength=n) / samples
+    avg_anom = np.bincount(codes, weights=temp_anomaly_array(logs.temperature, months), minlength=n) / samples
+    month_counts = np.bincount(codes * 13 + months, minlength=n * 13).reshape(n, 13)
+    _, first = np.unique(codes, return_index=True)
+
+    return pd.DataFrame({
+        "city": np.asarray(cities, dtype=object),
+        "samples": samples,
+        "avg_temp": avg_temp,
+        "avg_anom": avg_anom,
+        "dom_month": month_counts.argmax(axis=1),
+        "lon": logs.lon[first],
+        "lat": logs.lat[first],
+    })
 
-def _degree_buffer_for_meters(lat_deg: float, meters: float) -> float:
-    """Approximate degree radius for ~meters on WGS84 (no GDAL required)."""
-    meters_per_deg_lat = 111_320.0
-    meters_per_deg_lon = meters_per_deg_lat * max(0.1, cos(radians(lat_deg)))
-    deg_lat = meters / meters_per_deg_lat
-    deg_lon = meters / meters_per_deg_lon
-    return float(min(deg_lat, deg_lon))
 
 def _next_month(dt) -> int:
     local = timezone.localtime(dt)
@@ -144,6 +169,7 @@ def _city_coord_map() -> Dict[str, Tuple[float, float]]:
     return {name: (lon, lat) for (name, lon, lat) in ZAMBIA_CITIES}
 
 FEATURE_MONTHS = [12, 1, 2, 3]
+SEASONAL_FEATURES = ["rain_dec", "rain_jan", "rain_feb", "rain_mar"]  # same names as the training CSV
 
 def _label_to_risk(label: str) -> str:
     # keep your mapping
@@ -156,7 +182,7 @@ def _label_to_risk(label: str) -> str:
 # --- task ------------------------------------------------------------------
 
 @shared_task
-def run_flood_prediction() -> str:
+def run_flood_prediction(as_of=None, run_id=None, notify=True) -> str:
     # 1) Load or create the model metadata
     model, _ = ForecastModel.objects.get_or_create(
         name="Season-Aware Flood Predictor",
@@ -165,7 +191,8 @@ def run_flood_prediction() -> str:
     )
 
     # 2) Extract features and score
-    features_df = extract_flood_features()
+    now = _resolve_as_of(as_of)
+    features_df = extract_flood_features(as_of=now)
     if features_df.empty:
         return "No flood features available."
 
@@ -174,35 +201,21 @@ def run_flood_prediction() -> str:
         return "Scoring failed: missing 'flood_risk'."
 
     # 3) Build ForecastResult rows
-    lusaka_now = timezone.localtime(timezone.now())
+    lusaka_now = timezone.localtime(now)
     forecast_date = lusaka_now.date()
 
     results_to_create = []
     alerts_to_send = []
 
-    for _, row in scored_df.iterrows():
-        point = row.get("location")
-        if point is None:
-            continue
+    # Polygon footprints (~3 km radius) for every row in one vectorized pass, as EWKB
+    polygons = footprint_wkb(scored_df["point_lon"], scored_df["point_lat"], meters=3_000.0)
 
+    for row, polygon in zip(scored_df.to_dict("records"), polygons):
         # Area name
-        try:
-            lon = float(point.x)
-            lat = float(point.y)
-        except Exception:
-            # Fallback if geometry is unexpected
-            continue
-
+        lon = float(row["point_lon"])
+        lat = float(row["point_lat"])
         area_name = f"Flood Zone near {lon:.3f}, {lat:.3f}"
 
-        # Polygon buffer (~3 km radius) without requiring GDAL/transform
-        deg_radius = _degree_buffer_for_meters(lat, meters=3_000.0)
-        try:
-            polygon = point.buffer(deg_radius)
-        except Exception:
-            # As a last resort, keep a tiny buffer
-            polygon = point.buffer(0.01)
-
         score = float(row["flood_risk"])
         risk_level, confidence = _risk_bucket(score)
 
@@ -213,30 +226,30 @@ def run_flood_prediction() -> str:
             f"history={row.get('flood_history')}, ts={row.get('timestamp')}"
         )
 
-        results_to_create.append(
-            ForecastResult(
-                model=model,
-                forecast_date=forecast_date,
-                predicted_at=lusaka_now,
-                affected_area=polygon,
-                area_name=area_name,
-                risk_level=risk_level,
-                confidence=confidence,
-                details=details,
-            )
-        )
+        results_to_create.append(dict(
+            model=model,
+            forecast_date=forecast_date,
+            predicted_at=lusaka_now,
+            affected_area=polygon,
+            area_name=area_name,
+            risk_level=risk_level,
+            confidence=confidence,
+            details=details,
+            run_id=run_id,
+        ))
 
         # Queue high-risk alerts for later send
         if risk_level == "high" and confidence >= 0.75:
             alerts_to_send.append((area_name, confidence))
 
-    # 4) Persist in bulk
+    # 4) Persist in bulk (COPY on PostgreSQL)
     if results_to_create:
-        ForecastResult.objects.bulk_create(results_to_create, batch_size=500)
+        copy_bulk_create(ForecastResult, results_to_create)
 
-    # 5) Fire alerts (keep separate from DB write)
+    # 5) Queue alerts as one batch for the notifications worker (keep separate from DB write)
+    batch = AlertBatch("flood", enabled=notify)
     for area_name, confidence in alerts_to_send:
-        send_alert(
+        batch.add(
             title=f"🌊 Flood Risk Detected - {area_name}",
             message=(
                 f"A flood risk has been detected with high confidence at {area_name}. "
@@ -244,11 +257,12 @@ def run_flood_prediction() -> str:
             ),
             severity="critical",
         )
+    batch.dispatch()
 
-    return f"{len(results_to_create)} flood forecasts saved; {len(alerts_to_send)} high-risk alerts sent."
+    return f"{len(results_to_create)} flood forecasts saved; {len(alerts_to_send)} high-risk alerts queued."
 
 @shared_task
-def run_drought_prediction() -> str:
+def run_drought_prediction(as_of=None, run_id=None, notify=True) -> str:
     # 1) Model metadata
     model, _ = ForecastModel.objects.get_or_create(
         name="Season-Aware Drought Predictor",
@@ -257,7 +271,8 @@ def run_drought_prediction() -> str:
     )
 
     # 2) Feature extraction & scoring
-    features_df = extract_drought_features()
+    now = _resolve_as_of(as_of)
+    features_df = extract_drought_features(as_of=now)
     if features_df.empty:
         return "No recent data for drought prediction."
 
@@ -266,36 +281,22 @@ def run_drought_prediction() -> str:
         return "Scoring failed: missing 'drought_risk'."
 
     # 3) Persist results (bulk), send alerts for high risk
-    lusaka_now = timezone.localtime(timezone.now())
+    lusaka_now = timezone.localtime(now)
     forecast_date = lusaka_now.date()
 
     to_create = []
     to_alert = []
 
-    # Use a slightly larger footprint for drought (~5 km)
+    # Use a slightly larger footprint for drought (~5 km), built in one vectorized pass as EWKB
     default_buffer_m = 5_000.0
+    polygons = footprint_wkb(scored_df["point_lon"], scored_df["point_lat"], meters=default_buffer_m)
 
-    for _, row in scored_df.iterrows():
-        point = row.get("location")
-        if point is None:
-            continue
-
+    for row, polygon in zip(scored_df.to_dict("records"), polygons):
         # Lat/Lon & area name
-        try:
-            lon = float(point.x)
-            lat = float(point.y)
-        except Exception:
-            continue
-
+        lon = float(row["point_lon"])
+        lat = float(row["point_lat"])
         area_name = f"Drought Zone near {lon:.3f}, {lat:.3f}"
 
-        # Build a polygon buffer without metric transform
-        deg_radius = _degree_buffer_for_meters(lat, meters=default_buffer_m)
-        try:
-            polygon = point.buffer(deg_radius)
-        except Exception:
-            polygon = point.buffer(0.02)  # conservative fallback
-
         score = float(row["drought_risk"])
         risk_level, confidence = _risk_bucket(score)
 
@@ -307,27 +308,27 @@ def run_drought_prediction() -> str:
             f"temp_anom={row.get('temp_anomaly')}"
         )
 
-        to_create.append(
-            ForecastResult(
-                model=model,
-                forecast_date=forecast_date,
-                predicted_at=lusaka_now,
-                affected_area=polygon,
-                area_name=area_name,
-                risk_level=risk_level,
-                confidence=confidence,
-                details=details,
-            )
-        )
+        to_create.append(dict(
+            model=model,
+            forecast_date=forecast_date,
+            predicted_at=lusaka_now,
+            affected_area=polygon,
+            area_name=area_name,
+            risk_level=risk_level,
+            confidence=confidence,
+            details=details,
+            run_id=run_id,
+        ))
 
         if risk_level == "high" and confidence >= 0.75:
             to_alert.append((area_name, confidence))
 
     if to_create:
-        ForecastResult.objects.bulk_create(to_create, batch_size=500)
+        copy_bulk_create(ForecastResult, to_create)
 
+    batch = AlertBatch("drought", enabled=notify)
     for area_name, confidence in to_alert:
-        send_alert(
+        batch.add(
             title=f"🌵 Drought Risk Alert - {area_name}",
             message=(
                 f"Severe drought conditions predicted in {area_name}. "
@@ -335,11 +336,12 @@ def run_drought_prediction() -> str:
             ),
             severity="critical",
         )
+    batch.dispatch()
 
-    return f"{len(to_create)} drought forecasts saved; {len(to_alert)} high-risk alerts sent."
+    return f"{len(to_create)} drought forecasts saved; {len(to_alert)} high-risk alerts queued."
 
 @shared_task
-def run_heat_wave_forecast() -> str:
+def run_heat_wave_forecast(as_of=None, run_id=None, notify=True) -> str:
     """
     Detect heat-wave risk per city over the last 3 days using temperature anomalies
     vs MONTHLY_TEMP_BASELINE (by local month per log). Season-aware thresholds.
@@ -350,52 +352,24 @@ def run_heat_wave_forecast() -> str:
         defaults={"description": "Detects abnormal heat spikes vs climate norms (season-aware)."},
     )
 
-    now = timezone.now()
+    now = _resolve_as_of(as_of)
     lusaka_now = timezone.localtime(now)
     recent = now - timezone.timedelta(days=3)
 
-    # Pull only what we need
-    qs = (
-        WeatherLog.objects
-        .filter(recorded_at__gte=recent)
-        .only("city_name", "location", "temperature", "recorded_at")
-    )
+    # Slice the shared snapshot instead of querying WeatherLog again
+    logs = get_weather_snapshot(now).since(recent)
 
-    # Aggregate in Python (window is small); compute anomaly per log using *local* month
-    per_city = {}  # city -> dict(temps, anoms, locs, months)
-    for log in qs:
-        if log.temperature is None or not getattr(log, "location", None):
-            continue
-        city = (log.city_name or "").strip() or "Unknown"
-        local_month = _lusaka_month(log.recorded_at)
-        anom = _temp_anomaly(log.temperature, local_month)
-
-        bucket = per_city.setdefault(city, {"temps": [], "anoms": [], "loc": None, "months": []})
-        bucket["temps"].append(float(log.temperature))
-        bucket["anoms"].append(float(anom))
-        bucket["months"].append(local_month)
-        # pick the first valid location as representative
-        if bucket["loc"] is None:
-            bucket["loc"] = log.location
-
-    if not per_city:
+    # Per-city averages, dominant local month and representative point in one vectorized pass
+    stats = _heat_city_stats(logs)
+    if stats.empty:
         return "No recent data for heat-wave prediction."
 
     to_create = []
     alerts = 0
 
-    for city, info in per_city.items():
-        if not info["temps"]:
-            continue
-
-        avg_temp = sum(info["temps"]) / len(info["temps"])
-        avg_anom = sum(info["anoms"]) / len(info["anoms"])
-
-        # Determine the dominant season across the 3-day window
-        if info["months"]:
-            dom_month = max(set(info["months"]), key=info["months"].count)
-        else:
-            dom_month = _lusaka_month(lusaka_now)
+    for row in stats.itertuples(index=False):
+        city, avg_temp, avg_anom = row.city, float(row.avg_temp), float(row.avg_anom)
+        dom_month = int(row.dom_month)
         season = get_season(dom_month)
 
         risk_level, confidence = _risk_from_anomaly(avg_anom, season)
@@ -404,69 +378,62 @@ def run_heat_wave_forecast() -> str:
         if risk_level == "low":
             continue
 
-        point = info["loc"]
-        try:
-            lon, lat = float(point.x), float(point.y)
-        except Exception:
-            continue
+        lon, lat = float(row.lon), float(row.lat)
 
         # Use a broader footprint for heat waves (~10 km)
-        deg_radius = _degree_buffer_for_meters(lat, meters=10_000.0)
-        try:
-            polygon = point.buffer(deg_radius)
-        except Exception:
-            polygon = point.buffer(0.05)
+        polygon = footprint_wkb([lon], [lat], meters=10_000.0)[0]
 
         # For messaging, also show current month baseline
         month_baseline = MONTHLY_TEMP_BASELINE.get(dom_month, 28)
 
         details = (
             f"season={season}, avg_temp={avg_temp:.1f}°C, avg_anom={avg_anom:.1f}°C, "
-            f"baseline_month={month_baseline}°C, samples={len(info['temps'])}"
+            f"baseline_month={month_baseline}°C, samples={row.samples}"
         )
 
-        to_create.append(
-            ForecastResult(
-                model=model,
-                forecast_date=lusaka_now.date(),
-                predicted_at=lusaka_now,
-                affected_area=polygon,
-                area_name=city,
-                risk_level=risk_level,
-                confidence=confidence,
-                details=details,
-            )
-        )
+        to_create.append(dict(
+            model=model,
+            forecast_date=lusaka_now.date(),
+            predicted_at=lusaka_now,
+            affected_area=polygon,
+            area_name=city,
+            risk_level=risk_level,
+            confidence=confidence,
+            details=details,
+            run_id=run_id,
+        ))
 
     # Persist results
     if to_create:
-        ForecastResult.objects.bulk_create(to_create, batch_size=200)
+        copy_bulk_create(ForecastResult, to_create)
 
     # Alerts (only for high risk, >= 0.75 confidence)
+    batch = AlertBatch("heat_wave", enabled=notify)
     for res in to_create:
-        if res.risk_level == "high" and res.confidence >= 0.75:
-            send_alert(
-                title=f"🔥 Heatwave Alert - {res.area_name}",
+        if res["risk_level"] == "high" and res["confidence"] >= 0.75:
+            batch.add(
+                title=f"🔥 Heatwave Alert - {res['area_name']}",
                 message=(
-                    f"Abnormally high temperatures detected in {res.area_name}. "
-                    f"Confidence: {res.confidence * 100:.1f}%"
+                    f"Abnormally high temperatures detected in {res['area_name']}. "
+                    f"Confidence: {res['confidence'] * 100:.1f}%"
                 ),
                 severity="critical",
             )
             alerts += 1
+    batch.dispatch()
 
-    return f"{len(per_city)} cities checked; {len(to_create)} heat-wave forecasts saved; {alerts} alerts sent."
+    return f"{len(stats)} cities checked; {len(to_create)} heat-wave forecasts saved; {alerts} alerts queued."
 
 
 @shared_task
-def run_seasonal_rain_check() -> str:
+def run_seasonal_rain_check(as_of=None, run_id=None, notify=True) -> str:
     """
     During the rainy season, flag cities with too few DISTINCT rainy days in the past 14 days.
-    - Uses Africa/Lusaka local dates (TruncDate with tz).
-    - "Rainy" prefers rainfall_mm > 0 if available; otherwise falls back to condition text.
+    - Counts come from `rainy_days_by_city` (local dates, one grouped query for all cities).
+    - "Rainy" = rainfall_mm > 0 or a rain-like condition label.
     - Threshold is season-aware: expected_rain_days_last7 * 2 (≈ 6 in rainy season), minus a small tolerance.
     """
-    now = timezone.now()
+    now = _resolve_as_of(as_of)
     lusaka_now = timezone.localtime(now)
     month = _lusaka_month(now)
     season = get_season(month)
@@ -482,83 +449,32 @@ def run_seasonal_rain_check() -> str:
         defaults={"description": "Checks for delayed or missing rains during rainy season"},
     )
 
-    # Window & timezone for date bucketing
-    past_14_days = now - timezone.timedelta(days=14)
-    tz = timezone.get_current_timezone()
-
-    # Base queryset for last 14 days, minimal columns
-    base_qs = (
-        WeatherLog.objects
-        .filter(recorded_at__gte=past_14_days)
-        .only("city_name", "location", "recorded_at", "condition", "rainfall_mm")
-        .exclude(city_name__isnull=True)
-        .exclude(city_name__exact="")
-    )
-
-    # If no data, exit early
-    if not base_qs.exists():
+    # DISTINCT rainy days + latest observation per city, one grouped query
+    counts = rainy_days_by_city(14, now=now)
+    if not counts:
         return "No logs in the last 14 days — nothing to check."
 
-    # Define "rainy" condition
-    rain_q = Q(condition__iregex=r"(rain|storm|showers|thunder)")
-    try:
-        rain_q = rain_q | Q(rainfall_mm__gt=0)
-    except Exception:
-        pass
-
-    # DISTINCT rainy days per city in the last 14 days
-    rainy_per_city = (
-        base_qs.filter(rain_q)
-        .annotate(date_local=TruncDate("recorded_at", tzinfo=tz))
-        .values("city_name")
-        .annotate(rain_days=Count("date_local", distinct=True))
-    )
-    rainy_map = {row["city_name"]: int(row["rain_days"]) for row in rainy_per_city}
-
-    # Latest log per city (to get a representative point/extent)
-    latest_per_city = (
-        base_qs
-        .order_by("city_name", "-recorded_at")
-        .distinct("city_name")
-        .values("city_name", "location", "recorded_at")
-    )
-
-    if not latest_per_city:
-        return "No recent city observations — nothing to check."
-
     # Season-aware threshold (≈ 6 in rainy season) with a small tolerance
-    expected_14 = SEASON_CONFIG["rainy"].expected_rain_days_last7 * 2  # 3*2 = 6
-    threshold = max(0, expected_14 - 1)  # tolerance of 1 day
+    threshold = rainy_season_threshold(14)
 
     to_create: list[ForecastResult] = []
     alerts_created = 0
 
-    for row in latest_per_city:
-        city = row["city_name"]
-        point = row["location"]
-        rain_days = rainy_map.get(city, 0)
+    for entry in counts.values():
+        city = entry.city_name
+        rain_days = entry.rain_days
 
-        if point is None:
+        if entry.lon is None or entry.lat is None:
             continue  # skip malformed geometry
 
         # Only create a result when below threshold
         if rain_days < threshold:
-            try:
-                lon = float(point.x)
-                lat = float(point.y)
-            except Exception:
-                continue
-
             # ~8 km footprint for city-wide advisory
-            deg_radius = _degree_buffer_for_meters(lat, meters=8_000.0)
-            try:
-                polygon = point.buffer(deg_radius)
-            except Exception:
-                polygon = point.buffer(0.04)
+            polygon = footprint_polygon(float(entry.lon), float(entry.lat), meters=8_000.0)
 
             details = (
                 f"season=rainy, window_days=14, rainy_days={rain_days}, "
-                f"threshold={threshold}, last_obs={row.get('recorded_at')}"
+                f"threshold={threshold}, last_obs={entry.last_obs}"
             )
 
             to_create.append(
@@ -571,6 +487,7 @@ def run_seasonal_rain_check() -> str:
                     risk_level="high",
                     confidence=0.9,
                     details=details,
+                    run_id=run_id,
                 )
             )
 
@@ -578,9 +495,10 @@ def run_seasonal_rain_check() -> str:
     if to_create:
         ForecastResult.objects.bulk_create(to_create, batch_size=200)
 
-        # Fire alerts (critical) for each created result
+        # Queue alerts (critical) for each created result
+        batch = AlertBatch("rain_anomaly", enabled=notify)
         for res in to_create:
-            send_alert(
+            batch.add(
                 title=f"🌧️ Drought Warning: {res.area_name}",
                 message=(
                     f"Low rainfall in {res.area_name} — only {res.details.split('rainy_days=')[1].split(',')[0]} "
@@ -589,13 +507,14 @@ def run_seasonal_rain_check() -> str:
                 severity="critical",
             )
             alerts_created += 1
+        batch.dispatch()
 
     return f"{len(to_create)} rain anomaly alerts created."
 
 
 
 @shared_task
-def run_monthly_rainfall_forecast() -> str:
+def run_monthly_rainfall_forecast(as_of=None, run_id=None, notify=True) -> str:
     """
     Forecast next month's rainfall *days* per city using historical monthly averages.
     - Uses Africa/Lusaka time to pick the next calendar month.
@@ -608,24 +527,25 @@ def run_monthly_rainfall_forecast() -> str:
         defaults={"description": "Forecasts rainfall days for next month using seasonal historical trends."},
     )
 
-    now = timezone.now()
+    now = _resolve_as_of(as_of)
     next_m = _next_month(now)
     season_next = get_season(next_m)
 
     results: List[ForecastResult] = []
     to_alert: list[tuple[str, str, float]] = []  # (city, risk, confidence)
 
+    # Historical average rainy *days* per city for that month (one climatology query)
+    history = {name.strip().lower(): avg for name, avg in average_rain_days(next_m, now=now).items()}
+
     for city, lon, lat in ZAMBIA_CITIES:
-        # Historical average rainy *days* for this city/month over past X years
-        avg_rain_days = get_monthly_rainfall_history(city, next_m)
+        avg_rain_days = history.get(city.lower())
         if avg_rain_days is None:
             continue
 
         risk_level, confidence, baseline = _risk_from_expected(avg_rain_days, season_next)
 
         # Build a ~10 km footprint around the city point
-        deg_radius = _degree_buffer_for_meters(lat, meters=10_000.0)
-        polygon = Point(lon, lat).buffer(deg_radius)
+        polygon = footprint_polygon(lon, lat, meters=10_000.0)
 
         details = (
             f"next_month={next_m}, season={season_next}, "
@@ -641,6 +561,7 @@ def run_monthly_rainfall_forecast() -> str:
                 risk_level=risk_level,
                 confidence=confidence,
                 details=details,
+                run_id=run_id,
                 affected_area=polygon,
             )
         )
@@ -653,11 +574,13 @@ def run_monthly_rainfall_forecast() -> str:
 
     with transaction.atomic():
         ForecastResult.objects.bulk_create(results, batch_size=200)
+    invalidate_layer("forecasts")  # beat runs this outside the pipeline (no finish_pipeline_run)
 
-    # Send alerts after write
+    # Queue alerts after write
     sent = 0
+    batch = AlertBatch("monthly_rainfall", enabled=notify)
     for city, risk, conf in to_alert:
-        send_alert(
+        batch.add(
             title=f"🌧️ Rainfall Forecast Warning: {city}",
             message=(
                 f"Next month ({next_m}) rainfall in {city} is projected below seasonal norms. "
@@ -666,19 +589,20 @@ def run_monthly_rainfall_forecast() -> str:
             severity="warning" if risk == "medium" else "critical",
         )
         sent += 1
+    batch.dispatch()
 
-    return f"Monthly rainfall forecast created for {len(results)} cities; {sent} alerts sent."
+    return f"Monthly rainfall forecast created for {len(results)} cities; {sent} alerts queued."
 
 
 @shared_task
-def run_dry_season_alerts() -> str:
+def run_dry_season_alerts(as_of=None, run_id=None, notify=True) -> str:
     """
     Despite the name, this monitors *rainy-season* anomalies (delayed/missing rain)
     city-by-city using `detect_drought_anomaly(city)`.
     - Runs only if Africa/Lusaka's current month is in the rainy season.
     - Creates ForecastResult rows in bulk and then sends alerts for MEDIUM/HIGH.
     """
-    now = timezone.now()
+    now = _resolve_as_of(as_of)
     lusaka_now = timezone.localtime(now)
     month = _lusaka_month(now)
     season = get_season(month)
@@ -699,8 +623,11 @@ def run_dry_season_alerts() -> str:
     # Use a city-wide footprint (~8 km) for advisories
     default_buffer_m = 8_000.0
 
+    # Rainy-day counts for every city in one query, shared by all checks below
+    counts = rainy_days_by_city(14, now=now)
+
     for city, lon, lat in ZAMBIA_CITIES:
-        outcome = detect_drought_anomaly(city)
+        outcome = detect_drought_anomaly(city, counts=counts, now=now)
         if not outcome:
             continue
 
@@ -710,8 +637,7 @@ def run_dry_season_alerts() -> str:
         details = str(outcome.get("message", ""))
 
         # Build polygon buffer around city point
-        deg_radius = _degree_buffer_for_meters(lat, meters=default_buffer_m)
-        polygon = Point(lon, lat).buffer(deg_radius)
+        polygon = footprint_polygon(lon, lat, meters=default_buffer_m)
 
         results_to_create.append(
             ForecastResult(
@@ -722,6 +648,7 @@ def run_dry_season_alerts() -> str:
                 risk_level=risk_level,
                 confidence=confidence,
                 details=details,
+                run_id=run_id,
                 affected_area=polygon,
             )
         )
@@ -735,129 +662,80 @@ def run_dry_season_alerts() -> str:
     # Persist and then alert
     with transaction.atomic():
         ForecastResult.objects.bulk_create(results_to_create, batch_size=200)
+    invalidate_layer("forecasts")
 
     sent = 0
+    batch = AlertBatch("rainy_season_anomaly", enabled=notify)
     for city, risk, conf in alerts_to_send:
-        send_alert(
+        batch.add(
             title=f"🌧️ Rainy Season Anomaly: {city}",
             message=f"{city}: {risk.upper()} risk — {int(conf*100)}% confidence. Possible delayed rains/early drought.",
             severity="warning" if risk == "medium" else "critical",
         )
         sent += 1
+    batch.dispatch()
 
-    return f"{len(results_to_create)} rainy-season anomaly results saved; {sent} alerts sent."
+    return f"{len(results_to_create)} rainy-season anomaly results saved; {sent} alerts queued."
 
 @shared_task
-def run_seasonal_outlook() -> str:
-    # 1) Load model
+def run_seasonal_outlook(as_of=None, run_id=None, notify=True) -> str:
+    # 1) Resolve model entry + cached estimator (loaded once per worker, reloaded on file change)
+    model_entry, _ = ForecastModel.objects.get_or_create(
+        name="Seasonal Outlook Predictor",
+        model_type="drought",
+        defaults={"description": "ML model for seasonal drought outlook"},
+    )
     try:
-        model_path = "disaster_management/forecasts/ml/seasonal_outlook_model.joblib"
-        model = joblib.load(model_path)
-        print(f"[✓] Model loaded: {model_path}")
+        model = get_model(model_entry)
     except Exception as e:
         msg = f"[!] Failed to load seasonal outlook model: {e}"
         print(msg)
         return msg
 
-    # 2) Define rainy window and fetch logs (minimal columns)
-    now = timezone.now()
+    # 2) Rainy-day counts per city/month for the current rainy window (pre-aggregated climatology)
+    now = _resolve_as_of(as_of)
     window_start, window_end = _current_rainy_window(now)
-    tz = timezone.get_current_timezone()
-
-    qs = (
-        WeatherLog.objects
-        .filter(recorded_at__gte=window_start, recorded_at__lte=window_end)
-        .only("city_name", "recorded_at", "condition", "rainfall_mm")
-        .exclude(city_name__isnull=True)
-        .exclude(city_name__exact="")
-    )
-    count_logs = qs.count()
-    print(f"[✓] Fetched {count_logs} weather logs in rainy window {window_start.date()} → {window_end.date()}")
-
-    if count_logs == 0:
-        return "No data available for seasonal prediction."
-
-    # 3) Define 'rainy' condition: prefer rainfall_mm>0 if present, else condition text
-    rain_q = Q(condition__iregex=r"(rain|storm|showers|thunder)")
-    try:
-        rain_q = rain_q | Q(rainfall_mm__gt=0)
-    except Exception:
-        pass
-
-    # 4) Count DISTINCT rainy days per city *per month* (local date bucketing)
-    rainy_days = (
-        qs.filter(rain_q)
-        .annotate(date_local=TruncDate("recorded_at", tzinfo=tz),
-                  month=ExtractMonth("recorded_at"))
-        .values("city_name", "month")
-        .annotate(rain_days=Count("date_local", distinct=True))
-    )
-
-    # Build city -> {month: rainy_day_count}
-    city_month_counts: Dict[str, Dict[int, int]] = {}
-    for row in rainy_days:
-        city = row["city_name"]
-        m = int(row["month"])
-        d = int(row["rain_days"])
-        city_month_counts.setdefault(city, {})[m] = d
+    city_month_counts: Dict[str, Dict[int, int]] = rain_days_by_city_month(window_start, window_end)
+    print(f"[✓] Loaded rainy-day climatology for {len(city_month_counts)} cities in rainy window "
+          f"{window_start.date()} → {window_end.date()}")
 
     if not city_month_counts:
         print("[!] No cities found with valid rainy-day data.")
         return "No data available for seasonal prediction."
 
-    # 5) Create/ensure model entry
-    model_entry, _ = ForecastModel.objects.get_or_create(
-        name="Seasonal Outlook Predictor",
-        model_type="drought",
-        defaults={"description": "ML model for seasonal drought outlook"},
+    # 3) One feature matrix for all cities → labels + confidences in a single call
+    features = pd.DataFrame.from_records(
+        [[month_map.get(m, 0) for m in FEATURE_MONTHS] for month_map in city_month_counts.values()],
+        columns=SEASONAL_FEATURES,
+        index=list(city_month_counts),
     )
+    try:
+        labels, proba = predict_batch(model, features)
+    except Exception as e:
+        msg = f"[!] Seasonal outlook prediction failed: {e}"
+        print(msg)
+        return msg
+    # Confidence = max class probability (clipped), 0.8 when the model has no predict_proba
+    confidences = np.where(np.isnan(proba), 0.8, np.clip(proba, 0.5, 1.0))
 
-    # 6) Prepare predictions
+    # 4) Prepare predictions
     coord_map = _city_coord_map()
     results: List[ForecastResult] = []
     alerts = 0
 
-    for city, month_map in city_month_counts.items():
-        # Keep your model's feature order [Dec, Jan, Feb, Mar]
-        features = [[month_map.get(12, 0),
-                     month_map.get(1, 0),
-                     month_map.get(2, 0),
-                     month_map.get(3, 0)]]
-
-        try:
-            label = model.predict(features)[0]
-        except Exception as e:
-            print(f"[!] Prediction failed for {city}: {e}")
-            continue
-
-        # Try to derive confidence if model supports predict_proba
-        confidence = 0.8
-        try:
-            proba = model.predict_proba(features)
-            if proba is not None and hasattr(model, "classes_"):
-                # Confidence = max probability for the predicted class
-                import numpy as np
-                idx = list(model.classes_).index(label)
-                confidence = float(np.clip(proba[0][idx], 0.5, 1.0))
-        except Exception:
-            pass
-
+    for (city, row), label, confidence in zip(features.iterrows(), labels, confidences):
         risk = _label_to_risk(str(label))
 
         # Geometry: ~10 km buffer around city point if we know it
         lon, lat = coord_map.get(city, (None, None))
         polygon = None
         if lon is not None and lat is not None:
-            try:
-                deg_radius = _degree_buffer_for_meters(lat, meters=10_000.0)
-                polygon = Point(lon, lat).buffer(deg_radius)
-            except Exception:
-                polygon = None
+            polygon = footprint_polygon(lon, lat, meters=10_000.0)
 
         details = (
             f"window={window_start.date()}→{window_end.date()}, "
-            f"features=[Dec:{month_map.get(12, 0)}, Jan:{month_map.get(1, 0)}, "
-            f"Feb:{month_map.get(2, 0)}, Mar:{month_map.get(3, 0)}], "
+            f"features=[Dec:{row['rain_dec']}, Jan:{row['rain_jan']}, "
+            f"Feb:{row['rain_feb']}, Mar:{row['rain_mar']}], "
             f"label={label}"
         )
 
@@ -868,8 +746,9 @@ def run_seasonal_outlook() -> str:
                 predicted_at=timezone.localtime(now),
                 area_name=city,
                 risk_level=risk,
-                confidence=confidence,
+                confidence=float(confidence),
                 details=details,
+                run_id=run_id,
                 affected_area=polygon,
             )
         )
@@ -877,32 +756,82 @@ def run_seasonal_outlook() -> str:
     if not results:
         return "No seasonal outlook results created."
 
-    # 7) Persist results and send notifications for 'failed' with high confidence
+    # 5) Persist results and send notifications for 'failed' with high confidence
     with transaction.atomic():
         ForecastResult.objects.bulk_create(results, batch_size=200)
+    invalidate_layer("forecasts")
 
+    batch = AlertBatch("seasonal_outlook", enabled=notify)
     for res in results:
         if res.risk_level == "high" and res.confidence >= 0.75:
-            # email
-            try:
-                send_seasonal_alert_email(res.area_name, "failed", res.confidence)
-            except Exception as e:
-                print(f"[!] Email alert failed for {res.area_name}: {e}")
-
-            # in-app/global notification
-            try:
-                Notification.objects.create(
-                    title=f"{res.area_name} Seasonal Outlook: FAILED",
-                    message=(
-                        f"{res.area_name} is projected to experience a FAILED rainfall season "
-                        f"with {res.confidence*100:.1f}% confidence."
-                    ),
-                    target_type="global",
-                    severity="critical",
-                )
-            except Exception as e:
-                print(f"[!] Notification create failed for {res.area_name}: {e}")
+            # in-app/global notification + admin email, delivered by the notifications worker
+            batch.add(
+                title=f"{res.area_name} Seasonal Outlook: FAILED",
+                message=(
+                    f"{res.area_name} is projected to experience a FAILED rainfall season "
+                    f"with {res.confidence*100:.1f}% confidence."
+                ),
+                severity="critical",
+            )
             alerts += 1
+    batch.dispatch()
 
     print(f"[✓] Seasonal outlook prediction completed for {len(results)} cities; {alerts} critical alerts.")
-    return f"Seasonal outlook task completed for {len(results)} cities; {alerts} critical alerts sent."
\ No newline at end of file
+    return f"Seasonal outlook task completed for {len(results)} cities; {alerts} critical alerts sent."
+
+
+@shared_task
+def run_gridded_risk(as_of=None, run_id=None, notify=True) -> str:
+    """
+    Gridded mode (RISK_GRID_ENABLED): flood/drought/heat scores interpolated onto the
+    fixed Zambia grid and stored as one tiled, compressed GeoTIFF per run, instead of
+    one circle per observation point. Map/analytics reads then cost the same however
+    many stations feed the model (see utils.risk_grid.read_window).
+    """
+    now = _resolve_as_of(as_of)
+    local = timezone.localtime(now)
+    snapshot = get_weather_snapshot(now)
+    grid = zambia_grid(getattr(settings, "RISK_GRID_RESOLUTION", DEFAULT_RESOLUTION))
+    bands = {}
+
+    # Flood: worst score per observation point over the last 24h
+    flood = extract_flood_features(snapshot=snapshot, as_of=now)
+    if not flood.empty:
+        pts = score_flood_df(flood).groupby(["point_lon", "point_lat"], as_index=False)["flood_risk"].max()
+        bands["flood"] = points_to_grid(grid, pts["point_lon"], pts["point_lat"], pts["flood_risk"])
+
+    # Drought: already one row per ~0.1° cell
+    drought = extract_drought_features(snapshot=snapshot, as_of=now)
+    if not drought.empty:
+        scored = score_drought_df(drought)
+        bands["drought"] = points_to_grid(grid, scored["point_lon"], scored["point_lat"], scored["drought_risk"])
+
+    # Heat: mean anomaly per point over the last 3 days, season-aware score
+    heat_logs = snapshot.since(now - timedelta(days=3))
+    if not heat_logs.empty:
+        pts = pd.DataFrame({
+            "lon": heat_logs.lon,
+            "lat": heat_logs.lat,
+            "anom": temp_anomaly_array(heat_logs.temperature, heat_logs.local_month),
+        }).groupby(["lon", "lat"], as_index=False)["anom"].mean()
+        season = get_season(int(np.bincount(heat_logs.local_month, minlength=13).argmax()))
+        bands["heat"] = points_to_grid(grid, pts["lon"], pts["lat"], score_heat_arrays(pts["anom"].to_numpy(), season))
+
+    if not bands:
+        return "No recent data for gridded risk."
+
+    rel_path = f"risk_rasters/{local:%Y/%m/%d}/risk_{local:%Y%m%dT%H%M}.tif"
+    stats = write_risk_raster(
+        os.path.join(settings.MEDIA_ROOT, rel_path), grid, bands,
+        tags={"as_of": now.isoformat(), "run_id": run_id or ""},
+    )
+    RiskRaster.objects.create(
+        run_id=run_id,
+        as_of=now,
+        path=rel_path,
+        resolution=grid.resolution,
+        west=grid.west, south=grid.south, east=grid.east, north=grid.north,
+        bands=list(stats),
+        stats=stats,
+    )
+    return f"Risk grid {grid.width}x{grid.height} @ {grid.resolution}° written ({', '.join(stats)}): {rel_path}"
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class IncidentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'disaster_management.apps.incidents'
+
+    def ready(self):
+        from . import signals  # noqa: F401
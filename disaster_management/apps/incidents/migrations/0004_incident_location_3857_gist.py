@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-17 20:00
+
+from django.db import migrations
+
+
+# Web Mercator bbox index for map tiles (utils.vector_tiles._in_tile)
+CREATE_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS incident_location_3857_gist
+    ON incidents_incident USING GIST ((ST_Transform(location::geometry, 3857)))
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('incidents', '0003_incident_assigned_responder'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_INDEX_SQL, "DROP INDEX IF EXISTS incident_location_3857_gist"),
+    ]
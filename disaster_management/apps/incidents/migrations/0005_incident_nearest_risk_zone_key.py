@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-17 21:00
+
+from django.db import migrations, models
+
+
+# Copy the key of every zone still linked, before expiry nulls the FK
+BACKFILL_SQL = """
+    UPDATE incidents_incident t
+    SET nearest_risk_zone_key = z.zone_key
+    FROM weather_riskzone z
+    WHERE z.id = t.nearest_risk_zone_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0010_riskzone_zone_key'),
+        ('incidents', '0004_incident_location_3857_gist'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='incident',
+            name='nearest_risk_zone_key',
+            field=models.CharField(blank=True, default='', max_length=40),
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
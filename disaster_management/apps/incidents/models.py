@@ -93,6 +93,9 @@ class Incident(models.Model):
         blank=True,
         related_name="incidents"
     )
+    # Risk zones expire (RISK_ZONE_TTL_HOURS) and the FK is nulled; the stable key
+    # still finds the zone in RiskZoneHistory or when it reappears
+    nearest_risk_zone_key = models.CharField(max_length=40, blank=True, default="")
 
     reported_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
@@ -103,6 +106,15 @@ class Incident(models.Model):
             models.Index(fields=["status"]),
         ]
 
+    def save(self, *args, **kwargs):
+        """Keep nearest_risk_zone_key synced with the zone link."""
+        if self.nearest_risk_zone_id:
+            self.nearest_risk_zone_key = self.nearest_risk_zone.zone_key
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "nearest_risk_zone" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "nearest_risk_zone_key"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.incident_type.name} - {self.status} by {self.user.email}"
 
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from disaster_management.utils.live_updates import incident_delta, publish_on_commit
+
+from .models import Incident
+
+
+# Every write path (mutations, AI scoring tasks, admin) feeds the incidentUpdates subscription
+@receiver(post_save, sender=Incident)
+def publish_incident_saved(sender, instance, **kwargs):
+    publish_on_commit("incidents", incident_delta(instance))
+
+
+@receiver(post_delete, sender=Incident)
+def publish_incident_deleted(sender, instance, **kwargs):
+    publish_on_commit("incidents", incident_delta(instance, op="delete"))
@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-17 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('notifications', '0002_userdevice'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='usernotification',
+            index=models.Index(fields=['user', '-received_at', '-id'], name='usernotif_user_time_id_idx'),
+        ),
+    ]
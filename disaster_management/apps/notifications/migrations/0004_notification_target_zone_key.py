@@ -0,0 +1,29 @@
+# Generated by Django 4.2 on 2026-10-17 21:00
+
+from django.db import migrations, models
+
+
+# Copy the key of every zone still linked, before expiry nulls the FK
+BACKFILL_SQL = """
+    UPDATE notifications_notification t
+    SET target_zone_key = z.zone_key
+    FROM weather_riskzone z
+    WHERE z.id = t.target_zone_id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0010_riskzone_zone_key'),
+        ('notifications', '0003_usernotification_user_time_id_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notification',
+            name='target_zone_key',
+            field=models.CharField(blank=True, default='', max_length=40),
+        ),
+        migrations.RunSQL(BACKFILL_SQL, migrations.RunSQL.noop),
+    ]
@@ -19,12 +19,23 @@ class Notification(models.Model):
     
     target_type = models.CharField(max_length=10, choices=TARGET_TYPE_CHOICES, default='global')
     target_zone = models.ForeignKey('weather.RiskZone', on_delete=models.SET_NULL, null=True, blank=True, related_name='notifications')
+    # Kept after the zone expires and target_zone is nulled (see Incident.nearest_risk_zone_key)
+    target_zone_key = models.CharField(max_length=40, blank=True, default='')
 
     triggered_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.SET_NULL, null=True, blank=True)
     severity = models.CharField(max_length=10, choices=SEVERITY_CHOICES, default='info')
 
     sent_at = models.DateTimeField(auto_now_add=True)
 
+    def save(self, *args, **kwargs):
+        """Keep target_zone_key synced with the zone link."""
+        if self.target_zone_id:
+            self.target_zone_key = self.target_zone.zone_key
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None and "target_zone" in update_fields:
+                kwargs["update_fields"] = {*update_fields, "target_zone_key"}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return f"{self.title} - {self.target_type} ({self.severity})"
 
@@ -34,6 +45,10 @@ class UserNotification(models.Model):
     is_read = models.BooleanField(default=False)
     received_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        # my_notifications: one user's inbox, newest-first by (received_at, id)
+        indexes = [models.Index(fields=["user", "-received_at", "-id"], name="usernotif_user_time_id_idx")]
+
     def __str__(self):
         return f"{self.user.email} → {self.notification.title}"
 
@@ -0,0 +1,14 @@
+from celery import shared_task
+
+from disaster_management.utils.notifications import fan_out_alerts
+
+
+@shared_task
+def dispatch_alert_batch(hazard: str, alerts: list[dict]) -> str:
+    """
+    Deliver the alerts one forecasting run collected for `hazard`.
+    Routed to the `notifications` queue (see CELERY_TASK_ROUTES) so SMTP and
+    per-admin writes never block forecasting workers.
+    """
+    admins = fan_out_alerts(hazard, alerts)
+    return f"{len(alerts)} {hazard} alert(s) delivered to {admins} admins."
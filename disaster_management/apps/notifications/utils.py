@@ -5,6 +5,8 @@ from disaster_management.apps.weather.models import RiskZone
 from django.conf import settings
 import requests
 
+from disaster_management.utils.live_updates import publish_user_notifications
+
 def send_push(player_ids, title, message, data=None):
     """
     Fire push via OneSignal.
@@ -49,9 +51,11 @@ def create_and_send_notification(title, message, severity="info", target_type="g
         users = []
 
     player_ids = []
+    user_notifications = []
     for u in users:
-        UserNotification.objects.create(user=u, notification=notification)
+        user_notifications.append(UserNotification.objects.create(user=u, notification=notification))
         player_ids += list(UserDevice.objects.filter(user=u).values_list("player_id", flat=True))
+    publish_user_notifications(user_notifications)
 
     if player_ids:
         send_push(player_ids, title, message)
@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-17 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('resources', '0008_alter_inventory_options_inventory_transaction_type_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='resourcedeployment',
+            index=models.Index(fields=['-deployed_at', '-id'], name='deployment_time_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='inventory',
+            index=models.Index(fields=['-created_at', '-id'], name='inventory_created_id_idx'),
+        ),
+    ]
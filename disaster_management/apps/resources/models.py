@@ -138,6 +138,10 @@ class ResourceDeployment(models.Model):
         help_text="Incident this resource was deployed for."
     )
 
+    class Meta:
+        # keyset pagination (graphql.pagination): newest-first by (deployed_at, id)
+        indexes = [models.Index(fields=["-deployed_at", "-id"], name="deployment_time_id_idx")]
+
     def __str__(self):
         return f"{self.resource.name} - {self.quantity} units deployed"
 
@@ -161,6 +165,7 @@ class Inventory(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [models.Index(fields=["-created_at", "-id"], name="inventory_created_id_idx")]
 
     def __str__(self):
         direction = "➕" if self.transaction_type == "in" else "➖"
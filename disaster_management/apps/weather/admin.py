@@ -2,7 +2,10 @@ from django.contrib import admin
 from django.contrib.gis.admin import OSMGeoAdmin
 from django.utils.html import format_html
 
-from .models import RiskZone, HistoricalIncident, WeatherLog, DataSource
+from .models import (
+    RiskZone, HistoricalIncident, WeatherLog, DataSource, MonthlyRainfallClimatology, WeatherStation,
+    DailyWeatherSummary, RiskZoneHistory,
+)
 
 
 # ==========================
@@ -12,7 +15,7 @@ from .models import RiskZone, HistoricalIncident, WeatherLog, DataSource
 class RiskZoneAdmin(OSMGeoAdmin):
     list_display = ("zone_name", "colored_risk", "calculated_at")
     list_filter = ("risk_level",)
-    search_fields = ("zone_name",)
+    search_fields = ("zone_name", "zone_key")
     ordering = ("-calculated_at",)
 
     # Default map view
@@ -33,6 +36,20 @@ class RiskZoneAdmin(OSMGeoAdmin):
     colored_risk.short_description = "Risk Level"
 
 
+# ==========================
+# 🔹 RISK ZONE HISTORY ADMIN
+# ==========================
+@admin.register(RiskZoneHistory)
+class RiskZoneHistoryAdmin(OSMGeoAdmin):
+    list_display = ("zone_name", "previous_level", "risk_level", "calculated_at")
+    list_filter = ("risk_level", "previous_level")
+    search_fields = ("zone_name", "zone_key")
+    ordering = ("-calculated_at",)
+    default_lon = 28.3
+    default_lat = -15.4
+    default_zoom = 6
+
+
 # ==========================
 # 🔹 HISTORICAL INCIDENT ADMIN
 # ==========================
@@ -97,3 +114,40 @@ class DataSourceAdmin(admin.ModelAdmin):
         color = "#16a34a" if obj.active else "#dc2626"
         return format_html(f'<strong style="color:{color}">{ "Active" if obj.active else "Inactive" }</strong>')
     is_active_colored.short_description = "Status"
+
+
+# ==========================
+# 🔹 WEATHER STATION ADMIN
+# ==========================
+@admin.register(WeatherStation)
+class WeatherStationAdmin(OSMGeoAdmin):
+    list_display = ("name", "province", "kind", "active", "created_at")
+    list_filter = ("kind", "province", "active")
+    search_fields = ("name", "province")
+
+    default_lon = 27.8493
+    default_lat = -13.1339
+    default_zoom = 6
+
+
+# ==========================
+# 🔹 RAINFALL CLIMATOLOGY ADMIN
+# ==========================
+@admin.register(MonthlyRainfallClimatology)
+class MonthlyRainfallClimatologyAdmin(admin.ModelAdmin):
+    list_display = ("city_name", "year", "month", "rain_days", "logged_days", "rainfall_mm", "updated_at")
+    list_filter = ("month", "year")
+    search_fields = ("city_name",)
+    readonly_fields = ("updated_at",)
+
+
+# ==========================
+# 🔹 DAILY WEATHER SUMMARY ADMIN
+# ==========================
+@admin.register(DailyWeatherSummary)
+class DailyWeatherSummaryAdmin(admin.ModelAdmin):
+    list_display = ("city_name", "date", "observations", "temp_min", "temp_max", "rainfall_mm", "rainy", "updated_at")
+    list_filter = ("rainy",)
+    search_fields = ("city_name",)
+    date_hierarchy = "date"
+    readonly_fields = ("updated_at",)
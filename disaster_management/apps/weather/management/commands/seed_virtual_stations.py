@@ -0,0 +1,46 @@
+import numpy as np
+from django.contrib.gis.geos import Point
+from django.core.management.base import BaseCommand, CommandError
+
+from disaster_management.apps.weather.models import WeatherStation
+from disaster_management.utils.risk_grid import ZAMBIA_BOUNDS
+
+
+class Command(BaseCommand):
+    help = (
+        "Add a regular grid of virtual WeatherStations over the Zambia bounding box "
+        "(existing names are kept). Ingestion picks them up on the next cycle, sharded across workers."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--spacing", type=float, default=0.25, help="Grid spacing in degrees (default 0.25)")
+        parser.add_argument("--deactivate", action="store_true",
+                            help="Deactivate every virtual station instead of seeding")
+
+    def handle(self, *args, **opts):
+        if opts["deactivate"]:
+            n = WeatherStation.objects.filter(kind="virtual").update(active=False)
+            self.stdout.write(self.style.SUCCESS(f"Deactivated {n} virtual stations."))
+            return
+
+        spacing = opts["spacing"]
+        if spacing <= 0:
+            raise CommandError("--spacing must be positive")
+
+        west, south, east, north = ZAMBIA_BOUNDS
+        lons = np.arange(west + spacing / 2, east, spacing)
+        lats = np.arange(south + spacing / 2, north, spacing)
+        stations = [
+            WeatherStation(
+                name=f"Grid {lat:.3f},{lon:.3f}",
+                kind="virtual",
+                location=Point(float(lon), float(lat), srid=4326),
+            )
+            for lat in lats for lon in lons
+        ]
+        before = WeatherStation.objects.filter(kind="virtual").count()
+        WeatherStation.objects.bulk_create(stations, batch_size=1000, ignore_conflicts=True)
+        added = WeatherStation.objects.filter(kind="virtual").count() - before
+        self.stdout.write(self.style.SUCCESS(
+            f"{added} virtual stations added ({len(stations)} grid points at {spacing}°)."
+        ))
@@ -0,0 +1,34 @@
+# Generated by Django 4.2 on 2026-10-17 09:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0004_alter_weatherlog_recorded_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyRainfallClimatology',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('city_name', models.CharField(max_length=100)),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('rain_days', models.PositiveSmallIntegerField(default=0, help_text='Distinct local dates with rain')),
+                ('logged_days', models.PositiveSmallIntegerField(default=0, help_text='Distinct local dates with any observation')),
+                ('rainfall_mm', models.FloatField(default=0.0, help_text='Summed rainfall_mm (0 where not recorded)')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['city_name', 'year', 'month'],
+                'indexes': [models.Index(fields=['month', 'year'], name='rain_clim_month_year_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='monthlyrainfallclimatology',
+            constraint=models.UniqueConstraint(fields=('city_name', 'year', 'month'), name='uniq_rain_climatology_city_month'),
+        ),
+    ]
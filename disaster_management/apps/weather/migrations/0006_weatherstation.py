@@ -0,0 +1,64 @@
+# Generated by Django 4.2 on 2026-10-17 13:00
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+
+# Catalogue formerly hard-coded as climate_constants.ZAMBIA_COORDINATES
+CITY_STATIONS = [
+    ("Lusaka", "Lusaka", -15.3875, 28.3228),
+    ("Ndola", "Copperbelt", -12.9587, 28.6366),
+    ("Kitwe", "Copperbelt", -12.8156, 28.2132),
+    ("Livingstone", "Southern", -17.8572, 25.8567),
+    ("Chipata", "Eastern", -13.6367, 32.6455),
+    ("Kasama", "Northern", -10.2129, 31.1800),
+    ("Mansa", "Luapula", -11.1998, 28.8943),
+    ("Solwezi", "North-Western", -12.1833, 26.4000),
+    ("Choma", "Southern", -16.8122, 26.9833),
+    ("Mongu", "Western", -15.2796, 23.1274),
+    ("Kabwe", "Central", -14.4469, 28.4464),
+    ("Mazabuka", "Southern", -15.8580, 27.7485),
+    ("Siavonga", "Southern", -16.5380, 28.7087),
+    ("Mpika", "Muchinga", -11.8366, 31.4521),
+]
+
+
+def seed_city_stations(apps, schema_editor):
+    from django.contrib.gis.geos import Point
+
+    WeatherStation = apps.get_model("weather", "WeatherStation")
+    for name, province, lat, lon in CITY_STATIONS:
+        WeatherStation.objects.get_or_create(
+            name=name,
+            defaults={"province": province, "kind": "city", "location": Point(lon, lat, srid=4326)},
+        )
+
+
+def unseed_city_stations(apps, schema_editor):
+    WeatherStation = apps.get_model("weather", "WeatherStation")
+    WeatherStation.objects.filter(name__in=[name for name, *_ in CITY_STATIONS]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0005_monthlyrainfallclimatology'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeatherStation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(help_text='Stored as WeatherLog.city_name', max_length=100, unique=True)),
+                ('province', models.CharField(blank=True, max_length=50)),
+                ('kind', models.CharField(choices=[('city', 'City'), ('virtual', 'Virtual grid point')], default='city', max_length=10)),
+                ('location', django.contrib.gis.db.models.fields.PointField(geography=True, srid=4326)),
+                ('active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RunPython(seed_city_stations, unseed_city_stations),
+    ]
@@ -0,0 +1,47 @@
+# Generated by Django 4.2 on 2026-10-17 14:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0006_weatherstation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='weatherlog',
+            name='rainfall_mm',
+            field=models.FloatField(blank=True, help_text='Precipitation over the last hour (mm)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherlog',
+            name='pressure',
+            field=models.FloatField(blank=True, help_text='Sea-level pressure (hPa)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherlog',
+            name='clouds',
+            field=models.FloatField(blank=True, help_text='Cloud cover (%)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherlog',
+            name='visibility',
+            field=models.FloatField(blank=True, help_text='Visibility (m)', null=True),
+        ),
+        migrations.AddField(
+            model_name='weatherlog',
+            name='source',
+            field=models.CharField(blank=True, default='', help_text='Provider, e.g. OpenWeatherMap', max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='weatherlog',
+            index=models.Index(fields=['city_name', 'recorded_at'], name='weatherlog_city_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='weatherlog',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['recorded_at'], name='weatherlog_recorded_brin'),
+        ),
+    ]
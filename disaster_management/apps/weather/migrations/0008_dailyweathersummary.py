@@ -0,0 +1,45 @@
+# Generated by Django 4.2 on 2026-10-17 15:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0007_weatherlog_observation_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyWeatherSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('city_name', models.CharField(max_length=100)),
+                ('date', models.DateField(help_text='Local calendar date (settings.TIME_ZONE)')),
+                ('observations', models.PositiveIntegerField(default=0)),
+                ('temp_min', models.FloatField()),
+                ('temp_mean', models.FloatField()),
+                ('temp_max', models.FloatField()),
+                ('humidity_min', models.FloatField()),
+                ('humidity_mean', models.FloatField()),
+                ('humidity_max', models.FloatField()),
+                ('wind_min', models.FloatField()),
+                ('wind_mean', models.FloatField()),
+                ('wind_max', models.FloatField()),
+                ('rain_hours', models.PositiveSmallIntegerField(default=0, help_text='Distinct local hours with rain')),
+                ('rainfall_mm', models.FloatField(default=0.0, help_text='Summed rainfall_mm (0 where not recorded)')),
+                ('rainy', models.BooleanField(default=False, help_text='Any rain that day')),
+                ('lon', models.FloatField(help_text='Mean observation longitude (cell centre)', null=True)),
+                ('lat', models.FloatField(help_text='Mean observation latitude (cell centre)', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['city_name', 'date'],
+                'indexes': [models.Index(fields=['date'], name='daily_weather_date_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='dailyweathersummary',
+            constraint=models.UniqueConstraint(fields=('city_name', 'date'), name='uniq_daily_weather_city_date'),
+        ),
+    ]
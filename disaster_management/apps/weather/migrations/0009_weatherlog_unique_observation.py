@@ -0,0 +1,34 @@
+# Generated by Django 4.2 on 2026-10-17 16:00
+
+from django.db import migrations, models
+
+
+# Keep the first row of every (city_name, recorded_at, source) group
+DEDUPE_SQL = """
+    DELETE FROM weather_weatherlog a
+    USING weather_weatherlog b
+    WHERE a.city_name = b.city_name
+      AND a.recorded_at = b.recorded_at
+      AND a.source = b.source
+      AND a.id > b.id
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0008_dailyweathersummary'),
+    ]
+
+    operations = [
+        migrations.RunSQL(DEDUPE_SQL, migrations.RunSQL.noop),
+        migrations.AddConstraint(
+            model_name='weatherlog',
+            constraint=models.UniqueConstraint(fields=('city_name', 'recorded_at', 'source'), name='uniq_weatherlog_station_time_source'),
+        ),
+        # The unique index leads with (city_name, recorded_at), so this one is redundant
+        migrations.RemoveIndex(
+            model_name='weatherlog',
+            name='weatherlog_city_time_idx',
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2 on 2026-10-17 17:00
+
+import re
+
+from django.db import migrations, models
+
+ZONE_NAME_RE = re.compile(r"^Zone near \((-?[\d.]+), (-?[\d.]+)\)$")
+
+
+def backfill_zone_keys(apps, schema_editor):
+    """Keep the newest row per zone_name (repointing FKs to it), then key it by its rounded coords."""
+    RiskZone = apps.get_model("weather", "RiskZone")
+    Incident = apps.get_model("incidents", "Incident")
+    Notification = apps.get_model("notifications", "Notification")
+
+    keep = {}
+    for zone in RiskZone.objects.order_by("-calculated_at", "-id").only("id", "zone_name"):
+        if zone.zone_name not in keep:
+            keep[zone.zone_name] = zone.id
+            continue
+        survivor = keep[zone.zone_name]
+        Incident.objects.filter(nearest_risk_zone_id=zone.id).update(nearest_risk_zone_id=survivor)
+        Notification.objects.filter(target_zone_id=zone.id).update(target_zone_id=survivor)
+        zone.delete()
+
+    for name, zone_id in keep.items():
+        match = ZONE_NAME_RE.match(name)
+        key = f"{match.group(1)},{match.group(2)}" if match else f"legacy:{zone_id}"
+        RiskZone.objects.filter(id=zone_id).update(zone_key=key)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0009_weatherlog_unique_observation'),
+        ('incidents', '0003_incident_assigned_responder'),
+        ('notifications', '0002_userdevice'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='riskzone',
+            name='zone_key',
+            field=models.CharField(max_length=40, null=True),
+        ),
+        migrations.RunPython(backfill_zone_keys, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='riskzone',
+            name='zone_key',
+            field=models.CharField(max_length=40, unique=True),
+        ),
+    ]
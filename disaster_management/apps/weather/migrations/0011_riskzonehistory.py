@@ -0,0 +1,47 @@
+# Generated by Django 4.2 on 2026-10-17 18:00
+
+import django.contrib.gis.db.models.fields
+from django.db import migrations, models
+import django.utils.timezone
+
+
+# Start the history with every zone's current state
+SEED_HISTORY_SQL = """
+    INSERT INTO weather_riskzonehistory (zone_key, zone_name, geometry, risk_level, previous_level, calculated_at)
+    SELECT zone_key, zone_name, geometry, risk_level, '', calculated_at
+    FROM weather_riskzone
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0010_riskzone_zone_key'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RiskZoneHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('zone_key', models.CharField(max_length=40)),
+                ('zone_name', models.CharField(max_length=150)),
+                ('geometry', django.contrib.gis.db.models.fields.PolygonField(geography=True, srid=4326)),
+                ('risk_level', models.CharField(choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], max_length=10)),
+                ('previous_level', models.CharField(blank=True, choices=[('low', 'Low'), ('medium', 'Medium'), ('high', 'High')], default='', max_length=10)),
+                ('calculated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'ordering': ['-calculated_at'],
+                'indexes': [
+                    models.Index(fields=['risk_level', 'calculated_at'], name='riskzonehist_level_time_idx'),
+                    models.Index(fields=['zone_key', 'calculated_at'], name='riskzonehist_zone_time_idx'),
+                ],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='riskzone',
+            index=models.Index(fields=['risk_level', 'calculated_at'], name='riskzone_level_time_idx'),
+        ),
+        migrations.RunSQL(SEED_HISTORY_SQL, migrations.RunSQL.noop),
+    ]
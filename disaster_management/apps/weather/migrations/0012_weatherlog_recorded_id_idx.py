@@ -0,0 +1,17 @@
+# Generated by Django 4.2 on 2026-10-17 19:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0011_riskzonehistory'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='weatherlog',
+            index=models.Index(fields=['-recorded_at', '-id'], name='weatherlog_recorded_id_idx'),
+        ),
+    ]
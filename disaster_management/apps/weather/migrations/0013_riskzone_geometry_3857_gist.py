@@ -0,0 +1,21 @@
+# Generated by Django 4.2 on 2026-10-17 20:00
+
+from django.db import migrations
+
+
+# Web Mercator bbox index for map tiles (utils.vector_tiles._in_tile)
+CREATE_INDEX_SQL = """
+    CREATE INDEX IF NOT EXISTS riskzone_geometry_3857_gist
+    ON weather_riskzone USING GIST ((ST_Transform(geometry::geometry, 3857)))
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('weather', '0012_weatherlog_recorded_id_idx'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_INDEX_SQL, "DROP INDEX IF EXISTS riskzone_geometry_3857_gist"),
+    ]
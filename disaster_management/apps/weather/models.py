@@ -1,8 +1,17 @@
+from datetime import timedelta
+
+from django.conf import settings
 from django.db import models
 from django.contrib.gis.db import models as gis_models
+from django.contrib.postgres.indexes import BrinIndex
 from django.utils import timezone
 
 class RiskZone(models.Model):
+    """
+    Current risk zones only: upserted hourly by calculate_risk_zones and deleted
+    once not refreshed for RISK_ZONE_TTL_HOURS. Level changes are kept in
+    RiskZoneHistory.
+    """
     RISK_LEVEL_CHOICES = [
         ('low', 'Low'),
         ('medium', 'Medium'),
@@ -10,14 +19,45 @@ class RiskZone(models.Model):
     ]
 
     zone_name = models.CharField(max_length=150)
+    # Stable cell id ("lon,lat" rounded to 0.01°); calculate_risk_zones upserts on it
+    zone_key = models.CharField(max_length=40, unique=True)
     geometry = gis_models.PolygonField(geography=True)
     risk_level = models.CharField(max_length=10, choices=RISK_LEVEL_CHOICES)
 
     calculated_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["risk_level", "calculated_at"], name="riskzone_level_time_idx")]
+
+    @classmethod
+    def active(cls, now=None):
+        """Zones refreshed within the TTL (the expiry task may not have run yet)."""
+        cutoff = (now or timezone.now()) - timedelta(hours=settings.RISK_ZONE_TTL_HOURS)
+        return cls.objects.filter(calculated_at__gte=cutoff)
+
     def __str__(self):
         return f"{self.zone_name} ({self.risk_level})"
 
+
+class RiskZoneHistory(models.Model):
+    """Append-only log of risk zone level changes (first appearance included)."""
+    zone_key = models.CharField(max_length=40)
+    zone_name = models.CharField(max_length=150)
+    geometry = gis_models.PolygonField(geography=True)
+    risk_level = models.CharField(max_length=10, choices=RiskZone.RISK_LEVEL_CHOICES)
+    previous_level = models.CharField(max_length=10, choices=RiskZone.RISK_LEVEL_CHOICES, blank=True, default="")
+    calculated_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["risk_level", "calculated_at"], name="riskzonehist_level_time_idx"),
+            models.Index(fields=["zone_key", "calculated_at"], name="riskzonehist_zone_time_idx"),
+        ]
+        ordering = ["-calculated_at"]
+
+    def __str__(self):
+        return f"{self.zone_name}: {self.previous_level or 'new'} → {self.risk_level}"
+
 class HistoricalIncident(models.Model):
     incident_type = models.CharField(max_length=100)
     description = models.TextField(blank=True)
@@ -33,11 +73,32 @@ class WeatherLog(models.Model):
     humidity = models.FloatField()
     wind_speed = models.FloatField()
     condition = models.CharField(max_length=100)  # e.g., "Rain", "Clear", "Storm"
+    rainfall_mm = models.FloatField(null=True, blank=True, help_text="Precipitation over the last hour (mm)")
+    pressure = models.FloatField(null=True, blank=True, help_text="Sea-level pressure (hPa)")
+    clouds = models.FloatField(null=True, blank=True, help_text="Cloud cover (%)")
+    visibility = models.FloatField(null=True, blank=True, help_text="Visibility (m)")
+    source = models.CharField(max_length=50, blank=True, default="", help_text="Provider, e.g. OpenWeatherMap")
 
-    location = gis_models.PointField(geography=True)
+    location = gis_models.PointField(geography=True)  # spatial_index → GiST
     city_name = models.CharField(max_length=100, blank=True, null=True)
     recorded_at = models.DateTimeField(default=timezone.now)
 
+    class Meta:
+        constraints = [
+            # One observation per station, provider timestamp and source: ingestion
+            # inserts with ON CONFLICT DO NOTHING, so repeated pulls are no-ops.
+            # Its index also serves per-city windows (rainy-day counts, rollups).
+            models.UniqueConstraint(
+                fields=["city_name", "recorded_at", "source"], name="uniq_weatherlog_station_time_source",
+            ),
+        ]
+        indexes = [
+            # append-only time series: a tiny BRIN serves every recorded_at range scan
+            BrinIndex(fields=["recorded_at"], name="weatherlog_recorded_brin"),
+            # keyset pagination (graphql.pagination): newest-first by (recorded_at, id)
+            models.Index(fields=["-recorded_at", "-id"], name="weatherlog_recorded_id_idx"),
+        ]
+
     def __str__(self):
         return f"{self.city_name} - {self.condition} at {self.recorded_at.strftime('%Y-%m-%d %H:%M')}"
 
@@ -49,4 +110,92 @@ class DataSource(models.Model):
     last_sync = models.DateTimeField(null=True, blank=True)
 
     def __str__(self):
-        return f"{self.name} ({'Active' if self.active else 'Inactive'})"
\ No newline at end of file
+        return f"{self.name} ({'Active' if self.active else 'Inactive'})"
+
+class WeatherStation(models.Model):
+    """
+    Ingestion catalogue: every active station is polled each cycle, sharded
+    across Celery workers (see weather.tasks.ingest_weather_shard).
+    Virtual stations are grid points with no physical gauge.
+    """
+    KIND_CHOICES = [
+        ('city', 'City'),
+        ('virtual', 'Virtual grid point'),
+    ]
+
+    name = models.CharField(max_length=100, unique=True, help_text="Stored as WeatherLog.city_name")
+    province = models.CharField(max_length=50, blank=True)
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES, default='city')
+    location = gis_models.PointField(geography=True)
+    active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return f"{self.name} ({self.kind})"
+
+class MonthlyRainfallClimatology(models.Model):
+    """
+    Pre-aggregated city × year × month rainfall (local calendar), maintained by
+    ingestion via utils.rainfall_climatology. Read by the monthly/seasonal
+    forecasts and the training-set builders instead of scanning WeatherLog.
+    """
+    city_name = models.CharField(max_length=100)
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    rain_days = models.PositiveSmallIntegerField(default=0, help_text="Distinct local dates with rain")
+    logged_days = models.PositiveSmallIntegerField(default=0, help_text="Distinct local dates with any observation")
+    rainfall_mm = models.FloatField(default=0.0, help_text="Summed rainfall_mm (0 where not recorded)")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["city_name", "year", "month"], name="uniq_rain_climatology_city_month"),
+        ]
+        indexes = [models.Index(fields=["month", "year"], name="rain_clim_month_year_idx")]
+        ordering = ["city_name", "year", "month"]
+
+    def __str__(self):
+        return f"{self.city_name} {self.year}-{self.month:02d}: {self.rain_days}/{self.logged_days} rainy days"
+
+
+class DailyWeatherSummary(models.Model):
+    """
+    Daily rollup of WeatherLog per city / station cell (local calendar date),
+    maintained incrementally by ingestion via utils.weather_rollups. Monthly
+    climatology is recounted from these rows; long-horizon readers pick the
+    coarsest level with `weather_rollups.rollup_frame`.
+    """
+    city_name = models.CharField(max_length=100)
+    date = models.DateField(help_text="Local calendar date (settings.TIME_ZONE)")
+    observations = models.PositiveIntegerField(default=0)
+
+    temp_min = models.FloatField()
+    temp_mean = models.FloatField()
+    temp_max = models.FloatField()
+    humidity_min = models.FloatField()
+    humidity_mean = models.FloatField()
+    humidity_max = models.FloatField()
+    wind_min = models.FloatField()
+    wind_mean = models.FloatField()
+    wind_max = models.FloatField()
+
+    rain_hours = models.PositiveSmallIntegerField(default=0, help_text="Distinct local hours with rain")
+    rainfall_mm = models.FloatField(default=0.0, help_text="Summed rainfall_mm (0 where not recorded)")
+    rainy = models.BooleanField(default=False, help_text="Any rain that day")
+
+    lon = models.FloatField(null=True, help_text="Mean observation longitude (cell centre)")
+    lat = models.FloatField(null=True, help_text="Mean observation latitude (cell centre)")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["city_name", "date"], name="uniq_daily_weather_city_date"),
+        ]
+        indexes = [models.Index(fields=["date"], name="daily_weather_date_idx")]
+        ordering = ["city_name", "date"]
+
+    def __str__(self):
+        return f"{self.city_name} {self.date}: {self.temp_min:.1f}–{self.temp_max:.1f}°C, {self.rain_hours}h rain"
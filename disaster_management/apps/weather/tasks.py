@@ -1,22 +1,31 @@
-from celery import shared_task
+from celery import chord, shared_task
+import math
+import numpy as np
 import time
 import logging
-import requests
+from django.conf import settings
+from django.db import connection, transaction
 from django.utils import timezone
 from django.contrib.gis.geos import Point, GEOSGeometry
-
-from disaster_management.utils.climate_constants import ZAMBIA_COORDINATES, _lusaka_month, get_season
-from disaster_management.utils.notifications import send_alert
-from .models import RiskZone, WeatherLog, DataSource
+from django.db.models.functions import Mod
+
+from disaster_management.utils.climate_constants import _lusaka_month, get_season
+from disaster_management.utils.bulk_copy import copy_bulk_upsert
+from disaster_management.utils.geometry import footprint_rings, rings_wkb
+from disaster_management.utils.live_updates import publish_on_commit
+from disaster_management.utils.notifications import AlertBatch, send_alert
+from disaster_management.utils.weather_rollups import rebuild_rollups, refresh_rollups
+from disaster_management.utils.weather_snapshot import get_weather_snapshot, invalidate_weather_snapshot
+from disaster_management.utils.vector_tiles import invalidate_layer
+from disaster_management.utils.weather_analytics import refresh_weather_analytics
+from disaster_management.utils.weather_ingest import IngestConfig, Station, fetch_stations
+from .models import RiskZone, RiskZoneHistory, WeatherLog, DataSource, WeatherStation
 from datetime import timedelta
 from datetime import datetime, timedelta, timezone as dt_timezone
-from math import cos, radians
 log = logging.getLogger(__name__)
 
-REQUEST_TIMEOUT = 15  # seconds
-MAX_RETRIES = 3
-BACKOFF_SECS = [1, 3, 6]  # simple linear-ish backoff
-
+# WeatherLog uniqueness key (uniq_weatherlog_station_time_source)
+WEATHERLOG_KEY = ("city_name", "recorded_at", "source")
 
 def _normalize_condition(main: str | None, description: str | None, rainfall_mm: float) -> str:
     """
@@ -47,19 +56,140 @@ def _normalize_condition(main: str | None, description: str | None, rainfall_mm:
     return m or "unknown"
 
 
-def _fetch_weather(session: requests.Session, lat: float, lon: float, api_key: str) -> dict:
-    url = "https://api.openweathermap.org/data/2.5/weather"
-    params = {"lat": lat, "lon": lon, "appid": api_key, "units": "metric"}
-    resp = session.get(url, params=params, timeout=REQUEST_TIMEOUT)
-    resp.raise_for_status()
-    return resp.json()
+def _parse_observation(city: str, lat: float, lon: float, data: dict) -> dict | None:
+    """OpenWeather current-weather payload → WeatherLog kwargs (None if incomplete)."""
+    main = data.get("main", {})
+    wind = data.get("wind", {})
+    wx = (data.get("weather") or [{}])[0]
+    clouds = (data.get("clouds") or {}).get("all")
+    visibility = data.get("visibility")
+
+    temp = main.get("temp")
+    humidity = main.get("humidity")
+    wind_speed = wind.get("speed")
+    condition_main = wx.get("main")
+    description = wx.get("description")
+    rain_1h = (data.get("rain") or {}).get("1h")
+    rain_3h = (data.get("rain") or {}).get("3h")
+    rainfall_mm = float(rain_1h if rain_1h is not None else (rain_3h / 3.0 if rain_3h else 0.0))
+
+    # robust check for completeness
+    if temp is None or humidity is None or wind_speed is None:
+        log.info("[weather] Skipping %s — incomplete weather data.", city)
+        return None
+
+    # Normalize to our canonical condition labels
+    condition = _normalize_condition(condition_main, description, rainfall_mm)
+
+    # Use provider timestamp if available; fall back to now()
+    dt_unix = data.get("dt")
+    if isinstance(dt_unix, (int, float)):
+        recorded_at = datetime.fromtimestamp(int(dt_unix), tz=dt_timezone.utc)
+    else:
+        recorded_at = timezone.now()
+
+    return dict(
+        temperature=float(temp),
+        humidity=float(humidity),
+        wind_speed=float(wind_speed),
+        condition=condition,
+        rainfall_mm=rainfall_mm,
+        pressure=float(main["pressure"]) if main.get("pressure") is not None else None,
+        clouds=float(clouds) if clouds is not None else None,
+        visibility=float(visibility) if visibility is not None else None,
+        source="OpenWeatherMap",
+        location=Point(lon, lat, srid=4326),
+        city_name=city,
+        recorded_at=recorded_at,
+    )
+
+
+def _weather_source() -> DataSource | None:
+    return DataSource.objects.filter(name="OpenWeatherMap", active=True).first()
+
+
+def shard_count(active_stations: int | None = None) -> int:
+    """Shards for one ingestion cycle: ~WEATHER_SHARD_SIZE stations each, at least one."""
+    if active_stations is None:
+        active_stations = WeatherStation.objects.filter(active=True).count()
+    return max(1, math.ceil(active_stations / settings.WEATHER_SHARD_SIZE))
+
+
+def _shard_stations(shard: int, shards: int) -> list[Station]:
+    """Active stations with id % shards == shard (stable hash partition)."""
+    qs = WeatherStation.objects.filter(active=True)
+    if shards > 1:
+        qs = qs.annotate(bucket=Mod("id", shards)).filter(bucket=shard)
+    return [Station(name, loc.y, loc.x) for name, loc in qs.values_list("name", "location")]
 
 
 @shared_task
-def pull_weather_data() -> str:
+def ingest_weather_shard(shard: int, shards: int) -> dict:
+    """
+    Fetch and store one shard of the station catalogue. Never raises: a failed
+    shard reports its error in the summary so the chord still merges the others.
+    """
+    t0 = time.perf_counter()
+    summary = {"shard": shard, "stations": 0, "saved": 0, "skipped": 0, "failed": 0, "cities": [],
+               "first": None, "last": None, "error": None}
     try:
-        source = DataSource.objects.get(name="OpenWeatherMap", active=True)
-    except DataSource.DoesNotExist:
+        source = _weather_source()
+        if source is None:
+            summary["error"] = "No active weather source"
+            return summary
+
+        stations = _shard_stations(shard, shards)
+        summary["stations"] = len(stations)
+
+        # Network phase: the whole shard concurrently (bounded, rate-limited, retried);
+        # shards run in parallel, so each gets 1/shards of the provider rate
+        config = IngestConfig.from_settings().per_shard(shards)
+        results = fetch_stations(stations, source.api_key, url=settings.WEATHER_API_URL, config=config)
+        summary["failed"] = sum(1 for r in results if r.payload is None)
+
+        created_rows: list[dict] = []
+        for result in results:
+            if not result.payload:
+                continue
+            station = result.station
+            try:
+                kwargs = _parse_observation(station.name, station.lat, station.lon, result.payload)
+            except Exception as e:
+                log.exception("[weather] Error processing %s: %s", station.name, e)
+                continue
+            if kwargs:
+                created_rows.append(kwargs)
+
+        if created_rows:
+            # OpenWeather repeats `dt` between pulls: already-stored observations are skipped
+            result = copy_bulk_upsert(WeatherLog, created_rows, WEATHERLOG_KEY)
+            summary.update(saved=result.inserted, skipped=result.skipped)
+            if result.inserted:
+                stamps = [row["recorded_at"] for row in created_rows]
+                summary.update(
+                    cities=sorted({row["city_name"] for row in created_rows}),
+                    first=min(stamps).isoformat(),
+                    last=max(stamps).isoformat(),
+                )
+    except Exception as e:
+        log.exception("[weather] Shard %d/%d failed", shard, shards)
+        summary["error"] = f"{type(e).__name__}: {e}"
+    finally:
+        summary["duration_s"] = round(time.perf_counter() - t0, 2)
+        log.info("[weather] Shard %d/%d: %d/%d saved, %d duplicates skipped in %.1fs.",
+                 shard, shards, summary["saved"], summary["stations"], summary["skipped"], summary["duration_s"])
+    return summary
+
+
+@shared_task
+def finish_weather_ingest(summaries: list[dict]) -> str:
+    """
+    Chord callback: merge shard summaries, then do the once-per-cycle work –
+    snapshot invalidation, daily + monthly rollup and analytics refresh, sync alert and
+    DataSource.last_sync.
+    """
+    source = _weather_source()
+    if source is None:
         send_alert(
             title="❌ Weather Sync Failed",
             message="No active OpenWeatherMap data source found. Weather logs could not be updated.",
@@ -67,100 +197,24 @@ def pull_weather_data() -> str:
         )
         return "No active weather source found."
 
-    session = requests.Session()
-    success = 0
-    created_objects: list[WeatherLog] = []
-
-    # Detect optional model fields once (avoids kwargs errors if field absent)
-    weatherlog_fields = {f.name for f in WeatherLog._meta.get_fields()}
-    supports_rainfall = "rainfall_mm" in weatherlog_fields
-    supports_pressure = "pressure" in weatherlog_fields
-    supports_clouds = "clouds" in weatherlog_fields
-    supports_visibility = "visibility" in weatherlog_fields
-    supports_source = "source" in weatherlog_fields  # if you store provenance
-
-    for loc in ZAMBIA_COORDINATES:
-        city = loc["city"]
-        lat = float(loc["lat"])
-        lon = float(loc["lon"])
-
-        data = None
-        for attempt in range(MAX_RETRIES):
-            try:
-                data = _fetch_weather(session, lat, lon, source.api_key)
-                break
-            except requests.RequestException as e:
-                if attempt < MAX_RETRIES - 1:
-                    time.sleep(BACKOFF_SECS[attempt])
-                    continue
-                log.warning("[weather] %s: request failed after retries: %s", city, e)
-
-        if not data:
-            continue
-
-        try:
-            main = data.get("main", {})
-            wind = data.get("wind", {})
-            wx = (data.get("weather") or [{}])[0]
-            clouds = (data.get("clouds") or {}).get("all")
-            visibility = data.get("visibility")
-
-            temp = main.get("temp")
-            humidity = main.get("humidity")
-            wind_speed = wind.get("speed")
-            condition_main = wx.get("main")
-            description = wx.get("description")
-            rain_1h = (data.get("rain") or {}).get("1h")
-            rain_3h = (data.get("rain") or {}).get("3h")
-            rainfall_mm = float(rain_1h if rain_1h is not None else (rain_3h / 3.0 if rain_3h else 0.0))
-
-            # robust check for completeness
-            if temp is None or humidity is None or wind_speed is None:
-                log.info("[weather] Skipping %s — incomplete weather data.", city)
-                continue
-
-            # Normalize to our canonical condition labels
-            condition = _normalize_condition(condition_main, description, rainfall_mm)
-
-            # Use provider timestamp if available; fall back to now()
-            dt_unix = data.get("dt")
-            if isinstance(dt_unix, (int, float)):
-                recorded_at = datetime.fromtimestamp(int(dt_unix), tz=dt_timezone.utc)
-            else:
-                recorded_at = timezone.now()
-
-            kwargs = dict(
-                temperature=float(temp),
-                humidity=float(humidity),
-                wind_speed=float(wind_speed),
-                condition=condition,
-                location=Point(lon, lat, srid=4326),
-                city_name=city,
-                recorded_at=recorded_at,
-            )
-            if supports_rainfall:
-                kwargs["rainfall_mm"] = rainfall_mm
-            if supports_pressure and main.get("pressure") is not None:
-                kwargs["pressure"] = float(main["pressure"])
-            if supports_clouds and clouds is not None:
-                kwargs["clouds"] = float(clouds)
-            if supports_visibility and visibility is not None:
-                kwargs["visibility"] = float(visibility)
-            if supports_source:
-                kwargs["source"] = "OpenWeatherMap"
-
-            created_objects.append(WeatherLog(**kwargs))
-            success += 1
-            log.debug("[weather] Prepared log for %s", city)
-
-        except Exception as e:
-            log.exception("[weather] Error processing %s: %s", city, e)
-            continue
-
-    # Bulk write
-    if created_objects:
-        WeatherLog.objects.bulk_create(created_objects, batch_size=200)
-        log.info("[weather] Saved %d weather logs.", len(created_objects))
+    saved = sum(s["saved"] for s in summaries)
+    skipped = sum(s.get("skipped", 0) for s in summaries)
+    failed = sum(s["failed"] for s in summaries)
+    broken = [s for s in summaries if s.get("error")]
+    for s in broken:
+        log.warning("[weather] Shard %s failed: %s", s["shard"], s["error"])
+
+    if saved:
+        # Forecasting tasks in this cycle must see the new rows
+        invalidate_weather_snapshot()
+        cities = {c for s in summaries for c in s["cities"]}
+        first = min(datetime.fromisoformat(s["first"]) for s in summaries if s["first"])
+        last = max(datetime.fromisoformat(s["last"]) for s in summaries if s["last"])
+        refresh_rollups(first, last, cities)
+        refresh_weather_analytics()
+    elif skipped:
+        # Provider hasn't published new observations since the last pull: nothing to do
+        log.info("[weather] No new observations (%d duplicates skipped).", skipped)
     else:
         send_alert(
             title="⚠️ Weather Sync Failed",
@@ -168,119 +222,216 @@ def pull_weather_data() -> str:
             severity="warning",
         )
 
-    # Update data source sync time
+    # Update data source sync time (once per cycle, not per shard)
     source.last_sync = timezone.now()
     source.save(update_fields=["last_sync"])
 
-    return f"Weather logs updated for {success} cities."
+    slowest = max((s.get("duration_s", 0.0) for s in summaries), default=0.0)
+    return (
+        f"Weather logs updated for {saved} stations across {len(summaries)} shard(s) "
+        f"({skipped} duplicates skipped, {failed} fetch failures, {len(broken)} failed shard(s), slowest shard {slowest:.1f}s)."
+    )
 
 
+def weather_ingest_chord():
+    """Celery canvas for one ingestion cycle: shard tasks in parallel → finish_weather_ingest."""
+    shards = shard_count()
+    return chord(
+        [ingest_weather_shard.si(i, shards) for i in range(shards)],
+        finish_weather_ingest.s(),
+    )
 
-def _degree_buffer_for_meters(lat_deg: float, meters: float) -> float:
-    """Approximate a degree radius that corresponds to ~meters at latitude lat_deg."""
-    m_per_deg_lat = 111_320.0
-    m_per_deg_lon = m_per_deg_lat * max(0.1, cos(radians(lat_deg)))
-    deg_lat = meters / m_per_deg_lat
-    deg_lon = meters / m_per_deg_lon
-    return float(min(deg_lat, deg_lon))
 
+@shared_task
+def pull_weather_data() -> str:
+    """Launch one sharded ingestion cycle (manual trigger; the hourly pipeline embeds the same chord)."""
+    shards = shard_count()
+    weather_ingest_chord().apply_async()
+    return f"Weather ingestion started over {shards} shard(s)."
 
-def _determine_risk(log, season: str) -> str:
+def _determine_risk_levels(logs, season: str) -> np.ndarray:
     """
-    Season-aware but conservative risk heuristic.
-    Keeps your original thresholds and adds a storm/wind trigger.
+    Season-aware but conservative risk heuristic over snapshot columns.
+    Keeps the original thresholds and adds a storm/wind trigger (NaN → 0).
     """
-    temp = (log.temperature or 0)
-    hum = (log.humidity or 0)
-    wind = (log.wind_speed or 0)
-    cond = ((log.condition or "").strip().lower())
+    temp = np.nan_to_num(logs.temperature.astype(float))
+    hum = np.nan_to_num(logs.humidity.astype(float))
+    wind = np.nan_to_num(logs.wind_speed.astype(float))
+    cond = np.char.lower(np.char.strip(np.array([c or "" for c in logs.condition.tolist()], dtype=str)))
 
     # Extra high-risk trigger for severe convection in the rainy season
-    stormy = cond in {"storm", "thunderstorm"} or "thunder" in cond
-
-    if (temp > 35 and hum > 70 and wind > 10) or (stormy and wind >= 8):
-        return "high"
-    if (temp > 30 and hum > 50 and wind > 5) or (cond in {"rain", "showers"} and wind >= 6):
-        return "medium"
-    return "low"
+    stormy = np.isin(cond, ["storm", "thunderstorm"]) | (np.char.find(cond, "thunder") >= 0)
+    rainy = np.isin(cond, ["rain", "showers"])
+
+    high = ((temp > 35) & (hum > 70) & (wind > 10)) | (stormy & (wind >= 8))
+    medium = ((temp > 30) & (hum > 50) & (wind > 5)) | (rainy & (wind >= 6))
+    return np.select([high, medium], ["high", "medium"], default="low")
+
+
+# One round trip: upsert every zone, append level changes to the history table and
+# report the level each zone had before. All CTEs see the same snapshot, so
+# `prev` reads the pre-upsert rows.
+_RISK_ZONE_UPSERT_SQL = """
+    WITH incoming AS (
+        SELECT * FROM unnest(%(keys)s::text[], %(names)s::text[], %(geoms)s::text[], %(levels)s::text[])
+            AS t(zone_key, zone_name, geom, risk_level)
+    ),
+    prev AS (
+        SELECT z.zone_key, z.risk_level
+        FROM {zones} z JOIN incoming USING (zone_key)
+    ),
+    upserted AS (
+        INSERT INTO {zones} (zone_key, zone_name, geometry, risk_level, calculated_at)
+        SELECT zone_key, zone_name, ST_GeomFromEWKB(decode(geom, 'hex'))::geography, risk_level, %(now)s
+        FROM incoming
+        ON CONFLICT (zone_key) DO UPDATE
+           SET zone_name = EXCLUDED.zone_name,
+               geometry = EXCLUDED.geometry,
+               risk_level = EXCLUDED.risk_level,
+               calculated_at = EXCLUDED.calculated_at
+        RETURNING zone_key
+    ),
+    history AS (
+        INSERT INTO {history} (zone_key, zone_name, geometry, risk_level, previous_level, calculated_at)
+        SELECT i.zone_key, i.zone_name, ST_GeomFromEWKB(decode(i.geom, 'hex'))::geography,
+               i.risk_level, COALESCE(prev.risk_level, ''), %(now)s
+        FROM incoming i LEFT JOIN prev USING (zone_key)
+        WHERE prev.risk_level IS DISTINCT FROM i.risk_level
+    )
+    SELECT upserted.zone_key, prev.risk_level
+    FROM upserted LEFT JOIN prev USING (zone_key)
+"""
 
 
 @shared_task
 def calculate_risk_zones() -> str:
     """
     Compute/refresh short-lived risk zones from the last 2 hours of WeatherLog points.
-    Creates/updates one RiskZone per ~point cell (named by rounded lon/lat).
-    Sends alerts for HIGH risk zones.
+    One RiskZone per ~0.01° cell (keyed by rounded lon/lat, latest observation wins),
+    written with a single INSERT ... ON CONFLICT (zone_key) DO UPDATE.
+    Alerts only for zones that have just become HIGH risk.
     """
     now = timezone.now()
     window_start = now - timedelta(hours=2)
 
-    logs = (
-        WeatherLog.objects
-        .filter(recorded_at__gte=window_start)
-        .only("location", "temperature", "humidity", "wind_speed", "condition", "city_name", "recorded_at")
-    )
+    # Slice the shared snapshot instead of querying WeatherLog again
+    logs = get_weather_snapshot(now).since(window_start)
 
-    if not logs.exists():
+    if logs.empty:
+        # Still age out stale zones when ingestion has stalled
+        if expire_risk_zones(now):
+            invalidate_layer("risk_zones")
+            refresh_weather_analytics()
         return "No recent weather logs to compute risk zones."
 
-    created = 0
-    high_risk_alerts = 0
-
-    # Lusaka-local season (for optional tweaks in _determine_risk)
+    # Lusaka-local season (for optional tweaks in _determine_risk_levels)
     season = get_season(_lusaka_month(now))
 
-    for log in logs:
-        point = getattr(log, "location", None)
-        if point is None:
-            continue
-
-        # Determine risk level
-        risk_level = _determine_risk(log, season)
-
-        # Build a ~4 km footprint around the observation point (no GDAL required)
-        try:
-            lon = float(point.x)
-            lat = float(point.y)
-        except Exception:
-            continue
-
-        deg_radius = _degree_buffer_for_meters(lat, meters=4_000.0)
-        try:
-            polygon = point.buffer(deg_radius)
-        except Exception:
-            # conservative fallback if GEOS buffer fails
-            polygon = point.buffer(0.036)
-
-        if not polygon or polygon.empty:
+    # Stable zone key from rounded coords; the snapshot is time-ordered, so keep the
+    # latest row per cell (first occurrence in the reversed key array)
+    keys = np.array([f"{lon:.2f},{lat:.2f}" for lon, lat in zip(logs.lon.tolist(), logs.lat.tolist())])
+    _, first_from_end = np.unique(keys[::-1], return_index=True)
+    latest = np.sort(len(keys) - 1 - first_from_end)
+    zones = logs.select(latest)
+    zone_keys = keys[latest].tolist()
+    levels = _determine_risk_levels(zones, season).tolist()
+
+    # ~4 km footprints around every observation point in one vectorized pass (no GDAL required);
+    # the same rings become the EWKB for the upsert and the GeoJSON of the live deltas
+    rings = footprint_rings(zones.lon, zones.lat, 4_000.0)
+    geoms = [wkb.hex() for wkb in rings_wkb(rings)]
+    names = [f"Zone near ({key.replace(',', ', ')})" for key in zone_keys]
+
+    qn = connection.ops.quote_name
+    sql = _RISK_ZONE_UPSERT_SQL.format(
+        zones=qn(RiskZone._meta.db_table),
+        history=qn(RiskZoneHistory._meta.db_table),
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, {
+            "keys": zone_keys,
+            "names": names,
+            "geoms": geoms,
+            "levels": levels,
+            "now": now,
+        })
+        previous = dict(cursor.fetchall())
+
+    created = sum(1 for level in previous.values() if level is None)
+    changed = 0
+    batch = AlertBatch("risk_zone")
+    for zone_key, zone_name, ring, risk_level, temperature, humidity, wind_speed, city_name in zip(
+        zone_keys, names, rings, levels, zones.temperature.tolist(),
+        zones.humidity.tolist(), zones.wind_speed.tolist(), zones.city_name.tolist(),
+    ):
+        if previous.get(zone_key) == risk_level:
             continue
-
-        # Stable, human-readable zone name based on rounded coords
-        zone_name = f"Zone near ({lon:.2f}, {lat:.2f})"
-
-        zone, was_created = RiskZone.objects.update_or_create(
-            zone_name=zone_name,
-            defaults={
-                "geometry": polygon,
-                "risk_level": risk_level,
-                "calculated_at": timezone.localtime(now),
-            },
-        )
-
-        if was_created:
-            created += 1
-
-        # 🔔 Alert on high risk
+        changed += 1
+
+        # 📡 Live map delta for subscribers (new zone or level change only)
+        publish_on_commit("risk_zones", {
+            "op": "upsert",
+            "zone_key": zone_key,
+            "zone_name": zone_name,
+            "risk_level": risk_level,
+            "previous_level": previous.get(zone_key) or "",
+            "calculated_at": now,
+            "geometry": {"type": "Polygon", "coordinates": [ring.tolist()]},
+        })
+
+        # 🔔 Alert when a zone escalates to high risk (not on every hourly recompute)
         if risk_level == "high":
-            high_risk_alerts += 1
-            city = (log.city_name or f"{lon:.2f},{lat:.2f}")
-            send_alert(
+            city = (city_name or zone_key)
+            batch.add(
                 title="🚨 High-Risk Weather Zone Detected",
                 message=(
                     f"High-risk weather zone near {city}. "
-                    f"Conditions: Temp={log.temperature}, Humidity={log.humidity}, Wind={log.wind_speed}."
+                    f"Conditions: Temp={temperature}, Humidity={humidity}, Wind={wind_speed}."
                 ),
                 severity="critical",
             )
+    high_risk_alerts = len(batch)
+    batch.dispatch()
+    expired = expire_risk_zones(now)
+    invalidate_layer("risk_zones")
+    refresh_weather_analytics()
+
+    return (
+        f"Calculated risk zones: {len(zones)} upserted ({created} new, {changed} level changes), "
+        f"{expired} expired, {high_risk_alerts} high-risk alerts queued."
+    )
+
 
-    return f"Calculated risk zones: {created} new/updated, {high_risk_alerts} high-risk alerts triggered."
\ No newline at end of file
+def expire_risk_zones(now=None) -> int:
+    """
+    Delete current zones not refreshed within RISK_ZONE_TTL_HOURS, so the live
+    map and analytics only ever scan active zones. Their history rows stay, and
+    linked incidents/notifications keep the zone_key after the FK is nulled.
+    """
+    cutoff = (now or timezone.now()) - timedelta(hours=settings.RISK_ZONE_TTL_HOURS)
+    with transaction.atomic():
+        # Lock the stale rows first: a zone refreshed by a concurrent recompute no
+        # longer matches the cutoff once locked, so it is neither deleted nor announced.
+        # (ORM delete, not raw SQL: it applies the SET_NULL on linked incidents/notifications.)
+        stale = dict(
+            RiskZone.objects.select_for_update()
+            .filter(calculated_at__lt=cutoff)
+            .values_list("id", "zone_key")
+        )
+        if not stale:
+            return 0
+        expired, _ = RiskZone.objects.filter(id__in=stale).delete()
+        for zone_key in stale.values():
+            publish_on_commit("risk_zones", {"op": "delete", "zone_key": zone_key})
+    return expired
+
+@shared_task
+def rebuild_rainfall_climatology() -> str:
+    """
+    Full rebuild of the WeatherLog rollups (DailyWeatherSummary, then
+    MonthlyRainfallClimatology from it). Ingestion keeps them current
+    incrementally; run this once after deploying the tables or after bulk
+    historical imports.
+    """
+    days = rebuild_rollups()
+    return f"Weather rollups rebuilt: {days} city-day rows (monthly climatology recounted)."
@@ -1,3 +1,196 @@
-from django.test import TestCase
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from django.test import SimpleTestCase, TestCase
+from django.utils import timezone
+
+from disaster_management.apps.weather import tasks
+from disaster_management.apps.weather.models import RiskZone, RiskZoneHistory
+from disaster_management.utils.weather_ingest import IngestConfig, Station, fetch_stations_async
+from disaster_management.utils.weather_snapshot import WeatherSnapshot
+
+
+def make_snapshot(now, rows):
+    """
+    Small in-memory snapshot; `rows` are
+    (lon, lat, temperature, humidity, wind_speed, condition, city_name, minutes_ago), oldest first.
+    """
+    lon, lat, temp, hum, wind, cond, city, ago = zip(*rows)
+    recorded_at = np.array([(now - timedelta(minutes=m)).timestamp() for m in ago])
+    return WeatherSnapshot(
+        start=now - timedelta(days=7),
+        end=now,
+        ids=np.arange(1, len(rows) + 1, dtype=np.int64),
+        lon=np.array(lon, dtype=float),
+        lat=np.array(lat, dtype=float),
+        temperature=np.array(temp, dtype=float),
+        humidity=np.array(hum, dtype=float),
+        wind_speed=np.array(wind, dtype=float),
+        condition=np.array(cond, dtype=object),
+        city_name=np.array(city, dtype=object),
+        rainfall_mm=np.full(len(rows), np.nan),
+        rain=np.zeros(len(rows), dtype=np.int8),
+        recorded_at=recorded_at,
+        local_month=np.full(len(rows), now.month, dtype=np.int8),
+        local_date=np.full(len(rows), np.datetime64(now.date(), "D")),
+    )
+
+
+@mock.patch.object(tasks, "refresh_weather_analytics")
+@mock.patch.object(tasks, "invalidate_layer")
+@mock.patch.object(tasks.AlertBatch, "dispatch")
+class CalculateRiskZonesTests(TestCase):
+    def setUp(self):
+        self.now = timezone.now()
+        self.snapshot = make_snapshot(self.now, [
+            # Same 0.01° cell twice: the later (high) observation must win
+            (28.2831, -15.4166, 25.0, 40.0, 2.0, "Clear", "Lusaka", 90),
+            (28.3101, -15.4012, 22.0, 80.0, 7.0, "Rain", "Chelston", 60),
+            (28.2833, -15.4171, 36.0, 75.0, 12.0, "Clear", "Lusaka", 30),
+            (25.8560, -17.8419, None, None, None, None, None, 10),
+        ])
+
+    def run_task(self, snapshot=None):
+        with mock.patch.object(tasks, "get_weather_snapshot", return_value=snapshot or self.snapshot):
+            return tasks.calculate_risk_zones()
+
+    def test_upserts_latest_observation_per_cell(self, dispatch, invalidate_layer, refresh):
+        result = self.run_task()
+
+        levels = dict(RiskZone.objects.values_list("zone_key", "risk_level"))
+        self.assertEqual(levels, {"28.28,-15.42": "high", "28.31,-15.40": "medium", "25.86,-17.84": "low"})
+        self.assertEqual(RiskZoneHistory.objects.filter(previous_level="").count(), 3)
+        self.assertIn("3 upserted (3 new, 3 level changes)", result)
+        self.assertIn("1 high-risk alerts", result)
+        dispatch.assert_called_once()
+        invalidate_layer.assert_called_with("risk_zones")
+        refresh.assert_called_once()
+
+    def test_recompute_only_records_level_changes(self, dispatch, invalidate_layer, refresh):
+        self.run_task()
+        calmer = make_snapshot(self.now, [
+            (28.2833, -15.4171, 25.0, 40.0, 2.0, "Clear", "Lusaka", 5),
+            (28.3101, -15.4012, 22.0, 80.0, 7.0, "Rain", "Chelston", 5),
+        ])
+
+        result = self.run_task(calmer)
+
+        self.assertIn("2 upserted (0 new, 1 level changes)", result)
+        self.assertEqual(RiskZone.objects.get(zone_key="28.28,-15.42").risk_level, "low")
+        change = RiskZoneHistory.objects.get(zone_key="28.28,-15.42", previous_level="high")
+        self.assertEqual(change.risk_level, "low")
+        self.assertEqual(RiskZoneHistory.objects.count(), 4)
+
+    def test_determine_risk_levels(self, dispatch, invalidate_layer, refresh):
+        levels = tasks._determine_risk_levels(self.snapshot, "rainy")
+        self.assertEqual(levels.tolist(), ["low", "medium", "high", "low"])
+
+
+@asynccontextmanager
+async def stub_provider(handler):
+    """Local HTTP server standing in for OpenWeather; yields its URL."""
+    app = web.Application()
+    app.router.add_get("/weather", handler)
+    server = TestServer(app)
+    await server.start_server()
+    try:
+        yield str(server.make_url("/weather"))
+    finally:
+        await server.close()
+
+
+class FetchStationsTests(SimpleTestCase):
+    config = IngestConfig(concurrency=4, rate_per_sec=0, timeout=0.5, connect_timeout=0.5,
+                          max_retries=3, backoff_base=0.01, backoff_cap=0.02)
+
+    def setUp(self):
+        self.hits = {}
+
+    def hit(self, request) -> int:
+        """Count requests per station (the stub keys stations by `lat`)."""
+        lat = request.query["lat"]
+        self.hits[lat] = self.hits.get(lat, 0) + 1
+        return self.hits[lat]
+
+    async def fetch(self, handler, *lats, config=None):
+        stations = [Station(f"station-{lat}", lat, 28.0) for lat in lats]
+        async with stub_provider(handler) as url:
+            return await fetch_stations_async(stations, "key", url=url, config=config or self.config)
+
+    async def test_success(self):
+        async def handler(request):
+            self.hit(request)
+            return web.json_response({"name": request.query["lat"], "appid": request.query["appid"]})
+
+        [result] = await self.fetch(handler, 1)
+        self.assertEqual(result.payload, {"name": "1", "appid": "key"})
+        self.assertEqual((result.error, result.attempts), (None, 1))
+
+    async def test_429_honours_retry_after(self):
+        async def handler(request):
+            if self.hit(request) == 1:
+                return web.Response(status=429, headers={"Retry-After": "0.3"})
+            return web.json_response({"ok": True})
+
+        t0 = time.monotonic()
+        [result] = await self.fetch(handler, 1)
+        self.assertGreaterEqual(time.monotonic() - t0, 0.3)
+        self.assertEqual((result.payload, result.attempts), ({"ok": True}, 2))
+
+    async def test_5xx_then_success(self):
+        async def handler(request):
+            if self.hit(request) == 1:
+                return web.Response(status=503)
+            return web.json_response({"ok": True})
+
+        [result] = await self.fetch(handler, 1)
+        self.assertEqual((result.payload, result.error, result.attempts), ({"ok": True}, None, 2))
+
+    async def test_other_4xx_fails_fast(self):
+        async def handler(request):
+            self.hit(request)
+            return web.Response(status=401)
+
+        [result] = await self.fetch(handler, 1)
+        self.assertIsNone(result.payload)
+        self.assertEqual((result.error, result.attempts), ("HTTP 401", 1))
+        self.assertEqual(self.hits, {"1": 1})
+
+    async def test_timeout_retries_then_gives_up(self):
+        async def handler(request):
+            self.hit(request)
+            await asyncio.sleep(1)
+            return web.json_response({"ok": True})
+
+        config = IngestConfig(concurrency=4, rate_per_sec=0, timeout=0.1, max_retries=2,
+                              backoff_base=0.01, backoff_cap=0.02)
+        [result] = await self.fetch(handler, 1, config=config)
+        self.assertIsNone(result.payload)
+        self.assertIn("TimeoutError", result.error)
+        self.assertEqual((result.attempts, self.hits["1"]), (2, 2))
+
+    async def test_concurrency_is_bounded(self):
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return web.json_response({"lat": request.query["lat"]})
+
+        results = await self.fetch(handler, *range(20))
+        self.assertEqual([r.payload["lat"] for r in results], [str(i) for i in range(20)])
+        self.assertEqual(peak, self.config.concurrency)
+
+    def test_per_shard_splits_rate(self):
+        config = IngestConfig(rate_per_sec=10.0, burst=10).per_shard(4)
+        self.assertEqual((config.rate_per_sec, config.burst), (2.5, 2))
+        self.assertIs(self.config.per_shard(4), self.config)
@@ -23,33 +23,15 @@ app.autodiscover_tasks()
 # Adjust if your app label/module differs.
 
 app.conf.beat_schedule = {
-    # ───────────────── Weather ingestion & base risk calc ─────────────────
-    "fetch-zambia-weather-every-hour": {
-        "task": "disaster_management.apps.weather.tasks.pull_weather_data",
+    # ───────────────── Hourly forecast pipeline (DAG, see forecasting/pipeline.py) ─────────────────
+    # ingest → features → [risk zones, flood (3h), drought/heat/rain check (6h)] in parallel.
+    # Each stage starts when its inputs are committed, instead of fixed HH:15/HH:30/HH:45 offsets.
+    "run-forecast-pipeline-every-hour": {
+        "task": "disaster_management.apps.forecasting.pipeline.run_forecast_pipeline",
         "schedule": crontab(minute=0, hour="*/1"),  # top of every hour
     },
-    "calculate-risk-zones-every-hour": {
-        "task": "disaster_management.apps.weather.tasks.calculate_risk_zones",
-        "schedule": crontab(minute=15, hour="*/1"),  # HH:15 every hour
-    },
 
-    # ───────────────── Season-aware hazard forecasting (forecasting.tasks) ─────────────────
-    "run-flood-forecast-every-3-hours": {
-        "task": "forecasting.tasks.run_flood_prediction",
-        "schedule": crontab(minute=0, hour="*/3"),  # HH:00 every 3 hours
-    },
-    "run-drought-forecast-every-6-hours": {
-        "task": "forecasting.tasks.run_drought_prediction",
-        "schedule": crontab(minute=0, hour="*/6"),  # HH:00 every 6 hours
-    },
-    "run-heat-wave-forecast-every-6-hours": {
-        "task": "forecasting.tasks.run_heat_wave_forecast",
-        "schedule": crontab(minute=30, hour="*/6"),  # HH:30 every 6 hours
-    },
-    "check-seasonal-rain-anomalies": {
-        "task": "forecasting.tasks.run_seasonal_rain_check",
-        "schedule": crontab(minute=45, hour="*/6"),  # HH:45 every 6 hours
-    },
+    # ───────────────── Daily / seasonal checks ─────────────────
     "check-drought-anomaly-daily": {
         "task": "forecasting.tasks.run_dry_season_alerts",
         "schedule": crontab(minute=0, hour=6),  # 06:00 daily
@@ -0,0 +1,67 @@
+import base64
+from datetime import datetime
+
+import graphene
+from django.db.models import Q
+from graphene import relay
+from graphql import GraphQLError
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+def connection_args(**extra):
+    """Relay forward-pagination arguments (`first`, `after`) plus the field's own filters."""
+    return dict(first=graphene.Int(), after=graphene.String(), **extra)
+
+
+def encode_cursor(at: datetime, pk) -> str:
+    return base64.urlsafe_b64encode(f"{at.isoformat()}|{pk}".encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    try:
+        at, pk = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(at), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        raise GraphQLError("Invalid cursor.")
+
+
+def keyset_page(queryset, connection_type, time_field, first=None, after=None):
+    """
+    Newest-first page of `queryset` keyed on (time_field, id).
+
+    The cursor carries the last row's key, so page N is a range scan from that
+    key on the (time_field DESC, id DESC) index – as cheap as the first page,
+    unlike OFFSET which reads and discards every earlier row.
+    """
+    size = DEFAULT_PAGE_SIZE if first is None else first
+    if not 0 < size <= MAX_PAGE_SIZE:
+        raise GraphQLError(f"`first` must be between 1 and {MAX_PAGE_SIZE}.")
+
+    queryset = queryset.order_by(f"-{time_field}", "-id")
+    if after:
+        at, pk = decode_cursor(after)
+        # (t, id) < (at, pk); the redundant `t <= at` bound gives the planner an index range
+        queryset = queryset.filter(
+            Q(**{f"{time_field}__lt": at}) | Q(**{time_field: at, "id__lt": pk}),
+            **{f"{time_field}__lte": at},
+        )
+
+    rows = list(queryset[:size + 1])
+    has_next = len(rows) > size
+    rows = rows[:size]
+
+    edges = [
+        connection_type.Edge(node=row, cursor=encode_cursor(getattr(row, time_field), row.pk))
+        for row in rows
+    ]
+    return connection_type(
+        edges=edges,
+        page_info=relay.PageInfo(
+            has_next_page=has_next,
+            has_previous_page=bool(after),
+            start_cursor=edges[0].cursor if edges else None,
+            end_cursor=edges[-1].cursor if edges else None,
+        ),
+    )
@@ -4,16 +4,17 @@
 import graphene
 
 from disaster_management.apps.core.models import ActivityLog, ErrorLog
-from disaster_management.graphql.types.core import ActivityLogType, ErrorLogType
+from disaster_management.graphql.pagination import connection_args, keyset_page
+from disaster_management.graphql.types.core import ActivityLogConnection, ErrorLogType
 
 
 
 class LogQuery(graphene.ObjectType):
-    activity_logs = graphene.List(graphene.NonNull(ActivityLogType))
+    activity_logs = graphene.Field(ActivityLogConnection, **connection_args())
     error_logs = graphene.List(graphene.NonNull(ErrorLogType))
 
-    def resolve_activity_logs(self, info):
-        return ActivityLog.objects.select_related("user").order_by('-timestamp')[:100]
+    def resolve_activity_logs(self, info, first=None, after=None):
+        return keyset_page(ActivityLog.objects.select_related("user"), ActivityLogConnection, "timestamp", first, after)
 
     def resolve_error_logs(self, info):
         return ErrorLog.objects.order_by('-occurred_at')[:100]
@@ -11,7 +11,12 @@ from django.contrib.gis.geos import Polygon, Point
 from django.contrib.gis.measure import D
 
 
-from disaster_management.apps.forecasting.models import ForecastResult
+import os
+
+import numpy as np
+from django.conf import settings
+
+from disaster_management.apps.forecasting.models import ForecastResult, RiskRaster
 from disaster_management.graphql.types.forecast import ForecastResultType
 
 # ── Enums ──────────────────────────────────────────────────────────────
@@ -51,6 +56,34 @@ class ForecastResultsSummary(graphene.ObjectType):
     by_model_type = GenericScalar()
     last_updated = graphene.DateTime()
 
+class RiskBandEnum(graphene.Enum):
+    FLOOD = "flood"
+    DROUGHT = "drought"
+    HEAT = "heat"
+
+# ── Gridded risk (RISK_GRID_ENABLED) ───────────────────────────────────
+class RiskGridWindow(graphene.ObjectType):
+    as_of = graphene.DateTime()
+    band = graphene.String()
+    west = graphene.Float()
+    north = graphene.Float()
+    resolution = graphene.Float()
+    width = graphene.Int()
+    height = graphene.Int()
+    values = GenericScalar(description="Rows north→south of cell scores (0..1); null = no data.")
+
+class RiskGridPoint(graphene.ObjectType):
+    as_of = graphene.DateTime()
+    lon = graphene.Float()
+    lat = graphene.Float()
+    scores = GenericScalar(description="{band: score or null}")
+
+def _latest_raster(as_of=None):
+    qs = RiskRaster.objects.all()
+    if as_of:
+        qs = qs.filter(as_of__lte=as_of)
+    return qs.order_by("-as_of").first()
+
 class Query(graphene.ObjectType):
     forecast_results = graphene.List(
         ForecastResultType,
@@ -76,6 +109,20 @@ class Query(graphene.ObjectType):
         min_confidence=graphene.Float(),
     )
 
+    risk_grid_window = graphene.Field(
+        RiskGridWindow,
+        band=graphene.Argument(RiskBandEnum, required=True),
+        bbox=graphene.Argument(BBoxInput, required=True),
+        as_of=graphene.DateTime(description="Latest grid at or before this time (default: newest)."),
+    )
+
+    risk_grid_point = graphene.Field(
+        RiskGridPoint,
+        lon=graphene.Float(required=True),
+        lat=graphene.Float(required=True),
+        as_of=graphene.DateTime(),
+    )
+
     # ── Resolvers ──────────────────────────────────────────────────────
     def resolve_forecast_results(
         self,
@@ -200,5 +247,39 @@ class Query(graphene.ObjectType):
         )
 
 
+    def resolve_risk_grid_window(self, info, band, bbox, as_of=None):
+        from disaster_management.utils.risk_grid import read_window
+
+        raster = _latest_raster(as_of)
+        band = getattr(band, "value", band)
+        if raster is None or band not in raster.bands:
+            return None
+        # Windowed read: only the tiles under the bbox are decompressed
+        window = read_window(
+            os.path.join(settings.MEDIA_ROOT, raster.path), band,
+            (bbox.min_lon, bbox.min_lat, bbox.max_lon, bbox.max_lat),
+        )
+        values = window["values"]
+        return RiskGridWindow(
+            as_of=raster.as_of,
+            band=band,
+            west=window["west"],
+            north=window["north"],
+            resolution=window["resolution"],
+            width=values.shape[1] if values.ndim == 2 else 0,
+            height=values.shape[0],
+            values=np.where(np.isnan(values), None, np.round(values, 3)).tolist(),
+        )
+
+    def resolve_risk_grid_point(self, info, lon, lat, as_of=None):
+        from disaster_management.utils.risk_grid import sample_points
+
+        raster = _latest_raster(as_of)
+        if raster is None:
+            return None
+        scores = sample_points(os.path.join(settings.MEDIA_ROOT, raster.path), [(lon, lat)])[(lon, lat)]
+        return RiskGridPoint(as_of=raster.as_of, lon=lon, lat=lat, scores=scores)
+
+
 class ForecastQuery(Query, graphene.ObjectType):
     pass
\ No newline at end of file
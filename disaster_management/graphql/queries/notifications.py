@@ -6,23 +6,24 @@ from graphql import GraphQLError
 from disaster_management.apps.notifications.models import Notification, UserNotification
 from graphql_jwt.decorators import login_required
 
-from disaster_management.graphql.types.notifications import NotificationType, UserNotificationType
+from disaster_management.graphql.pagination import connection_args, keyset_page
+from disaster_management.graphql.types.notifications import NotificationType, UserNotificationConnection
 
 class NotificationQuery(graphene.ObjectType):
-    my_notifications = graphene.List(
-        UserNotificationType,
-        unread_only=graphene.Boolean(default_value=False)
+    my_notifications = graphene.Field(
+        UserNotificationConnection,
+        **connection_args(unread_only=graphene.Boolean(default_value=False)),
     )
 
     @login_required
-    def resolve_my_notifications(self, info, unread_only):
+    def resolve_my_notifications(self, info, unread_only, first=None, after=None):
         user = info.context.user
         queryset = UserNotification.objects.filter(user=user)
 
         if unread_only:
             queryset = queryset.filter(is_read=False)
 
-        return queryset.order_by("-received_at")
+        return keyset_page(queryset.select_related("notification"), UserNotificationConnection, "received_at", first, after)
     
     
     
@@ -1,4 +1,5 @@
 import graphene
+from graphene import relay
 from django.contrib.gis.geos import Point
 from graphene_django import DjangoObjectType
 from graphql import GraphQLError
@@ -14,8 +15,11 @@ from disaster_management.apps.resources.models import (
 )
 from disaster_management.apps.resources.utils import recommend_restock
 from disaster_management.apps.shelters.models import LocationLog
+from disaster_management.graphql.pagination import connection_args, keyset_page
 from disaster_management.graphql.permissions import role_required
-from disaster_management.graphql.types.resources import ResourceDeploymentType, ResourceType, ResourceUnitType, RestockRecommendation
+from disaster_management.graphql.types.resources import (
+    ResourceDeploymentConnection, ResourceType, ResourceUnitType, RestockRecommendation,
+)
 
 
 # -------------------------------------------------------------------
@@ -43,6 +47,12 @@ class InventoryLogType(DjangoObjectType):
         )
 
 
+class InventoryLogConnection(relay.Connection):
+    """Keyset-paginated (see graphql.pagination.keyset_page)."""
+    class Meta:
+        node = InventoryLogType
+
+
 # -------------------------------------------------------------------
 # 🔍 Resource Management Queries
 # -------------------------------------------------------------------
@@ -75,13 +85,15 @@ class ResourceManagementQuery(graphene.ObjectType):
     )
 
     # -------------------- Deployments --------------------
-    deployment_logs = graphene.List(
-        ResourceDeploymentType,
-        region_lat=graphene.Float(),
-        region_lng=graphene.Float(),
-        radius_km=graphene.Float(),
-        start_date=graphene.Date(),
-        end_date=graphene.Date(),
+    deployment_logs = graphene.Field(
+        ResourceDeploymentConnection,
+        **connection_args(
+            region_lat=graphene.Float(),
+            region_lng=graphene.Float(),
+            radius_km=graphene.Float(),
+            start_date=graphene.Date(),
+            end_date=graphene.Date(),
+        ),
     )
 
     # -------------------- Requests --------------------
@@ -93,11 +105,13 @@ class ResourceManagementQuery(graphene.ObjectType):
 
     # -------------------- Inventory & Restock --------------------
     inventory_report = graphene.List(InventoryReportType)
-    inventory_logs = graphene.List(
-        InventoryLogType,
-        resource_id=graphene.ID(required=False),
-        batch_id=graphene.String(required=False),
-        source_warehouse=graphene.String(required=False),
+    inventory_logs = graphene.Field(
+        InventoryLogConnection,
+        **connection_args(
+            resource_id=graphene.ID(required=False),
+            batch_id=graphene.String(required=False),
+            source_warehouse=graphene.String(required=False),
+        ),
     )
     low_stock_resources = graphene.List(
         ResourceType, threshold=graphene.Int(default_value=10)
@@ -169,7 +183,9 @@ class ResourceManagementQuery(graphene.ObjectType):
         if end_date:
             queryset = queryset.filter(deployed_at__date__lte=end_date)
 
-        return queryset.order_by("-deployed_at")
+        return keyset_page(
+            queryset, ResourceDeploymentConnection, "deployed_at", kwargs.get("first"), kwargs.get("after"),
+        )
 
     # -------------------- Requests --------------------
     def resolve_my_resource_requests(self, info):
@@ -211,7 +227,7 @@ class ResourceManagementQuery(graphene.ObjectType):
         return report
 
     def resolve_inventory_logs(
-        self, info, resource_id=None, batch_id=None, source_warehouse=None
+        self, info, resource_id=None, batch_id=None, source_warehouse=None, first=None, after=None
     ):
         qs = Inventory.objects.all()
         if resource_id:
@@ -220,7 +236,7 @@ class ResourceManagementQuery(graphene.ObjectType):
             qs = qs.filter(batch_id=batch_id)
         if source_warehouse:
             qs = qs.filter(source_warehouse__icontains=source_warehouse)
-        return qs.order_by("-created_at")
+        return keyset_page(qs, InventoryLogConnection, "created_at", first, after)
 
     def resolve_low_stock_resources(self, info, threshold):
         return [r for r in Resource.objects.all() if r.current_stock < threshold]
@@ -16,6 +16,7 @@ from disaster_management.graphql.queries.resources import ResourcesQuery
 from disaster_management.graphql.queries.shelter import SheltersQuery
 from disaster_management.graphql.queries.users import UsersQuery
 from disaster_management.graphql.queries.weather import WeatherQuery
+from disaster_management.graphql.subscriptions import Subscription
 
 
 # Import queries and mutations from each module
@@ -53,4 +54,4 @@ class Mutation(
     # This base class now includes all sub-mutations
     pass
 
-schema = graphene.Schema(query=Query, mutation=Mutation)
+schema = graphene.Schema(query=Query, mutation=Mutation, subscription=Subscription)
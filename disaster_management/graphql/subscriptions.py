@@ -0,0 +1,89 @@
+import graphene
+from django.utils.dateparse import parse_datetime
+from graphql import GraphQLError
+
+from disaster_management.utils.live_updates import notifications_topic, subscribe
+
+RISK_ORDER = {"low": 0, "medium": 1, "high": 2}
+DATETIME_FIELDS = {"reported_at", "calculated_at", "received_at"}
+
+
+class IncidentEvent(graphene.ObjectType):
+    op = graphene.String(description="upsert | delete")
+    id = graphene.ID()
+    incident_type = graphene.String()
+    status = graphene.String()
+    verified = graphene.Boolean()
+    risk_label = graphene.String()
+    latitude = graphene.Float()
+    longitude = graphene.Float()
+    reported_at = graphene.DateTime()
+
+
+class RiskZoneEvent(graphene.ObjectType):
+    op = graphene.String(description="upsert (new zone / level change) | delete (expired)")
+    zone_key = graphene.String()
+    zone_name = graphene.String()
+    risk_level = graphene.String()
+    previous_level = graphene.String()
+    calculated_at = graphene.DateTime()
+    geometry = graphene.JSONString()
+
+
+class NotificationEvent(graphene.ObjectType):
+    id = graphene.ID(description="UserNotification id")
+    notification_id = graphene.ID()
+    title = graphene.String()
+    message = graphene.String()
+    severity = graphene.String()
+    received_at = graphene.DateTime()
+
+
+def _require_user(info):
+    # Same rule as the @login_required incident queries
+    user = info.context.user
+    if not user.is_authenticated:
+        raise GraphQLError("Authentication required.")
+    return user
+
+
+def _event(event_type, delta):
+    # Deltas travel as JSON: restore datetimes for the DateTime scalars
+    return event_type(**{
+        name: parse_datetime(value) if name in DATETIME_FIELDS and value else value
+        for name, value in delta.items()
+    })
+
+
+async def _events(event_type, topic, keep=None):
+    async for delta in subscribe(topic):
+        if keep is None or keep(delta):
+            yield _event(event_type, delta)
+
+
+class Subscription(graphene.ObjectType):
+    """
+    Served over WebSockets (graphql-ws protocol) by graphql.websocket; fed by utils.live_updates.
+    The subscribe_* resolvers are plain functions that validate, then return the
+    event stream: errors raised here reach the client as a GraphQL error, while
+    ones raised inside the stream would only surface on its first event.
+    """
+    incident_updates = graphene.Field(IncidentEvent)
+    risk_zone_updates = graphene.Field(RiskZoneEvent, min_level=graphene.String(default_value="low"))
+    my_notification_updates = graphene.Field(NotificationEvent)
+
+    def subscribe_incident_updates(root, info):
+        _require_user(info)
+        return _events(IncidentEvent, "incidents")
+
+    def subscribe_risk_zone_updates(root, info, min_level):
+        if min_level not in RISK_ORDER:
+            raise GraphQLError("min_level must be one of: low, medium, high.")
+        # Expiries always go out so clients can drop the zone
+        return _events(RiskZoneEvent, "risk_zones", keep=lambda delta: (
+            delta["op"] == "delete" or RISK_ORDER[delta["risk_level"]] >= RISK_ORDER[min_level]
+        ))
+
+    def subscribe_my_notification_updates(root, info):
+        user = _require_user(info)
+        return _events(NotificationEvent, notifications_topic(user.pk))
@@ -1,4 +1,5 @@
 import graphene
+from graphene import relay
 from graphene_django import DjangoObjectType
 
 from disaster_management.apps.core.models import ActivityLog, ErrorLog
@@ -45,6 +46,12 @@ class ActivityLogType(DjangoObjectType):
         return self.user if self.user else None
     
     
+class ActivityLogConnection(relay.Connection):
+    """Keyset-paginated (see graphql.pagination.keyset_page)."""
+    class Meta:
+        node = ActivityLogType
+
+
 class ErrorLogType(DjangoObjectType):
     class Meta:
         model = ErrorLog
@@ -1,6 +1,7 @@
 
 
 
+from graphene import relay
 from graphene_django import DjangoObjectType
 
 from disaster_management.apps.notifications.models import Notification, UserNotification
@@ -16,6 +17,7 @@ class NotificationType(DjangoObjectType):
             "severity",
             "target_type",
             "target_zone",
+            "target_zone_key",
             "triggered_by",
             "sent_at",
         )
@@ -30,3 +32,8 @@ class UserNotificationType(DjangoObjectType):
             "received_at",
         )
 
+
+class UserNotificationConnection(relay.Connection):
+    """Keyset-paginated (see graphql.pagination.keyset_page)."""
+    class Meta:
+        node = UserNotificationType
@@ -6,6 +6,7 @@
 
 
 import graphene
+from graphene import relay
 from graphene_django import DjangoObjectType
 
 from disaster_management.apps.resources.models import Inventory, Resource, ResourceDeployment, ResourceRequest, ResourceUnit
@@ -68,6 +69,12 @@ class ResourceDeploymentType(DjangoObjectType):
             return LocationType(latitude=self.destination.y, longitude=self.destination.x)
         return None
         
+class ResourceDeploymentConnection(relay.Connection):
+    """Keyset-paginated (see graphql.pagination.keyset_page)."""
+    class Meta:
+        node = ResourceDeploymentType
+
+
 class RestockRecommendation(graphene.ObjectType):
     resource = graphene.Field(ResourceType)
     message = graphene.String()
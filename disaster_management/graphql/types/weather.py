@@ -2,6 +2,7 @@
 
 import json
 import graphene
+from graphene import relay
 from graphene_django import DjangoObjectType
 
 from disaster_management.apps.weather.models import RiskZone, WeatherLog
@@ -21,6 +22,12 @@ class WeatherLogType(DjangoObjectType):
         return None
 
 
+class WeatherLogConnection(relay.Connection):
+    """Keyset-paginated (see graphql.pagination.keyset_page)."""
+    class Meta:
+        node = WeatherLogType
+
+
 class PolygonCoordinatesType(graphene.ObjectType):
     coordinates = graphene.List(graphene.List(graphene.List(graphene.Float)))
 
@@ -0,0 +1,90 @@
+"""
+GraphQL over WebSockets for plain ASGI (no Channels).
+
+graphql-ws-next implements the Apollo `graphql-ws` protocol and only needs a
+connection context for the transport; `ASGIConnectionContext` adapts the raw
+ASGI websocket receive/send callables. Clients authenticate by sending their
+JWT in the `connection_init` payload (`{"authToken": "<token>"}` or
+`{"Authorization": "JWT <token>"}`); anonymous connections only get the
+public risk-zone feed.
+"""
+from types import SimpleNamespace
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from graphql_jwt.settings import jwt_settings
+from graphql_jwt.shortcuts import get_user_by_token
+from graphql_ws import WS_PROTOCOL, AbstractConnectionContext, SubscriptionServer
+from graphql_ws.server import ConnectionClosed
+
+from disaster_management.graphql.schema import schema
+
+
+class _ASGIWebSocket(SimpleNamespace):
+    """`receive` / `send` callables of one accepted ASGI websocket."""
+
+
+class ASGIConnectionContext(AbstractConnectionContext):
+    ws: _ASGIWebSocket
+
+    def __init__(self, ws, context_value=None):
+        super().__init__(ws, context_value)
+        self._closed = False
+
+    async def receive(self) -> str:
+        while True:
+            message = await self.ws.receive()
+            if message["type"] == "websocket.disconnect":
+                self._closed = True
+                raise ConnectionClosed
+            if message["type"] == "websocket.receive":
+                return message.get("text") or (message.get("bytes") or b"").decode()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def close(self, code: int) -> None:
+        if not self._closed:
+            self._closed = True
+            await self.ws.send({"type": "websocket.close", "code": code})
+
+    async def send(self, data: str) -> None:
+        if not self._closed:
+            await self.ws.send({"type": "websocket.send", "text": data})
+
+
+def _token(payload) -> str:
+    token = payload.get("authToken") or payload.get("Authorization") or ""
+    prefix = f"{jwt_settings.JWT_AUTH_HEADER_PREFIX} "
+    return token[len(prefix):] if token.startswith(prefix) else token
+
+
+class GraphQLSubscriptionServer(SubscriptionServer):
+    async def on_connect(self, connection_context, payload) -> None:
+        # Raising here makes the server answer connection_error and close
+        token = _token(payload or {})
+        if token:
+            connection_context.context_value.user = await sync_to_async(get_user_by_token)(token)
+
+    async def on_close(self, connection_context) -> None:
+        # The base class hands bare coroutines to asyncio.wait (a TypeError on 3.11+)
+        for op_id in list(connection_context):
+            await self.unsubscribe(connection_context, op_id)
+
+
+subscription_server = GraphQLSubscriptionServer(schema.graphql_schema, ASGIConnectionContext)
+
+
+async def graphql_ws_app(scope, receive, send) -> None:
+    """ASGI app for one websocket connection (see asgi.py for routing)."""
+    message = await receive()
+    if message["type"] != "websocket.connect":
+        return
+    if WS_PROTOCOL not in scope.get("subprotocols", ()):
+        await send({"type": "websocket.close", "code": 1002})
+        return
+    await send({"type": "websocket.accept", "subprotocol": WS_PROTOCOL})
+
+    context = SimpleNamespace(user=AnonymousUser(), scope=scope)
+    await subscription_server.handle(_ASGIWebSocket(receive=receive, send=send), context)
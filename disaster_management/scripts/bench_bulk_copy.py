@@ -0,0 +1,58 @@
+import random
+import time
+
+from django.db import transaction
+from django.utils import timezone
+
+from disaster_management.apps.forecasting.models import ForecastModel, ForecastResult
+from disaster_management.utils.bulk_copy import copy_bulk_create
+from disaster_management.utils.geometry import footprint_polygons, footprint_wkb
+
+
+class _Rollback(Exception):
+    pass
+
+
+def benchmark_bulk_copy(n_rows=100_000, seed=3):
+    """
+    Insert throughput for `n_rows` forecast polygons: ORM bulk_create(batch_size=500)
+    vs COPY FROM STDIN with EWKB. Runs inside a rolled-back transaction.
+
+        python manage.py shell -c "from disaster_management.scripts.bench_bulk_copy import benchmark_bulk_copy; benchmark_bulk_copy()"
+    """
+    rng = random.Random(seed)
+    lons = [rng.uniform(22.0, 33.7) for _ in range(n_rows)]
+    lats = [rng.uniform(-18.0, -8.3) for _ in range(n_rows)]
+    now = timezone.localtime(timezone.now())
+
+    try:
+        with transaction.atomic():
+            model = ForecastModel.objects.create(name="bench", model_type="flood")
+
+            def row(i, polygon):
+                return dict(
+                    model=model, forecast_date=now.date(), predicted_at=now, affected_area=polygon,
+                    area_name=f"Bench {i}", risk_level="low", confidence=0.5, details="bench",
+                )
+
+            t0 = time.perf_counter()
+            polygons = footprint_polygons(lons, lats, meters=3_000.0)
+            ForecastResult.objects.bulk_create(
+                [ForecastResult(**row(i, p)) for i, p in enumerate(polygons)], batch_size=500
+            )
+            t_orm = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            wkbs = footprint_wkb(lons, lats, meters=3_000.0)
+            copy_bulk_create(ForecastResult, (row(i, w) for i, w in enumerate(wkbs)))
+            t_copy = time.perf_counter() - t0
+
+            written = ForecastResult.objects.filter(model=model).count()
+            raise _Rollback((t_orm, t_copy, written))
+    except _Rollback as done:
+        t_orm, t_copy, written = done.args[0]
+
+    print(f"rows={n_rows} (written twice: {written})")
+    print(f"bulk_create: {t_orm:.2f}s  ({n_rows / t_orm:,.0f} rows/s)")
+    print(f"COPY:        {t_copy:.2f}s  ({n_rows / t_copy:,.0f} rows/s, {t_orm / max(t_copy, 1e-9):.1f}x)")
+    return {"bulk_create_s": t_orm, "copy_s": t_copy}
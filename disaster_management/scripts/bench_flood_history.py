@@ -0,0 +1,76 @@
+import random
+import time
+
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.db import transaction
+from django.utils import timezone
+
+from disaster_management.apps.weather.models import HistoricalIncident, WeatherLog
+from disaster_management.utils.feature_extraction import flood_history_flags
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _random_point(rng):
+    # Rough Zambia bounding box
+    return Point(rng.uniform(22.0, 33.7), rng.uniform(-18.0, -8.3), srid=4326)
+
+
+def benchmark_flood_history(n_logs=10_000, n_stations=2_000, n_incidents=500, seed=42):
+    """
+    Compare the per-row `.exists()` flood-history lookup against the batched
+    spatial join on synthetic data. Everything is written inside a transaction
+    that is rolled back, so it is safe to run against a dev database:
+
+        python manage.py shell -c "from disaster_management.scripts.bench_flood_history import benchmark_flood_history; benchmark_flood_history()"
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    stations = [_random_point(rng) for _ in range(n_stations)]
+
+    try:
+        with transaction.atomic():
+            HistoricalIncident.objects.bulk_create([
+                HistoricalIncident(
+                    incident_type="Flood" if i % 3 else "Fire",
+                    location=_random_point(rng),
+                    occurred_at=now,
+                )
+                for i in range(n_incidents)
+            ], batch_size=1000)
+            WeatherLog.objects.bulk_create([
+                WeatherLog(
+                    temperature=25.0, humidity=60.0, wind_speed=3.0, condition="rain",
+                    location=stations[i % n_stations], city_name=f"bench-{i}", recorded_at=now,
+                )
+                for i in range(n_logs)
+            ], batch_size=1000)
+            logs = list(WeatherLog.objects.filter(city_name__startswith="bench-").only("location"))
+
+            t0 = time.perf_counter()
+            per_row = [
+                HistoricalIncident.objects.filter(
+                    incident_type__icontains="flood",
+                    location__distance_lte=(log.location, D(m=5000)),
+                ).exists()
+                for log in logs
+            ]
+            t_per_row = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            flags = flood_history_flags((log.location.x, log.location.y) for log in logs)
+            batched = [flags[(log.location.x, log.location.y)] for log in logs]
+            t_batched = time.perf_counter() - t0
+
+            raise _Rollback((t_per_row, t_batched, per_row == batched, sum(batched)))
+    except _Rollback as done:
+        t_per_row, t_batched, identical, hits = done.args[0]
+
+    print(f"logs={n_logs} stations={n_stations} incidents={n_incidents} flagged={hits}")
+    print(f"per-row .exists(): {t_per_row:.3f}s")
+    print(f"batched join:      {t_batched:.3f}s  ({t_per_row / max(t_batched, 1e-9):.1f}x faster)")
+    print(f"{'✅' if identical else '❌'} flags identical: {identical}")
+    return {"per_row_s": t_per_row, "batched_s": t_batched, "identical": identical}
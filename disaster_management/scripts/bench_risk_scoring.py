@@ -0,0 +1,110 @@
+import time
+
+import numpy as np
+import pandas as pd
+
+from disaster_management.utils.risk_scoring import (
+    _normalize,
+    score_drought_arrays,
+    score_drought_df,
+    score_flood_arrays,
+    score_flood_df,
+)
+
+
+def _legacy_score_flood_df(df):
+    """Previous per-row implementation (Series.apply), kept for comparison."""
+    s24 = df["rainfall_recent_24h"].fillna(0)
+    s72 = df["rainfall_recent_72h"].fillna(0)
+    rain = df["rain_flag"].fillna(0)
+    anom = df["temp_anomaly"].fillna(0)
+    hist = df["flood_history"].fillna(0)
+    mult = df["flood_season_mult"].fillna(1.0)
+    raw = (0.35 * s24.apply(lambda v: _normalize(v, 0, 6))
+           + 0.25 * s72.apply(lambda v: _normalize(v, 0, 12))
+           + 0.20 * (rain.astype(float) * 0.6)
+           + 0.10 * (anom.apply(lambda v: _normalize(v, 0, 6)) * 0.3)
+           + 0.10 * (hist.astype(float) * 0.5))
+    return df.assign(flood_risk=(raw * mult).clip(0, 1))
+
+
+def _legacy_score_drought_df(df):
+    """Previous per-row implementation (Series.apply), kept for comparison."""
+    deficit = df["rain_deficit"].fillna(0)
+    temp = df["temperature"].fillna(0)
+    humid = df["humidity"].fillna(50)
+    anom = df["temp_anomaly"].fillna(0)
+    mult = df["drought_season_mult"].fillna(1.0)
+    raw = (0.45 * deficit.apply(lambda v: _normalize(v, 0, 5))
+           + 0.25 * temp.apply(lambda v: _normalize(v, 20, 38))
+           + 0.20 * humid.apply(lambda v: _normalize(60 - v, 0, 40))
+           + 0.10 * anom.apply(lambda v: _normalize(v, 0, 8)))
+    return df.assign(drought_risk=(raw * mult).clip(0, 1))
+
+
+def _synthetic(n, rng):
+    return pd.DataFrame({
+        "rainfall_recent_24h": rng.integers(0, 10, n),
+        "rainfall_recent_72h": rng.integers(0, 20, n),
+        "rain_flag": rng.integers(0, 2, n),
+        "temp_anomaly": rng.normal(1.0, 4.0, n),
+        "flood_history": rng.integers(0, 2, n),
+        "flood_season_mult": rng.choice([0.75, 0.85, 1.25], n),
+        "rain_deficit": rng.integers(0, 7, n),
+        "temperature": rng.normal(28.0, 6.0, n),
+        "humidity": rng.uniform(5.0, 100.0, n),
+        "drought_season_mult": rng.choice([0.75, 1.0, 1.25], n),
+    })
+
+
+def _timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def benchmark_risk_scoring(sizes=(1_000, 100_000, 1_000_000), seed=7):
+    """
+    Microbenchmark: legacy Series.apply scoring vs the NumPy kernels, at each size.
+    Also asserts the outputs are identical.
+
+        python manage.py shell -c "from disaster_management.scripts.bench_risk_scoring import benchmark_risk_scoring; benchmark_risk_scoring()"
+    """
+    rng = np.random.default_rng(seed)
+    report = []
+    print(f"{'rows':>10} {'hazard':>8} {'legacy':>10} {'df':>10} {'arrays':>10} {'speedup':>9}")
+    for n in sizes:
+        df = _synthetic(n, rng)
+
+        old_f, t_old_f = _timed(_legacy_score_flood_df, df)
+        new_f, t_new_f = _timed(score_flood_df, df)
+        _, t_arr_f = _timed(
+            score_flood_arrays,
+            df["rainfall_recent_24h"].to_numpy(), df["rainfall_recent_72h"].to_numpy(),
+            df["rain_flag"].to_numpy(), df["temp_anomaly"].to_numpy(),
+            df["flood_history"].to_numpy(), df["flood_season_mult"].to_numpy(),
+        )
+        assert np.array_equal(old_f["flood_risk"].to_numpy(), new_f["flood_risk"].to_numpy())
+
+        old_d, t_old_d = _timed(_legacy_score_drought_df, df)
+        new_d, t_new_d = _timed(score_drought_df, df)
+        _, t_arr_d = _timed(
+            score_drought_arrays,
+            df["rain_deficit"].to_numpy(), df["temperature"].to_numpy(), df["humidity"].to_numpy(),
+            df["temp_anomaly"].to_numpy(), df["drought_season_mult"].to_numpy(),
+        )
+        assert np.array_equal(old_d["drought_risk"].to_numpy(), new_d["drought_risk"].to_numpy())
+
+        for hazard, t_old, t_new, t_arr in (
+            ("flood", t_old_f, t_new_f, t_arr_f),
+            ("drought", t_old_d, t_new_d, t_arr_d),
+        ):
+            print(f"{n:>10} {hazard:>8} {t_old:>9.4f}s {t_new:>9.4f}s {t_arr:>9.4f}s {t_old / max(t_new, 1e-9):>8.1f}x")
+            report.append({"rows": n, "hazard": hazard, "legacy_s": t_old, "df_s": t_new, "arrays_s": t_arr})
+
+    print("✅ legacy and vectorized scores are identical")
+    return report
+
+
+if __name__ == "__main__":
+    benchmark_risk_scoring()
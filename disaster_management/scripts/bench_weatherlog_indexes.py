@@ -0,0 +1,115 @@
+import json
+import random
+from datetime import timedelta
+
+from django.contrib.gis.geos import Point
+from django.db import connection, transaction
+from django.utils import timezone
+
+from disaster_management.apps.weather.models import WeatherLog
+
+NEW_INDEXES = ("weatherlog_recorded_brin",)
+NEW_CONSTRAINTS = ("uniq_weatherlog_station_time_source",)   # its index serves (city_name, recorded_at)
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _queries(table, now):
+    """The WeatherLog windows the hourly/seasonal jobs actually run (see weather_snapshot, seasonal_anomaly, rainfall_climatology)."""
+    season_end = now.replace(month=4, day=1) if now.month >= 4 else now.replace(year=now.year - 1, month=4, day=1)
+    season_start = season_end.replace(year=season_end.year - 1, month=11)
+    return [
+        ("risk zones (2h window)",
+         f"SELECT id, temperature, condition FROM {table} WHERE recorded_at >= %s AND recorded_at <= %s",
+         [now - timedelta(hours=2), now]),
+        ("snapshot (7 days)",
+         f"SELECT id, temperature, condition FROM {table} WHERE recorded_at >= %s AND recorded_at <= %s "
+         f"ORDER BY recorded_at, id",
+         [now - timedelta(days=7), now]),
+        ("one city, 14 days",
+         f"SELECT COUNT(*) FROM {table} WHERE city_name = %s AND recorded_at >= %s AND recorded_at <= %s",
+         ["bench-0", now - timedelta(days=14), now]),
+        ("rainy season (Nov-Mar)",
+         f"SELECT city_name, COUNT(*) FROM {table} WHERE recorded_at >= %s AND recorded_at < %s GROUP BY city_name",
+         [season_start, season_end]),
+        ("within 5 km of Lusaka",
+         f"SELECT COUNT(*) FROM {table} WHERE ST_DWithin(location, ST_GeogFromText(%s), 5000)",
+         ["SRID=4326;POINT(28.3228 -15.3875)"]),
+    ]
+
+
+def _scan_nodes(plan):
+    """Scan node types in a JSON plan, e.g. ['Bitmap Index Scan on weatherlog_recorded_brin']."""
+    nodes = []
+    if "Scan" in plan["Node Type"]:
+        name = plan["Node Type"]
+        if plan.get("Index Name"):
+            name += f" on {plan['Index Name']}"
+        nodes.append(name)
+    for child in plan.get("Plans", []):
+        nodes.extend(_scan_nodes(child))
+    return nodes
+
+
+def _explain(cursor, sql, params):
+    cursor.execute(f"EXPLAIN (ANALYZE, FORMAT JSON) {sql}", params)
+    raw = cursor.fetchone()[0]
+    result = (json.loads(raw) if isinstance(raw, str) else raw)[0]
+    return _scan_nodes(result["Plan"]), result["Execution Time"]
+
+
+def benchmark_weatherlog_indexes(n_logs=500_000, n_stations=200, days=730, seed=42):
+    """
+    EXPLAIN ANALYZE the hourly and seasonal WeatherLog windows with and without
+    the (city_name, recorded_at, source) unique index and the recorded_at BRIN index, on
+    synthetic logs appended in time order (as ingestion does). Runs inside a
+    transaction that is rolled back (the DROP INDEX included), so it is safe on a
+    dev database. It does lock weather_weatherlog while it runs.
+
+        python manage.py shell -c "from disaster_management.scripts.bench_weatherlog_indexes import benchmark_weatherlog_indexes; benchmark_weatherlog_indexes()"
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    start = now - timedelta(days=days)
+    step = (now - start) / max(1, n_logs)
+    stations = [Point(rng.uniform(22.0, 33.7), rng.uniform(-18.0, -8.3), srid=4326) for _ in range(n_stations)]
+    table = connection.ops.quote_name(WeatherLog._meta.db_table)
+
+    try:
+        with transaction.atomic():
+            WeatherLog.objects.bulk_create([
+                WeatherLog(
+                    temperature=25.0, humidity=60.0, wind_speed=3.0, condition="rain" if i % 4 == 0 else "clear",
+                    location=stations[i % n_stations], city_name=f"bench-{i % n_stations}",
+                    recorded_at=start + step * i,
+                )
+                for i in range(n_logs)
+            ], batch_size=5000)
+
+            results = {}
+            with connection.cursor() as cursor:
+                cursor.execute(f"ANALYZE {table}")
+                for label, sql, params in _queries(table, now):
+                    results[label] = {"with": _explain(cursor, sql, params)}
+
+                cursor.execute("DROP INDEX " + ", ".join(NEW_INDEXES))
+                for name in NEW_CONSTRAINTS:
+                    cursor.execute(f"ALTER TABLE {table} DROP CONSTRAINT {name}")
+                cursor.execute(f"ANALYZE {table}")
+                for label, sql, params in _queries(table, now):
+                    results[label]["without"] = _explain(cursor, sql, params)
+
+            raise _Rollback(results)
+    except _Rollback as done:
+        results = done.args[0]
+
+    print(f"logs={n_logs} stations={n_stations} span={days} days")
+    for label, r in results.items():
+        (before_nodes, before_ms), (after_nodes, after_ms) = r["without"], r["with"]
+        print(f"\n{label}")
+        print(f"  without new indexes: {before_ms:9.2f} ms  {', '.join(before_nodes)}")
+        print(f"  with new indexes:    {after_ms:9.2f} ms  {', '.join(after_nodes)}"
+              f"  ({before_ms / max(after_ms, 1e-9):.1f}x)")
+    return results
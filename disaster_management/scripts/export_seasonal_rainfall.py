@@ -1,32 +1,24 @@
 import pandas as pd
-from django.utils import timezone
-from disaster_management.apps.weather.models import WeatherLog
-from collections import defaultdict
 
-def export_monthly_rainfall_csv(filename="seasonal_training_data.csv"):
-    logs = WeatherLog.objects.filter(recorded_at__year__gte=2018)
-    
-    data = defaultdict(lambda: defaultdict(int))  # {(city, year): {month: rain_days}}
+from disaster_management.utils.rainfall_climatology import climatology_frame
+
+SEASON_MONTHS = {12: "rain_dec", 1: "rain_jan", 2: "rain_feb", 3: "rain_mar"}
 
-    for log in logs:
-        month = log.recorded_at.month
-        if month in [12, 1, 2, 3]:
-            key = (log.city_name, log.recorded_at.year if month != 12 else log.recorded_at.year + 1)
-            if log.condition.lower() in ["rain", "storm"]:
-                data[key][month] += 1
+def export_monthly_rainfall_csv(filename="seasonal_training_data.csv"):
+    df = climatology_frame(months=SEASON_MONTHS, since_year=2018)
 
-    rows = []
-    for (city, year), months in data.items():
-        rows.append({
-            "city": city,
-            "year": year,
-            "rain_dec": months.get(12, 0),
-            "rain_jan": months.get(1, 0),
-            "rain_feb": months.get(2, 0),
-            "rain_mar": months.get(3, 0),
-            "season_label": ""  # You’ll fill this manually in Excel
-        })
+    # December belongs to the season that ends the following year
+    df["season_year"] = df["year"] + (df["month"] == 12).astype(int)
+    wide = (
+        df.pivot_table(index=["city", "season_year"], columns="month", values="rain_days", aggfunc="sum", fill_value=0)
+        .reindex(columns=list(SEASON_MONTHS), fill_value=0)
+        .rename(columns=SEASON_MONTHS)
+        .reset_index()
+        .rename(columns={"season_year": "year"})
+    )
+    wide.columns.name = None
+    wide["season_label"] = ""  # You’ll fill this manually in Excel
 
-    df = pd.DataFrame(rows)
-    df.to_csv(filename, index=False)
-    print(f"✅ Exported {len(df)} rows to {filename}")
+    wide = wide[["city", "year", "rain_dec", "rain_jan", "rain_feb", "rain_mar", "season_label"]]
+    wide.to_csv(filename, index=False)
+    print(f"✅ Exported {len(wide)} rows to {filename}")
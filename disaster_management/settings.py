@@ -217,6 +217,46 @@ CELERY_RESULT_BACKEND = 'redis://redis:6379/0'
 CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 
+# Optional gridded risk mode: flood/drought/heat scores on a fixed grid, stored as GeoTIFFs
+RISK_GRID_ENABLED = env.bool("RISK_GRID_ENABLED", default=False)
+RISK_GRID_RESOLUTION = env.float("RISK_GRID_RESOLUTION", default=0.05)  # degrees
+
+# Risk zones not refreshed within this many hours are expired (history is kept)
+RISK_ZONE_TTL_HOURS = env.int("RISK_ZONE_TTL_HOURS", default=6)
+
+# Weather ingestion (utils.weather_ingest): concurrent, rate-limited provider calls
+WEATHER_API_URL = env("WEATHER_API_URL", default="https://api.openweathermap.org/data/2.5/weather")
+WEATHER_INGEST_CONCURRENCY = env.int("WEATHER_INGEST_CONCURRENCY", default=32)
+WEATHER_INGEST_RATE = env.float("WEATHER_INGEST_RATE", default=10.0)  # requests/second, split across shards
+WEATHER_INGEST_BURST = env.int("WEATHER_INGEST_BURST", default=10)
+WEATHER_INGEST_TIMEOUT = env.float("WEATHER_INGEST_TIMEOUT", default=15.0)  # seconds per request
+WEATHER_SHARD_SIZE = env.int("WEATHER_SHARD_SIZE", default=250)  # stations per ingest shard task
+
+# Bulk exports: longer ranges (and GeoPackage) run as a background ExportJob
+EXPORT_STREAM_MAX_DAYS = env.int("EXPORT_STREAM_MAX_DAYS", default=31)
+# Export artifacts hold full dumps: kept outside MEDIA_ROOT, served only by the export views
+EXPORT_ROOT = env("EXPORT_ROOT", default=os.path.join(BASE_DIR, "private", "exports"))
+
+# Alert fan-out (bulk inserts + SMTP) runs on its own queue, away from forecasting workers
+CELERY_TASK_ROUTES = {
+    "disaster_management.apps.notifications.tasks.*": {"queue": "notifications"},
+}
+
+# Shared cache (Redis) so web + every Celery worker see the same entries
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.redis.RedisCache",
+        "LOCATION": env("REDIS_CACHE_URL", default="redis://redis:6379/1"),
+    }
+}
+
+# GraphQL subscriptions: websocket endpoint (asgi.py) fed by Redis pub/sub (utils.live_updates)
+GRAPHQL_WS_PATH = "/subscriptions/"
+LIVE_UPDATES_REDIS_URL = env("LIVE_UPDATES_REDIS_URL", default="redis://redis:6379/2")
+
+# Columnar WeatherLog snapshot shared by forecasting tasks within one beat cycle
+WEATHER_SNAPSHOT_TTL = 55 * 60  # seconds
+
 
 # Static files (CSS, JavaScript, Images)
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
@@ -7,11 +7,21 @@ from django.conf.urls.static import static
 from graphene_file_upload.django import FileUploadGraphQLView
 from graphql_jwt.decorators import jwt_cookie
 
+from disaster_management.apps.core.views import export_dataset, export_job, export_job_download, vector_tile
+
 urlpatterns = [
     path('admin/', admin.site.urls),
 
     # GraphQL endpoint
-    path("graphql/", csrf_exempt(FileUploadGraphQLView.as_view(graphiql=True)))
+    path("graphql/", csrf_exempt(FileUploadGraphQLView.as_view(graphiql=True))),
+
+    # Map layers as Mapbox Vector Tiles (PostGIS ST_AsMVT, cached)
+    path("tiles/<str:layer>/<int:z>/<int:x>/<int:y>.mvt", vector_tile, name="vector-tile"),
+
+    # Bulk exports: streamed geojson/csv, or background jobs (gpkg / long ranges)
+    path("exports/jobs/<int:job_id>/", export_job, name="export-job"),
+    path("exports/jobs/<int:job_id>/download/", export_job_download, name="export-job-download"),
+    path("exports/<str:dataset>.<str:fmt>", export_dataset, name="export-dataset"),
 ]
 
 # Serve media files in development
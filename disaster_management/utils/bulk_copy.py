@@ -0,0 +1,196 @@
+# forecasts/utils/bulk_copy.py
+from __future__ import annotations
+
+import io
+from datetime import date, datetime
+from itertools import islice
+from typing import Iterable, List, Mapping, NamedTuple, Optional, Sequence
+
+from django.contrib.gis.db.models import GeometryField
+from django.contrib.gis.geos import GEOSGeometry
+from django.db import connections, DEFAULT_DB_ALIAS, models, transaction
+from django.utils import timezone
+
+COPY_BATCH_SIZE = 10_000
+
+_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _copy_value(value) -> str:
+    """Serialise one Python value for PostgreSQL COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, GEOSGeometry):
+        return value.hexewkb.decode()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # raw (E)WKB from utils.geometry – PostGIS parses hex EWKB for geometry and geography
+        return bytes(value).hex()
+    if isinstance(value, models.Model):
+        return str(value.pk)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value).translate(_TEXT_ESCAPES)
+
+
+def _concrete_fields(model) -> List[models.Field]:
+    return [f for f in model._meta.concrete_fields if not f.primary_key]
+
+
+def _default_for(field: models.Field, now: datetime):
+    if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False):
+        return now
+    if field.has_default():
+        return field.get_default()
+    return None
+
+
+def _rows_to_copy_lines(fields: List[models.Field], rows: Iterable[Mapping], now: datetime):
+    for row in rows:
+        values = []
+        for f in fields:
+            if f.name in row:
+                value = row[f.name]
+            elif f.attname in row:
+                value = row[f.attname]
+            else:
+                value = _default_for(f, now)
+            values.append(_copy_value(value))
+        yield "\t".join(values) + "\n"
+
+
+def _instances(model, rows: List[Mapping]) -> list:
+    """Model instances for the non-COPY fallback; raw (E)WKB becomes GEOS (geometry fields reject bytes)."""
+    geo = {f.name for f in model._meta.concrete_fields if isinstance(f, GeometryField)}
+    return [
+        model(**{
+            name: GEOSGeometry(memoryview(value))
+            if name in geo and isinstance(value, (bytes, bytearray, memoryview)) else value
+            for name, value in row.items()
+        })
+        for row in rows
+    ]
+
+
+class UpsertResult(NamedTuple):
+    inserted: int
+    updated: int
+    skipped: int      # conflicting rows left untouched (DO NOTHING) or repeated within the input
+
+
+def copy_bulk_create(model, rows: Iterable[Mapping], batch_size: int = COPY_BATCH_SIZE,
+                     using: str = DEFAULT_DB_ALIAS) -> int:
+    """
+    Bulk insert plain dict rows ({field name or attname: value}) for `model`.
+    - PostgreSQL: streams batches through `COPY ... FROM STDIN` (psycopg2 copy_expert).
+      Geometry values may be GEOS objects or raw EWKB bytes (see utils.geometry).
+    - Other backends: falls back to `bulk_create` with model instances.
+    Missing fields get their auto_now/default value, like a normal save().
+    Returns the number of rows written.
+    """
+    connection = connections[using]
+    rows = iter(rows)
+
+    if connection.vendor != "postgresql":
+        written = 0
+        while batch := list(islice(rows, batch_size)):
+            model.objects.using(using).bulk_create(_instances(model, batch), batch_size=batch_size)
+            written += len(batch)
+        return written
+
+    fields = _concrete_fields(model)
+    qn = connection.ops.quote_name
+    sql = "COPY {table} ({columns}) FROM STDIN".format(
+        table=qn(model._meta.db_table),
+        columns=", ".join(qn(f.column) for f in fields),
+    )
+    now = timezone.now()
+    written = 0
+    with connection.cursor() as cursor:
+        while batch := list(islice(rows, batch_size)):
+            buf = io.StringIO()
+            buf.writelines(_rows_to_copy_lines(fields, batch, now))
+            buf.seek(0)
+            cursor.copy_expert(sql, buf)
+            written += len(batch)
+    return written
+
+
+def copy_bulk_upsert(model, rows: Iterable[Mapping], conflict_fields: Sequence[str],
+                     update_fields: Optional[Sequence[str]] = None, batch_size: int = COPY_BATCH_SIZE,
+                     using: str = DEFAULT_DB_ALIAS) -> UpsertResult:
+    """
+    Idempotent variant of copy_bulk_create for a model with a unique constraint on
+    `conflict_fields`.
+    - PostgreSQL: each batch is COPY'd into a temp staging table, then moved with
+      `INSERT ... SELECT DISTINCT ON (conflict) ... ON CONFLICT (conflict)
+      DO NOTHING` (or `DO UPDATE SET` the `update_fields`).
+    - Other backends: bulk_create(ignore_conflicts / update_conflicts); counts
+      come from the table size before and after.
+    Returns inserted / updated / skipped counts.
+    """
+    connection = connections[using]
+    rows = iter(rows)
+    fields = _concrete_fields(model)
+    by_name = {f.name: f for f in fields}
+    conflict = [by_name[name] for name in conflict_fields]
+    updates = [by_name[name] for name in (update_fields or ())]
+
+    if connection.vendor != "postgresql":
+        inserted = updated = skipped = 0
+        manager = model.objects.using(using)
+        while batch := list(islice(rows, batch_size)):
+            before = manager.count()
+            options = (
+                {"update_conflicts": True, "unique_fields": list(conflict_fields), "update_fields": list(update_fields)}
+                if updates else {"ignore_conflicts": True}
+            )
+            manager.bulk_create(_instances(model, batch), batch_size=batch_size, **options)
+            new = manager.count() - before
+            inserted += new
+            if updates:
+                updated += len(batch) - new
+            else:
+                skipped += len(batch) - new
+        return UpsertResult(inserted, updated, skipped)
+
+    qn = connection.ops.quote_name
+    table = qn(model._meta.db_table)
+    staging = qn(f"{model._meta.db_table}_staging")
+    columns = ", ".join(qn(f.column) for f in fields)
+    keys = ", ".join(qn(f.column) for f in conflict)
+    if updates:
+        action = "UPDATE SET " + ", ".join(f"{qn(f.column)} = EXCLUDED.{qn(f.column)}" for f in updates)
+    else:
+        action = "NOTHING"
+    # xmax = 0 only on freshly inserted tuples; updated ones carry the updating xid
+    upsert_sql = (
+        f"INSERT INTO {table} ({columns}) "
+        f"SELECT DISTINCT ON ({keys}) {columns} FROM {staging} ORDER BY {keys} "
+        f"ON CONFLICT ({keys}) DO {action} "
+        f"RETURNING (xmax = 0) AS inserted"
+    )
+
+    now = timezone.now()
+    inserted = updated = skipped = 0
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        # Inside an outer atomic() this block is only a savepoint, so an earlier call in
+        # the same transaction may have left the table behind: reuse it, emptied
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {staging} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA"
+        )
+        cursor.execute(f"TRUNCATE {staging}")
+        while batch := list(islice(rows, batch_size)):
+            buf = io.StringIO()
+            buf.writelines(_rows_to_copy_lines(fields, batch, now))
+            buf.seek(0)
+            cursor.copy_expert(f"COPY {staging} ({columns}) FROM STDIN", buf)
+            cursor.execute(upsert_sql)
+            flags = [row[0] for row in cursor.fetchall()]
+            new = sum(flags)
+            inserted += new
+            updated += len(flags) - new
+            skipped += len(batch) - len(flags)
+            cursor.execute(f"TRUNCATE {staging}")
+    return UpsertResult(inserted, updated, skipped)
@@ -1,4 +1,5 @@
 import math
+import numpy as np
 import pandas as pd
 from dataclasses import dataclass
 from datetime import timedelta
@@ -21,23 +22,6 @@ MONTHLY_TEMP_BASELINE: Dict[int, int] = {
 }
 
 
-ZAMBIA_COORDINATES = [
-    {"city": "Lusaka", "lat": -15.3875, "lon": 28.3228},
-    {"city": "Ndola", "lat": -12.9587, "lon": 28.6366},
-    {"city": "Kitwe", "lat": -12.8156, "lon": 28.2132},
-    {"city": "Livingstone", "lat": -17.8572, "lon": 25.8567},
-    {"city": "Chipata", "lat": -13.6367, "lon": 32.6455},
-    {"city": "Kasama", "lat": -10.2129, "lon": 31.1800},
-    {"city": "Mansa", "lat": -11.1998, "lon": 28.8943},
-    {"city": "Solwezi", "lat": -12.1833, "lon": 26.4000},
-    {"city": "Choma", "lat": -16.8122, "lon": 26.9833},
-    {"city": "Mongu", "lat": -15.2796, "lon": 23.1274},
-    {"city": "Kabwe", "lat": -14.4469, "lon": 28.4464},
-    {"city": "Mazabuka", "lat": -15.8580, "lon": 27.7485},
-    {"city": "Siavonga", "lat": -16.5380, "lon": 28.7087},
-    {"city": "Mpika", "lat": -11.8366, "lon": 31.4521},
-]
-
 def get_season(month: int) -> str:
     if month in RAINY_SEASON_MONTHS:
         return "rainy"
@@ -68,13 +52,17 @@ SEASON_CONFIG = {
 }
 
 
+RAIN_CONDITIONS = {"rain", "storm", "thunderstorm", "showers"}
+# DB-side equivalent used by aggregate queries (case-insensitive `~*` match on condition)
+RAIN_REGEX = r"(rain|storm|showers|thunder)"
+
+
 def _rain_indicator(log: "WeatherLog") -> int:
-    """
-    Binary rain flag. Prefer numeric `rainfall_mm` if available:
-    return 1 if (getattr(log, "rainfall_mm", 0) or 0) > 0 else 0
-    """
+    """Binary rain flag: measured `rainfall_mm` > 0, or a rain-like condition label."""
+    if (getattr(log, "rainfall_mm", None) or 0) > 0:
+        return 1
     cond = (getattr(log, "condition", "") or "").strip().lower()
-    return 1 if cond in {"rain", "storm", "thunderstorm", "showers"} else 0
+    return 1 if cond in RAIN_CONDITIONS else 0
 
 
 def _temp_anomaly(temp: float | None, month: int) -> float:
@@ -83,30 +71,34 @@ def _temp_anomaly(temp: float | None, month: int) -> float:
         return 0.0
     return float(temp - baseline)
 
-def _recent_rain_counts(now=None, *, window_hours: int = 24) -> Dict[Tuple[float, float], int]:
+_BASELINE_BY_MONTH = np.array([MONTHLY_TEMP_BASELINE.get(m, np.nan) for m in range(13)], dtype=float)
+
+def temp_anomaly_array(temps, months) -> np.ndarray:
+    """Vectorized `_temp_anomaly`: temp minus the month's baseline, 0.0 where either is missing."""
+    temps = np.asarray(temps, dtype=float)
+    baseline = _BASELINE_BY_MONTH[np.asarray(months, dtype=np.intp)]
+    return np.where(np.isnan(baseline) | np.isnan(temps), 0.0, temps - baseline)
+
+def _recent_rain_counts(now=None, *, window_hours: int = 24, snapshot=None) -> Dict[Tuple[float, float], int]:
     """
     Precompute { (lat, lon) rounded key : rain_count } for the last `window_hours`.
     Keys are rounded to 2 decimal places to form ~local buckets.
+    Reads the shared WeatherLog snapshot (pass one in to reuse it across calls).
     """
-    from disaster_management.apps.weather.models import WeatherLog as _WL  # local import
+    from disaster_management.utils.weather_snapshot import get_weather_snapshot  # local import
     if now is None:
         now = timezone.now()
-    since = now - timedelta(hours=window_hours)
-    qs = (
-        _WL.objects
-        .filter(recorded_at__gte=since)
-        .only("location", "condition")
-    )
-
-    buckets: Dict[Tuple[float, float], int] = {}
-    for log in qs:
-        if not getattr(log, "location", None):
-            continue
-        lat = round(log.location.y, 2)
-        lon = round(log.location.x, 2)
-        key = (lat, lon)
-        buckets[key] = buckets.get(key, 0) + _rain_indicator(log)
-    return buckets
+    if snapshot is None:
+        snapshot = get_weather_snapshot(now)
+    recent = snapshot.since(now - timedelta(hours=window_hours))
+    if recent.empty:
+        return {}
+
+    lat = recent.rounded(recent.lat, 2)
+    lon = recent.rounded(recent.lon, 2)
+    keys, inverse = np.unique(np.column_stack([lat, lon]), axis=0, return_inverse=True)
+    counts = np.bincount(inverse.ravel(), weights=recent.rain, minlength=len(keys))
+    return {(float(k[0]), float(k[1])): int(c) for k, c in zip(keys, counts)}
 
 
 ZAMBIA_CITIES = [
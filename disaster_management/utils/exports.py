@@ -0,0 +1,232 @@
+# forecasts/utils/exports.py
+from __future__ import annotations
+
+import csv
+import io
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+import fiona
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+
+from disaster_management.apps.forecasting.models import ForecastModel, ForecastResult
+from disaster_management.apps.incidents.models import Incident, IncidentType
+from disaster_management.apps.weather.models import RiskZone, RiskZoneHistory, WeatherLog
+
+EXPORT_FORMATS = ("geojson", "csv", "gpkg")
+STREAM_FORMATS = ("geojson", "csv")           # gpkg needs a seekable file → background job only
+FETCH_SIZE = 5_000                            # rows per server-side cursor round trip
+CONTENT_TYPES = {
+    "geojson": "application/geo+json",
+    "csv": "text/csv",
+    "gpkg": "application/geopackage+sqlite3",
+}
+
+
+class ExportDataset(NamedTuple):
+    from_sql: str                               # FROM/JOIN clause; `t` is the main table
+    time_column: str                            # range filter + ordering
+    geometry: str                               # geography column
+    geometry_type: str                          # fiona schema geometry
+    fields: Tuple[Tuple[str, str, str], ...]    # (name, SQL expression, fiona type)
+
+
+def _t(model) -> str:
+    return connection.ops.quote_name(model._meta.db_table)
+
+
+def _datasets() -> Dict[str, ExportDataset]:
+    return {
+        "incidents": ExportDataset(
+            f"{_t(Incident)} t JOIN {_t(IncidentType)} it ON it.id = t.incident_type_id",
+            "t.reported_at", "t.location", "Point",
+            (
+                ("id", "t.id", "int"),
+                ("incident_type", "it.name", "str"),
+                ("status", "t.status", "str"),
+                ("source", "t.incident_source", "str"),
+                ("verified", "t.verified", "bool"),
+                ("risk_score", "t.risk_score::float", "float"),
+                ("risk_label", "t.risk_label", "str"),
+                ("description", "t.description", "str"),
+                ("reported_at", "t.reported_at", "datetime"),
+            ),
+        ),
+        "forecasts": ExportDataset(
+            f"{_t(ForecastResult)} t JOIN {_t(ForecastModel)} m ON m.id = t.model_id",
+            "t.predicted_at", "t.affected_area", "Polygon",
+            (
+                ("id", "t.id", "int"),
+                ("model", "m.name", "str"),
+                ("model_type", "m.model_type", "str"),
+                ("forecast_date", "t.forecast_date", "date"),
+                ("predicted_at", "t.predicted_at", "datetime"),
+                ("area_name", "t.area_name", "str"),
+                ("risk_level", "t.risk_level", "str"),
+                ("confidence", "t.confidence", "float"),
+                ("details", "t.details", "str"),
+            ),
+        ),
+        "weather_logs": ExportDataset(
+            f"{_t(WeatherLog)} t",
+            "t.recorded_at", "t.location", "Point",
+            (
+                ("id", "t.id", "int"),
+                ("city_name", "t.city_name", "str"),
+                ("temperature", "t.temperature", "float"),
+                ("humidity", "t.humidity", "float"),
+                ("wind_speed", "t.wind_speed", "float"),
+                ("condition", "t.condition", "str"),
+                ("rainfall_mm", "t.rainfall_mm", "float"),
+                ("pressure", "t.pressure", "float"),
+                ("clouds", "t.clouds", "float"),
+                ("visibility", "t.visibility", "float"),
+                ("source", "t.source", "str"),
+                ("recorded_at", "t.recorded_at", "datetime"),
+            ),
+        ),
+        "risk_zones": ExportDataset(
+            f"{_t(RiskZone)} t",
+            "t.calculated_at", "t.geometry", "Polygon",
+            (
+                ("id", "t.id", "int"),
+                ("zone_name", "t.zone_name", "str"),
+                ("risk_level", "t.risk_level", "str"),
+                ("calculated_at", "t.calculated_at", "datetime"),
+            ),
+        ),
+        "risk_zone_history": ExportDataset(
+            f"{_t(RiskZoneHistory)} t",
+            "t.calculated_at", "t.geometry", "Polygon",
+            (
+                ("id", "t.id", "int"),
+                ("zone_key", "t.zone_key", "str"),
+                ("zone_name", "t.zone_name", "str"),
+                ("previous_level", "t.previous_level", "str"),
+                ("risk_level", "t.risk_level", "str"),
+                ("calculated_at", "t.calculated_at", "datetime"),
+            ),
+        ),
+    }
+
+
+EXPORT_DATASETS = ("incidents", "forecasts", "weather_logs", "risk_zones", "risk_zone_history")
+
+
+def field_names(dataset: str) -> List[str]:
+    return [name for name, _, _ in _datasets()[dataset].fields]
+
+
+def iter_rows(dataset: str, start: datetime, end: datetime, geometry: str = "geojson",
+              fetch_size: int = FETCH_SIZE) -> Iterator[List[tuple]]:
+    """
+    Rows of `dataset` with time in [start, end), in batches of `fetch_size`, from a
+    server-side cursor: memory stays flat however large the range. The last column
+    is the geometry, serialised by PostGIS (`geojson` → ST_AsGeoJSON, `wkt` → ST_AsText).
+    """
+    spec = _datasets()[dataset]
+    geom_sql = {
+        "geojson": f"ST_AsGeoJSON({spec.geometry}::geometry, 6)",
+        "wkt": f"ST_AsText({spec.geometry}::geometry)",
+    }[geometry]
+    columns = ", ".join(f"{expr} AS {name}" for name, expr, _ in spec.fields)
+    sql = (
+        f"SELECT {columns}, {geom_sql} FROM {spec.from_sql} "
+        f"WHERE {spec.time_column} >= %(start)s AND {spec.time_column} < %(end)s "
+        f"ORDER BY {spec.time_column}, t.id"
+    )
+    with connection.chunked_cursor() as cursor:
+        cursor.execute(sql, {"start": start, "end": end})
+        while True:
+            rows = cursor.fetchmany(fetch_size)
+            if not rows:
+                break
+            yield rows
+
+
+# --------------- Writers ----------------
+def stream_geojson(dataset: str, batches: Iterable[List[tuple]]) -> Iterator[bytes]:
+    """FeatureCollection as byte chunks; PostGIS geometry JSON is spliced in without re-parsing."""
+    names = field_names(dataset)
+    yield b'{"type": "FeatureCollection", "features": ['
+    first = True
+    for rows in batches:
+        parts = []
+        for row in rows:
+            props = json.dumps(dict(zip(names, row[:-1])), cls=DjangoJSONEncoder)
+            feature = f'{{"type": "Feature", "id": {row[0]}, "geometry": {row[-1] or "null"}, "properties": {props}}}'
+            parts.append(feature if first else "," + feature)
+            first = False
+        yield "\n".join(parts).encode()
+    yield b"]}\n"
+
+
+def stream_csv(dataset: str, batches: Iterable[List[tuple]]) -> Iterator[bytes]:
+    """CSV (header + one chunk per cursor batch); geometry as WKT."""
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(field_names(dataset) + ["wkt"])
+    for rows in batches:
+        writer.writerows(rows)
+        yield buf.getvalue().encode()
+        buf.seek(0)
+        buf.truncate()
+    yield buf.getvalue().encode()
+
+
+STREAMERS = {"geojson": (stream_geojson, "geojson"), "csv": (stream_csv, "wkt")}
+
+
+def stream_export(dataset: str, fmt: str, start: datetime, end: datetime) -> Iterator[bytes]:
+    """Byte chunks of a geojson/csv export, for StreamingHttpResponse."""
+    writer, geometry = STREAMERS[fmt]
+    return writer(dataset, iter_rows(dataset, start, end, geometry=geometry))
+
+
+def write_geopackage(path: str, dataset: str, batches: Iterable[List[tuple]]) -> None:
+    """GeoPackage via fiona (one layer named after the dataset)."""
+    spec = _datasets()[dataset]
+    schema = {
+        "geometry": spec.geometry_type,
+        "properties": {name: ftype for name, _, ftype in spec.fields},
+    }
+    temporal = {name for name, _, ftype in spec.fields if ftype in ("date", "datetime")}
+    with fiona.open(path, "w", driver="GPKG", layer=dataset, schema=schema, crs="EPSG:4326") as dst:
+        for rows in batches:
+            dst.writerecords(
+                {
+                    "geometry": json.loads(row[-1]) if row[-1] else None,
+                    "properties": {
+                        name: (value.isoformat() if name in temporal and value is not None else value)
+                        for name, value in zip(schema["properties"], row[:-1])
+                    },
+                }
+                for row in rows
+            )
+
+
+def write_export(path: str, dataset: str, fmt: str, start: datetime, end: datetime) -> int:
+    """Write a full export to `path` (background jobs). Returns the row count."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    count = 0
+
+    def counted(batches):
+        nonlocal count
+        for rows in batches:
+            count += len(rows)
+            yield rows
+
+    if fmt == "gpkg":
+        if os.path.exists(path):
+            os.remove(path)
+        write_geopackage(path, dataset, counted(iter_rows(dataset, start, end, geometry="geojson")))
+        return count
+
+    writer, geometry = STREAMERS[fmt]
+    with open(path, "wb") as fh:
+        for chunk in writer(dataset, counted(iter_rows(dataset, start, end, geometry=geometry))):
+            fh.write(chunk)
+    return count
@@ -1,16 +1,76 @@
 # forecasts/utils/feature_extraction.py
 import pandas as pd
 from datetime import timedelta
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+from django.db import connection
 from django.utils import timezone
 
-from disaster_management.apps.weather.models import HistoricalIncident, WeatherLog
-from disaster_management.utils.climate_constants import SEASON_CONFIG, _lusaka_month, _rain_indicator, _recent_rain_counts, _temp_anomaly, get_season
+from disaster_management.apps.weather.models import HistoricalIncident
+from disaster_management.utils.climate_constants import MONTHLY_TEMP_BASELINE, SEASON_CONFIG, _lusaka_month, _recent_rain_counts, get_season
+from disaster_management.utils.weather_snapshot import WeatherSnapshot, get_weather_snapshot
+
+
+
+FLOOD_HISTORY_RADIUS_M = 5_000.0
+
+# Set-based spatial join: one row per distinct observation point, flagged when any
+# flood incident lies within `radius` metres. ST_DWithin (with 1 m slack) lets the
+# GiST index on location prune candidates; the ST_Distance check is the exact
+# predicate Django emits for `location__distance_lte` on geography columns, so the
+# flags are identical to the per-row `.exists()` lookups this replaces.
+_FLOOD_HISTORY_SQL = """
+    SELECT p.lon, p.lat
+    FROM unnest(%(lons)s::double precision[], %(lats)s::double precision[]) AS p(lon, lat)
+    WHERE EXISTS (
+        SELECT 1
+        FROM {table} h
+        WHERE UPPER(h.incident_type::text) LIKE UPPER(%(pattern)s)
+          AND ST_DWithin(h.location, ST_SetSRID(ST_MakePoint(p.lon, p.lat), 4326)::geography, %(slack)s)
+          AND ST_Distance(h.location, ST_SetSRID(ST_MakePoint(p.lon, p.lat), 4326)::geography) <= %(radius)s
+          {as_of_filter}
+    )
+"""
+
+
+def flood_history_flags(
+    points: Iterable[Tuple[float, float]],
+    radius_m: float = FLOOD_HISTORY_RADIUS_M,
+    as_of=None,
+) -> Dict[Tuple[float, float], bool]:
+    """
+    Batched flood-history lookup.
+    Takes (lon, lat) pairs and returns { (lon, lat): bool } telling whether a
+    flood HistoricalIncident lies within `radius_m` metres of each point.
+    Points are de-duplicated first (stations repeat every hour), then answered
+    with a single spatial join instead of one `.exists()` query per log.
+    With `as_of`, only incidents that had occurred by then count (replays).
+    """
+    unique = list(dict.fromkeys((float(lon), float(lat)) for lon, lat in points))
+    if not unique:
+        return {}
+
+    sql = _FLOOD_HISTORY_SQL.format(
+        table=connection.ops.quote_name(HistoricalIncident._meta.db_table),
+        as_of_filter="AND h.occurred_at <= %(as_of)s" if as_of is not None else "",
+    )
+    params = {
+        "lons": [lon for lon, _ in unique],
+        "lats": [lat for _, lat in unique],
+        "pattern": "%flood%",
+        "slack": float(radius_m) + 1.0,
+        "radius": float(radius_m),
+        "as_of": as_of,
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        hits = {(float(lon), float(lat)) for lon, lat in cursor.fetchall()}
 
-from django.contrib.gis.measure import D
+    return {pt: pt in hits for pt in unique}
 
 
 # --------------- Flood features ----------------
-def extract_flood_features() -> pd.DataFrame:
+def extract_flood_features(snapshot: Optional[WeatherSnapshot] = None, as_of=None) -> pd.DataFrame:
     """
     Season-aware features for flood prediction.
     Adds:
@@ -18,129 +78,108 @@ def extract_flood_features() -> pd.DataFrame:
       - rainfall_recent_24h / 72h counts (localized)
       - temperature anomaly vs monthly baseline
       - flood_history within 5km
+    Reads the shared WeatherLog snapshot; `point_lon`/`point_lat` carry the
+    observation point. `as_of` evaluates the features at a past instant (default: now).
     """
-    now = timezone.now()
+    now = as_of or timezone.now()
     month = _lusaka_month(now)  # use Africa/Lusaka
     season = get_season(month)
     weights = SEASON_CONFIG[season]
 
-    past_24h = now - timedelta(hours=24)
+    if snapshot is None:
+        snapshot = get_weather_snapshot(now)
 
     # Precompute localized rainfall counts for 24h and 72h
-    rain24 = _recent_rain_counts(now, window_hours=24)
-    rain72 = _recent_rain_counts(now, window_hours=72)
+    rain24 = _recent_rain_counts(now, window_hours=24, snapshot=snapshot)
+    rain72 = _recent_rain_counts(now, window_hours=72, snapshot=snapshot)
 
-    logs = (
-        WeatherLog.objects
-        .filter(recorded_at__gte=past_24h)
-        .only("location", "condition", "temperature", "humidity", "wind_speed", "recorded_at")
-    )
-
-    rows = []
-    for log in logs:
-        if not getattr(log, "location", None):
-            continue
-
-        # localized bucket
-        lat2 = round(log.location.y, 2)
-        lon2 = round(log.location.x, 2)
-        key = (lat2, lon2)
-
-        flood_history_exists = HistoricalIncident.objects.filter(
-            incident_type__icontains="flood",
-            location__distance_lte=(log.location, D(m=5000)),
-        ).exists()
+    logs = snapshot.since(now - timedelta(hours=24))
+    if logs.empty:
+        return pd.DataFrame()
 
-        rain_flag = _rain_indicator(log)
-        temp_anom = _temp_anomaly(getattr(log, "temperature", None), month)
+    # Flood history within 5km for every observation point in one spatial join
+    history = flood_history_flags(zip(logs.lon.tolist(), logs.lat.tolist()), as_of=as_of)
 
-        # Season-aware engineered features
-        rainfall_recent_24h = rain24.get(key, 0)
-        rainfall_recent_72h = rain72.get(key, 0)
+    # localized bucket
+    keys = list(zip(logs.rounded(logs.lat, 2).tolist(), logs.rounded(logs.lon, 2).tolist()))
 
-        rows.append({
-            # raw weather
-            "temperature": log.temperature,
-            "humidity": log.humidity,
-            "wind_speed": log.wind_speed,
-            "rain_flag": rain_flag,
+    baseline = MONTHLY_TEMP_BASELINE.get(month)
+    temp_anom = logs.temperature - baseline if baseline is not None else np.zeros(len(logs))
 
-            # engineered
-            "temp_anomaly": temp_anom,
-            "rainfall_recent_24h": rainfall_recent_24h,
-            "rainfall_recent_72h": rainfall_recent_72h,
-            "flood_history": 1 if flood_history_exists else 0,
+    return pd.DataFrame({
+        # raw weather
+        "temperature": logs.temperature,
+        "humidity": logs.humidity,
+        "wind_speed": logs.wind_speed,
+        "rain_flag": logs.rain.astype(int),
 
-            # season signals
-            "season": season,
-            "flood_season_mult": weights.flood_mult,
+        # engineered
+        "temp_anomaly": temp_anom,
+        "rainfall_recent_24h": [rain24.get(key, 0) for key in keys],
+        "rainfall_recent_72h": [rain72.get(key, 0) for key in keys],
+        "flood_history": [1 if history.get(pt, False) else 0 for pt in zip(logs.lon.tolist(), logs.lat.tolist())],
 
-            # context
-            "location": log.location,
-            "timestamp": log.recorded_at,
-        })
+        # season signals
+        "season": season,
+        "flood_season_mult": weights.flood_mult,
 
-    return pd.DataFrame(rows)
+        # context
+        "point_lon": logs.lon,
+        "point_lat": logs.lat,
+        "timestamp": logs.timestamps(),
+    })
 
 
 
 # --------------- Drought features ----------------
-def extract_drought_features() -> pd.DataFrame:
+def extract_drought_features(snapshot: Optional[WeatherSnapshot] = None, as_of=None) -> pd.DataFrame:
     """
     Season-aware aggregation for drought assessment.
     Adds:
       - season label & multipliers
       - 7-day rain count vs expected per season (rain_deficit)
       - mean temp/humidity, temp anomaly
-      - representative point per ~0.1° grid cell
+      - representative point per ~0.1° grid cell (point_lon / point_lat)
+    `as_of` evaluates the features at a past instant (default: now).
     """
-    now = timezone.now()
+    now = as_of or timezone.now()
     past_7_days = now - timedelta(days=7)
 
-    logs = (
-        WeatherLog.objects
-        .filter(recorded_at__gte=past_7_days)
-        .only("location", "condition", "temperature", "humidity", "recorded_at")
-    )
+    if snapshot is None:
+        snapshot = get_weather_snapshot(now)
+    logs = snapshot.since(past_7_days)
 
     # No data
-    if not logs:
+    if logs.empty:
         return pd.DataFrame()
 
     # Determine the most frequent Lusaka-local month across the 7-day window
-    months = [_lusaka_month(log.recorded_at) for log in logs if getattr(log, "recorded_at", None)]
-    month = max(set(months), key=months.count) if months else _lusaka_month(now)
+    month = int(np.bincount(logs.local_month, minlength=13).argmax())
     season = get_season(month)
     weights = SEASON_CONFIG[season]
 
+    baseline = MONTHLY_TEMP_BASELINE.get(month)
+    temp_anom = logs.temperature - baseline if baseline is not None else np.zeros(len(logs))
+
     # Accumulate per ~region (0.1° grid)
-    data = []
-    for log in logs:
-        if not getattr(log, "location", None):
-            continue
-        lat = round(log.location.y, 1)
-        lon = round(log.location.x, 1)
-        rain = _rain_indicator(log)
-        data.append({
-            "lat": lat,
-            "lon": lon,
-            "temperature": log.temperature,
-            "humidity": log.humidity,
-            "rain": rain,
-            "temp_anomaly": _temp_anomaly(getattr(log, "temperature", None), month),
-            "location": log.location,
-        })
-
-    df = pd.DataFrame(data)
-    if df.empty:
-        return pd.DataFrame()
+    df = pd.DataFrame({
+        "lat": logs.rounded(logs.lat, 1),
+        "lon": logs.rounded(logs.lon, 1),
+        "temperature": logs.temperature,
+        "humidity": logs.humidity,
+        "rain": logs.rain.astype(int),
+        "temp_anomaly": temp_anom,
+        "point_lon": logs.lon,
+        "point_lat": logs.lat,
+    })
 
     grouped = df.groupby(["lat", "lon"]).agg({
         "temperature": "mean",
         "humidity": "mean",
         "rain": "sum",
         "temp_anomaly": "mean",
-        "location": "first",  # representative point
+        "point_lon": "first",  # representative point
+        "point_lat": "first",
     }).reset_index()
 
     # Season-aware drought features
@@ -0,0 +1,95 @@
+# forecasts/utils/geometry.py
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, Sequence, Union
+
+import numpy as np
+from django.contrib.gis.geos import GEOSGeometry
+
+ArrayLike = Union[float, Sequence[float], np.ndarray]
+
+METERS_PER_DEG_LAT = 111_320.0
+DEFAULT_QUADSEGS = 8   # GEOS default → 32-segment circle, 33 ring vertices
+WGS84_SRID = 4326
+
+_WKB_POLYGON = 3
+_EWKB_SRID_FLAG = 0x20000000
+
+
+def degree_buffer_for_meters(lat_deg: ArrayLike, meters: ArrayLike):
+    """
+    Approximate a degree radius on WGS84 to get about `meters` radius on Earth.
+    Uses latitude to adjust longitudinal scale and returns the smaller of the two
+    degree radii (GEOS buffers in planar degrees). Accepts scalars or arrays.
+    """
+    lat = np.asarray(lat_deg, dtype=float)
+    m = np.asarray(meters, dtype=float)
+    meters_per_deg_lon = METERS_PER_DEG_LAT * np.maximum(0.1, np.cos(np.radians(lat)))  # guard near poles
+    deg = np.minimum(m / METERS_PER_DEG_LAT, m / meters_per_deg_lon)
+    return float(deg) if deg.ndim == 0 else deg
+
+
+@lru_cache(maxsize=8)
+def _unit_circle(quadsegs: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Cached unit-circle template with the same vertex order GEOS uses for
+    `point.buffer(r, quadsegs)`: start due east, walk clockwise.
+    """
+    n = 4 * quadsegs
+    angles = np.arange(n) * (np.pi / (2 * quadsegs))
+    return np.cos(angles), np.sin(angles)
+
+
+def footprint_rings(lons: ArrayLike, lats: ArrayLike, meters: ArrayLike,
+                    quadsegs: int = DEFAULT_QUADSEGS) -> np.ndarray:
+    """
+    Closed circular rings for every (lon, lat) in one pass.
+    Returns shape (n, 4*quadsegs + 1, 2); identical vertices to
+    `Point(lon, lat).buffer(degree_buffer_for_meters(lat, meters))`.
+    """
+    lon = np.atleast_1d(np.asarray(lons, dtype=float))
+    lat = np.atleast_1d(np.asarray(lats, dtype=float))
+    radius = np.broadcast_to(degree_buffer_for_meters(lat, meters), lat.shape)
+    cos_t, sin_t = _unit_circle(quadsegs)
+
+    rings = np.empty((lon.shape[0], cos_t.shape[0] + 1, 2))
+    rings[:, :-1, 0] = lon[:, None] + radius[:, None] * cos_t
+    rings[:, :-1, 1] = lat[:, None] - radius[:, None] * sin_t
+    rings[:, -1] = rings[:, 0]
+    return rings
+
+
+def footprint_wkb(lons: ArrayLike, lats: ArrayLike, meters: ArrayLike,
+                  quadsegs: int = DEFAULT_QUADSEGS, srid: int = WGS84_SRID) -> List[bytes]:
+    """
+    Footprint polygons serialised straight to little-endian EWKB (with SRID),
+    without touching GEOS. Feed to `GEOSGeometry`, the ORM or a COPY stream.
+    """
+    return rings_wkb(footprint_rings(lons, lats, meters, quadsegs), srid)
+
+
+def rings_wkb(rings: np.ndarray, srid: int = WGS84_SRID) -> List[bytes]:
+    """EWKB polygons for rings of shape (n, points, 2), e.g. from `footprint_rings`."""
+    n, n_points, _ = rings.shape
+    if n == 0:
+        return []
+
+    header = (
+        np.array([1], dtype="u1").tobytes()
+        + np.array([_WKB_POLYGON | _EWKB_SRID_FLAG, srid, 1, n_points], dtype="<u4").tobytes()
+    )
+    body = np.ascontiguousarray(rings, dtype="<f8").reshape(n, -1).view(np.uint8)
+    buf = np.concatenate([np.tile(np.frombuffer(header, dtype=np.uint8), (n, 1)), body], axis=1)
+    return [row.tobytes() for row in buf]
+
+
+def footprint_polygons(lons: ArrayLike, lats: ArrayLike, meters: ArrayLike,
+                       quadsegs: int = DEFAULT_QUADSEGS, srid: int = WGS84_SRID) -> List[GEOSGeometry]:
+    """GEOS polygons for ORM writes, built from `footprint_wkb` (no per-row buffer op)."""
+    return [GEOSGeometry(memoryview(wkb)) for wkb in footprint_wkb(lons, lats, meters, quadsegs, srid)]
+
+
+def footprint_polygon(lon: float, lat: float, meters: float) -> GEOSGeometry:
+    """Single-point convenience wrapper around `footprint_polygons`."""
+    return footprint_polygons([lon], [lat], meters)[0]
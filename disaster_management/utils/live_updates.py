@@ -0,0 +1,153 @@
+# forecasts/utils/live_updates.py
+"""
+Live deltas for GraphQL subscriptions, over Redis pub/sub.
+
+Writers (mutations, signals, Celery tasks) `publish` small JSON deltas to
+`live:<topic>` once their transaction commits. Each ASGI process keeps ONE
+pattern subscription to `live:*` and fans messages out to the in-process
+queues of its open subscriptions, so Redis and the database see no extra load
+per connected dashboard.
+
+Topics:
+  incidents                  {"op": "upsert"|"delete", "id": ..., ...}
+  risk_zones                 {"op": "upsert"|"delete", "zone_key": ..., ...}
+  notifications:<user id>    one UserNotification for that user
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Iterable, Set
+
+import redis
+import redis.asyncio as aioredis
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+
+log = logging.getLogger(__name__)
+
+CHANNEL_PREFIX = "live"
+QUEUE_SIZE = 256            # per subscription; a client this far behind starts losing deltas
+RECONNECT_DELAY = 2.0       # seconds
+
+
+def _channel(topic: str) -> str:
+    return f"{CHANNEL_PREFIX}:{topic}"
+
+
+def notifications_topic(user_id) -> str:
+    return f"notifications:{user_id}"
+
+
+# --------------- Publishing (sync: views, mutations, Celery) ----------------
+@lru_cache(maxsize=1)
+def _client() -> redis.Redis:
+    return redis.Redis.from_url(settings.LIVE_UPDATES_REDIS_URL)
+
+
+def publish(topic: str, payload: dict) -> None:
+    """Publish one delta now. Never raises: live updates are best effort."""
+    try:
+        _client().publish(_channel(topic), json.dumps(payload, cls=DjangoJSONEncoder))
+    except redis.RedisError as e:
+        log.warning("[live] publish to %s failed: %s", topic, e)
+
+
+def publish_on_commit(topic: str, payload: dict) -> None:
+    """Publish after the current transaction commits (immediately under autocommit)."""
+    transaction.on_commit(lambda: publish(topic, payload))
+
+
+def incident_delta(incident, op: str = "upsert") -> dict:
+    """Public incident fields only (same set as the incidents map layer)."""
+    if op == "delete":
+        return {"op": op, "id": incident.pk}
+    return {
+        "op": op,
+        "id": incident.pk,
+        "incident_type": incident.incident_type.name,
+        "status": incident.status,
+        "verified": incident.verified,
+        "risk_label": incident.risk_label,
+        "latitude": incident.location.y,
+        "longitude": incident.location.x,
+        "reported_at": incident.reported_at,
+    }
+
+
+def publish_user_notifications(user_notifications: Iterable) -> None:
+    """One delta per recipient for freshly created UserNotification rows."""
+    for un in user_notifications:
+        n = un.notification
+        publish_on_commit(notifications_topic(un.user_id), {
+            "id": un.pk,
+            "notification_id": n.pk,
+            "title": n.title,
+            "message": n.message,
+            "severity": n.severity,
+            "received_at": un.received_at,
+        })
+
+
+# --------------- Subscribing (async: ASGI WebSocket server) ----------------
+class _Hub:
+    """One Redis pattern subscription per process, fanned out to local queues."""
+
+    def __init__(self):
+        self._queues: Dict[str, Set[asyncio.Queue]] = defaultdict(set)
+        self._reader = None
+
+    def _ensure_reader(self) -> None:
+        if self._reader is None or self._reader.done():
+            self._reader = asyncio.create_task(self._read())
+
+    async def _read(self) -> None:
+        while True:
+            client = aioredis.from_url(settings.LIVE_UPDATES_REDIS_URL)
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.psubscribe(_channel("*"))
+                    async for message in pubsub.listen():
+                        if message["type"] == "pmessage":
+                            self._dispatch(message["channel"].decode(), message["data"])
+            except (redis.RedisError, OSError) as e:
+                log.warning("[live] Redis subscription lost (%s); reconnecting", e)
+                await asyncio.sleep(RECONNECT_DELAY)
+            finally:
+                await client.aclose()
+
+    def _dispatch(self, channel: str, data: bytes) -> None:
+        topic = channel.split(":", 1)[1]
+        queues = self._queues.get(topic)
+        if not queues:
+            return
+        event = json.loads(data)
+        for queue in queues:
+            try:
+                queue.put_nowait(event)
+            except asyncio.QueueFull:
+                log.warning("[live] Dropping %s delta for a slow subscriber", topic)
+
+    async def subscribe(self, topic: str) -> AsyncIterator[dict]:
+        self._ensure_reader()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self._queues[topic].add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._queues[topic].discard(queue)
+            if not self._queues[topic]:
+                del self._queues[topic]
+
+
+_hub = _Hub()
+
+
+def subscribe(topic: str) -> AsyncIterator[dict]:
+    """Async iterator of deltas published to `topic` from now on."""
+    return _hub.subscribe(topic)
@@ -5,7 +5,8 @@ from django.contrib.auth import get_user_model
 import logging
 from disaster_management.apps.notifications.models import Notification, UserNotification
 from disaster_management.apps.users.models import User
-from django.core.mail import send_mail, EmailMultiAlternatives
+from disaster_management.utils.live_updates import publish_user_notifications
+from django.core.mail import send_mail, EmailMessage, EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.utils.html import strip_tags
 
@@ -40,31 +41,99 @@ Please review the climate response plan.
 
 
 def send_alert(title, message, severity="critical"):
-    # 1. Create Notification
-    notification = Notification.objects.create(
-        title=title,
-        message=message,
-        severity=severity,
-        target_type='global'
-    )
+    """Single alert, fanned out synchronously (bulk inserts + one SMTP connection)."""
+    admins = fan_out_alerts("alert", [{"title": title, "message": message, "severity": severity}])
+    return f"Notification sent to {admins} admins"
+
 
-    # 2. Get all admin users (you can filter other roles if needed)
-    admins = User.objects.filter(roles__name="Admin")
+class AlertBatch:
+    """
+    Collects the alerts raised during one forecasting run for a single hazard,
+    then hands them to the notification queue in one message:
 
-    for admin in admins:
-        UserNotification.objects.create(user=admin, notification=notification)
+        alerts = AlertBatch("flood")
+        alerts.add(title, message, severity="critical")
+        ...
+        alerts.dispatch()   # after the run's DB write
 
-        # 3. Send email
-        if admin.email:
-            send_mail(
-                subject=f"[Alert] {title}",
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[admin.email],
-                fail_silently=True
-            )
+    The forecasting task never touches SMTP or writes per-admin rows itself.
+    """
+
+    def __init__(self, hazard, enabled=True):
+        self.hazard = hazard
+        self.enabled = enabled  # False for replays/backfills: collect nothing, send nothing
+        self.alerts = []
+
+    def add(self, title, message, severity="critical"):
+        if not self.enabled:
+            return
+        self.alerts.append({"title": title, "message": message, "severity": severity})
+
+    def __len__(self):
+        return len(self.alerts)
+
+    def dispatch(self):
+        """Enqueue the batch on the notifications queue; returns the number of alerts queued."""
+        if not self.alerts:
+            return 0
+        from disaster_management.apps.notifications.tasks import dispatch_alert_batch  # avoid import cycle
+        dispatch_alert_batch.delay(self.hazard, self.alerts)
+        return len(self.alerts)
+
+
+def _alert_recipients():
+    return User.objects.filter(role=User.RoleChoices.ADMIN, is_active=True).only("id", "email")
+
+
+def fan_out_alerts(hazard, alerts):
+    """
+    Persist and deliver a batch of alerts for one hazard:
+      - one Notification per alert (single bulk insert)
+      - one UserNotification per admin per alert (single bulk insert)
+      - one digest email per admin, all sent over a single pooled SMTP connection
+    Returns the number of admins notified.
+    """
+    if not alerts:
+        return 0
+
+    notifications = Notification.objects.bulk_create([
+        Notification(
+            title=a["title"],
+            message=a["message"],
+            severity=a.get("severity", "critical"),
+            target_type="global",
+        )
+        for a in alerts
+    ])
+
+    admins = list(_alert_recipients())
+    publish_user_notifications(UserNotification.objects.bulk_create(
+        [UserNotification(user=admin, notification=n) for admin in admins for n in notifications],
+        batch_size=1000,
+    ))
+
+    recipients = [admin.email for admin in admins if admin.email]
+    if recipients:
+        if len(alerts) == 1:
+            subject = f"[Alert] {alerts[0]['title']}"
+            body = alerts[0]["message"]
+        else:
+            subject = f"[Alert] {len(alerts)} {hazard} alerts"
+            body = "\n\n".join(f"{a['title']}\n{a['message']}" for a in alerts)
+
+        from_email = getattr(settings, "DEFAULT_FROM_EMAIL", "noreply@disaster-system.local")
+        try:
+            with get_connection(fail_silently=False) as connection:
+                connection.send_messages([
+                    EmailMessage(subject, body, from_email, [email], connection=connection)
+                    for email in recipients
+                ])
+        except Exception as e:
+            logger.error(f"[Notify] Alert digest email failed: {e}")
+            _fallback_log_email(subject, body, recipients)
 
-    return f"Notification sent to {admins.count()} admins"
+    logger.info(f"[Notify] {len(alerts)} {hazard} alert(s) fanned out to {len(admins)} admins.")
+    return len(admins)
 
 
 def notify_users(title, message, users, severity="info", html_template=None, context=None):
@@ -93,10 +162,12 @@ def notify_users(title, message, users, severity="info", html_template=None, con
 
     # 2️⃣ Create per-user notification + collect valid emails
     recipient_emails = []
+    user_notifications = []
     for user in users:
-        UserNotification.objects.create(user=user, notification=notification)
+        user_notifications.append(UserNotification.objects.create(user=user, notification=notification))
         if user.email:
             recipient_emails.append(user.email)
+    publish_user_notifications(user_notifications)
 
     # 3️⃣ Send the email to valid recipients
     if recipient_emails:
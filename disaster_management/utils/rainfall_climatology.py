@@ -0,0 +1,139 @@
+# forecasts/utils/rainfall_climatology.py
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+from django.db import connection
+from django.db.models import Avg
+from django.utils import timezone
+
+from disaster_management.apps.weather.models import DailyWeatherSummary, MonthlyRainfallClimatology
+
+# Recount every (city, local year, local month) in [start, end) from the daily
+# rollup (one row per city and local date, see utils.weather_rollups) and upsert
+# the totals. Month-complete ranges keep the day counts exact.
+_REFRESH_SQL = """
+    INSERT INTO {clim} (city_name, year, month, rain_days, logged_days, rainfall_mm, updated_at)
+    SELECT city_name,
+           EXTRACT(YEAR FROM date)::int,
+           EXTRACT(MONTH FROM date)::int,
+           COUNT(*) FILTER (WHERE rainy),
+           COUNT(*),
+           COALESCE(SUM(rainfall_mm), 0),
+           NOW()
+    FROM {daily}
+    WHERE date >= %(start)s AND date < %(end)s
+      {city_filter}
+    GROUP BY 1, 2, 3
+    ON CONFLICT (city_name, year, month) DO UPDATE
+       SET rain_days = EXCLUDED.rain_days,
+           logged_days = EXCLUDED.logged_days,
+           rainfall_mm = EXCLUDED.rainfall_mm,
+           updated_at = EXCLUDED.updated_at
+"""
+
+
+def _month_start(year: int, month: int) -> datetime:
+    return timezone.make_aware(datetime(year, month, 1), timezone.get_current_timezone())
+
+
+def _next_month_start(year: int, month: int) -> datetime:
+    return _month_start(year + month // 12, month % 12 + 1)
+
+
+def refresh_climatology(start: datetime, end: datetime, cities: Optional[Iterable[str]] = None) -> int:
+    """
+    Recompute climatology rows for every local month overlapping [start, end]
+    (optionally only for `cities`) with one INSERT ... SELECT ... ON CONFLICT
+    over DailyWeatherSummary – refresh the daily rows first
+    (`weather_rollups.refresh_rollups` does both). Returns the number of rows upserted.
+    """
+    local_start, local_end = timezone.localtime(start), timezone.localtime(end)
+    start = _month_start(local_start.year, local_start.month)
+    end = _next_month_start(local_end.year, local_end.month)
+
+    qn = connection.ops.quote_name
+    params = {"start": start.date(), "end": end.date()}
+    city_filter = ""
+    if cities is not None:
+        params["cities"] = sorted(set(cities))
+        if not params["cities"]:
+            return 0
+        city_filter = "AND city_name = ANY(%(cities)s)"
+
+    sql = _REFRESH_SQL.format(
+        clim=qn(MonthlyRainfallClimatology._meta.db_table),
+        daily=qn(DailyWeatherSummary._meta.db_table),
+        city_filter=city_filter,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+# --------------- Readers ----------------
+def average_rain_days(month: int, years_back: int = 5, now: Optional[datetime] = None) -> Dict[str, float]:
+    """
+    {city_name: average rainy days in `month`} over the past `years_back` local
+    years, averaging the years that recorded rain. One query for all cities.
+    """
+    local_year = timezone.localtime(now or timezone.now()).year
+    rows = (
+        MonthlyRainfallClimatology.objects
+        .filter(month=month, year__gte=local_year - years_back, rain_days__gt=0)
+        .values("city_name")
+        .annotate(avg_rain_days=Avg("rain_days"))
+    )
+    return {row["city_name"]: round(float(row["avg_rain_days"]), 2) for row in rows}
+
+
+def _local_months(start: datetime, end: datetime) -> List[Tuple[int, int]]:
+    local_start, local_end = timezone.localtime(start), timezone.localtime(end)
+    y, m = local_start.year, local_start.month
+    months = []
+    while (y, m) <= (local_end.year, local_end.month):
+        months.append((y, m))
+        y, m = y + m // 12, m % 12 + 1
+    return months
+
+
+def rain_days_by_city_month(start: datetime, end: datetime) -> Dict[str, Dict[int, int]]:
+    """
+    {city_name: {month: rain_days}} for the local months spanned by [start, end],
+    read through `weather_rollups.rollup_frame` (whole months → the climatology level).
+    """
+    from disaster_management.utils.weather_rollups import rollup_frame  # it imports this module
+
+    local_start, local_end = timezone.localtime(start), timezone.localtime(end)
+    _, df = rollup_frame(
+        _month_start(local_start.year, local_start.month),
+        _next_month_start(local_end.year, local_end.month),
+        ["rain_days"],
+    )
+    out: Dict[str, Dict[int, int]] = {}
+    for city, period, rain_days in df.itertuples(index=False):
+        if rain_days > 0:
+            out.setdefault(city, {})[period.month] = int(rain_days)
+    return out
+
+
+def climatology_frame(months: Optional[Iterable[int]] = None, since_year: Optional[int] = None) -> pd.DataFrame:
+    """
+    Climatology rows as a DataFrame:
+      city, year, month, rain_days, total_days, rain_ratio, rainfall_mm
+    """
+    qs = MonthlyRainfallClimatology.objects.all()
+    if months is not None:
+        qs = qs.filter(month__in=list(months))
+    if since_year is not None:
+        qs = qs.filter(year__gte=since_year)
+
+    df = pd.DataFrame.from_records(
+        qs.values_list("city_name", "year", "month", "rain_days", "logged_days", "rainfall_mm"),
+        columns=["city", "year", "month", "rain_days", "total_days", "rainfall_mm"],
+    )
+    total = df["total_days"].to_numpy(dtype=float)
+    df["rain_ratio"] = (df["rain_days"] / total.clip(min=1)).where(total > 0, 0.0)
+    return df[["city", "year", "month", "rain_days", "total_days", "rain_ratio", "rainfall_mm"]]
@@ -0,0 +1,169 @@
+# forecasts/utils/risk_grid.py
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import rasterio
+from rasterio.errors import WindowError
+from rasterio.transform import from_origin
+from rasterio.windows import Window, from_bounds
+from scipy.spatial import cKDTree
+
+# Zambia bounding box (lon/lat, WGS84) with a small margin
+ZAMBIA_BOUNDS = (21.9, -18.1, 33.8, -8.2)   # west, south, east, north
+DEFAULT_RESOLUTION = 0.05                   # degrees (~5.5 km)
+RISK_BANDS = ("flood", "drought", "heat")   # band 1..3, scores 0..1
+
+IDW_NEIGHBOURS = 8
+IDW_POWER = 2.0
+IDW_MAX_DISTANCE = 0.5                      # degrees; farther cells stay nodata
+
+GTIFF_PROFILE = dict(
+    driver="GTiff",
+    dtype="float32",
+    nodata=np.nan,
+    tiled=True,
+    blockxsize=256,
+    blockysize=256,
+    compress="deflate",
+    predictor=3,        # floating-point predictor → much better deflate ratios
+    crs="EPSG:4326",
+)
+
+
+@dataclass(frozen=True)
+class RiskGrid:
+    """Fixed lon/lat grid; row 0 is the northern edge (GeoTIFF order)."""
+    west: float
+    south: float
+    east: float
+    north: float
+    resolution: float
+
+    @property
+    def width(self) -> int:
+        return int(round((self.east - self.west) / self.resolution))
+
+    @property
+    def height(self) -> int:
+        return int(round((self.north - self.south) / self.resolution))
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.height, self.width
+
+    @property
+    def transform(self):
+        return from_origin(self.west, self.north, self.resolution, self.resolution)
+
+    def cell_centers(self) -> Tuple[np.ndarray, np.ndarray]:
+        """(lon, lat) of every cell centre, each shaped (height, width)."""
+        lons = self.west + (np.arange(self.width) + 0.5) * self.resolution
+        lats = self.north - (np.arange(self.height) + 0.5) * self.resolution
+        return np.meshgrid(lons, lats)
+
+
+def zambia_grid(resolution: float = DEFAULT_RESOLUTION) -> RiskGrid:
+    return RiskGrid(*ZAMBIA_BOUNDS, resolution=resolution)
+
+
+def points_to_grid(grid: RiskGrid, lons: Sequence[float], lats: Sequence[float], values: Sequence[float],
+                   k: int = IDW_NEIGHBOURS, power: float = IDW_POWER,
+                   max_distance: float = IDW_MAX_DISTANCE) -> np.ndarray:
+    """
+    Inverse-distance-weighted surface of point `values` on `grid` (float32, NaN = no data).
+    Duplicate points should be aggregated by the caller. One KD-tree query for all cells.
+    """
+    out = np.full(grid.shape, np.nan, dtype=np.float32)
+    lons, lats, values = (np.asarray(a, dtype=float) for a in (lons, lats, values))
+    ok = ~(np.isnan(lons) | np.isnan(lats) | np.isnan(values))
+    lons, lats, values = lons[ok], lats[ok], values[ok]
+    if values.size == 0:
+        return out
+
+    cx, cy = grid.cell_centers()
+    k = min(k, values.size)
+    dist, idx = cKDTree(np.column_stack([lons, lats])).query(
+        np.column_stack([cx.ravel(), cy.ravel()]), k=k, distance_upper_bound=max_distance,
+    )
+    dist, idx = dist.reshape(-1, k), idx.reshape(-1, k)
+
+    found = np.isfinite(dist)
+    safe_idx = np.where(found, idx, 0)
+    with np.errstate(divide="ignore"):
+        w = np.where(found, 1.0 / np.maximum(dist, 1e-12) ** power, 0.0)
+    wsum = w.sum(axis=1)
+    surface = np.where(wsum > 0, (w * values[safe_idx]).sum(axis=1) / np.where(wsum > 0, wsum, 1), np.nan)
+    return surface.reshape(grid.shape).astype(np.float32)
+
+
+def write_risk_raster(path: str, grid: RiskGrid, bands: Dict[str, np.ndarray], tags: Optional[dict] = None) -> dict:
+    """
+    Write `bands` (name → (height, width) array, in RISK_BANDS order) as one tiled,
+    deflate-compressed float32 GeoTIFF. Returns per-band stats {name: {min, max, mean, cells}}.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    names = [b for b in RISK_BANDS if b in bands]
+    profile = dict(GTIFF_PROFILE, width=grid.width, height=grid.height, count=len(names),
+                   transform=grid.transform)
+    stats = {}
+    with rasterio.open(path, "w", **profile) as dst:
+        for i, name in enumerate(names, start=1):
+            data = np.asarray(bands[name], dtype=np.float32)
+            dst.write(data, i)
+            dst.set_band_description(i, name)
+            valid = data[~np.isnan(data)]
+            stats[name] = {
+                "min": float(valid.min()) if valid.size else None,
+                "max": float(valid.max()) if valid.size else None,
+                "mean": float(valid.mean()) if valid.size else None,
+                "cells": int(valid.size),
+            }
+        if tags:
+            dst.update_tags(**{k: str(v) for k, v in tags.items()})
+    return stats
+
+
+def _band_index(dataset, band: str) -> int:
+    try:
+        return list(dataset.descriptions).index(band) + 1
+    except ValueError:
+        raise KeyError(f"Band '{band}' not in {dataset.descriptions}")
+
+
+def read_window(path: str, band: str, bounds: Tuple[float, float, float, float]) -> dict:
+    """
+    Windowed read of one band for (west, south, east, north): only the tiles
+    covering the window are decompressed. Returns the array (NaN = no data)
+    plus the window's origin and resolution.
+    """
+    with rasterio.open(path) as src:
+        full = Window(0, 0, src.width, src.height)
+        window = from_bounds(*bounds, transform=src.transform).round_offsets().round_lengths()
+        try:
+            window = window.intersection(full)
+        except WindowError:  # bounds entirely outside the grid
+            return {"band": band, "west": bounds[0], "north": bounds[3],
+                    "resolution": float(src.res[0]), "values": np.empty((0, 0), dtype=np.float32)}
+        data = src.read(_band_index(src, band), window=window)
+        west, north = src.window_transform(window) * (0, 0)
+        return {
+            "band": band,
+            "west": float(west),
+            "north": float(north),
+            "resolution": float(src.res[0]),
+            "values": data,
+        }
+
+
+def sample_points(path: str, points: Sequence[Tuple[float, float]]) -> Dict[Tuple[float, float], Dict[str, Optional[float]]]:
+    """Band values at each (lon, lat), e.g. for incident or shelter locations."""
+    with rasterio.open(path) as src:
+        names = list(src.descriptions)
+        out = {}
+        for (lon, lat), values in zip(points, src.sample(points)):
+            out[(lon, lat)] = {n: (None if np.isnan(v) else float(v)) for n, v in zip(names, values)}
+        return out
@@ -8,6 +8,84 @@ def _normalize(x, lo, hi):
         return 0.0
     return float(np.clip((x - lo) / (hi - lo), 0.0, 1.0))
 
+def normalize_array(x, lo, hi) -> np.ndarray:
+    """
+    Vectorized `_normalize`: same arithmetic, one NumPy pass instead of a
+    Python call per element. Returns float64 values in 0..1.
+    """
+    x = np.asarray(x, dtype=float)
+    if hi == lo:
+        return np.zeros_like(x)
+    return np.clip((x - lo) / (hi - lo), 0.0, 1.0)
+
+def _filled(x, fill) -> np.ndarray:
+    x = np.asarray(x, dtype=float)
+    return np.where(np.isnan(x), fill, x)
+
+# --------------- Batch kernels (plain arrays in, scores out) ----------------
+def score_flood_arrays(rainfall_recent_24h, rainfall_recent_72h, rain_flag,
+                       temp_anomaly, flood_history, flood_season_mult=1.0) -> np.ndarray:
+    """
+    Flood risk (0..1) for any number of rows given as arrays or scalars.
+    NaNs are treated like missing DataFrame values (0, or 1.0 for the multiplier).
+    """
+    s24  = _filled(rainfall_recent_24h, 0)
+    s72  = _filled(rainfall_recent_72h, 0)
+    rain = _filled(rain_flag, 0)
+    anom = _filled(temp_anomaly, 0)
+    hist = _filled(flood_history, 0)
+    mult = _filled(flood_season_mult, 1.0)
+
+    # Heuristic components (weights tuned conservatively)
+    c_intensity   = normalize_array(s24, 0, 6)                          # 0–6 events/24h
+    c_persistence = normalize_array(s72, 0, 12)                         # 0–12 events/72h
+    c_rainflag    = rain * 0.6
+    c_temp        = normalize_array(anom, 0, 6) * 0.3                   # warm anomalies boost convection
+    c_history     = hist * 0.5                                          # prior floods nearby
+
+    raw = (0.35 * c_intensity + 0.25 * c_persistence + 0.20 * c_rainflag +
+           0.10 * c_temp + 0.10 * c_history)
+
+    return np.clip(raw * mult, 0, 1)
+
+def score_drought_arrays(rain_deficit, temperature, humidity, temp_anomaly,
+                         drought_season_mult=1.0) -> np.ndarray:
+    """
+    Drought risk (0..1) for any number of rows given as arrays or scalars.
+    NaNs are treated like missing DataFrame values (humidity 50, multiplier 1.0, else 0).
+    """
+    deficit = _filled(rain_deficit, 0)                                  # expected - observed
+    temp    = _filled(temperature, 0)
+    humid   = _filled(humidity, 50)
+    anom    = _filled(temp_anomaly, 0)
+    mult    = _filled(drought_season_mult, 1.0)
+
+    c_deficit = normalize_array(deficit, 0, 5)                          # 0–5 missing rainy days
+    c_temp    = normalize_array(temp, 20, 38)
+    c_anom    = normalize_array(anom, 0, 8)
+    c_dryair  = normalize_array(60 - humid, 0, 40)                      # drier → higher risk
+
+    raw = (0.45 * c_deficit + 0.25 * c_temp + 0.20 * c_dryair + 0.10 * c_anom)
+
+    return np.clip(raw * mult, 0, 1)
+
+HEAT_SEASON_SHIFT = {"hot_dry": 1.0, "cool_dry": -0.5, "rainy": 0.0}
+
+def score_heat_arrays(temp_anomaly, season: str = "rainy") -> np.ndarray:
+    """
+    Heat risk (0..1) from temperature anomaly (°C), linear through the heat-wave
+    thresholds so `_risk_bucket` agrees with `_risk_from_anomaly`:
+    medium (+3 °C + shift) → 0.40, high (+5 °C + shift) → 0.70, saturating at +7 °C.
+    """
+    anom = _filled(temp_anomaly, 0) - HEAT_SEASON_SHIFT.get(season, 0.0)
+    return np.clip(0.15 * anom - 0.05, 0, 1)
+
+# --------------- DataFrame wrappers ----------------
+def _column(df: pd.DataFrame, name: str, default) -> np.ndarray:
+    if name in df.columns:
+        return df[name].to_numpy(dtype=float, na_value=np.nan)
+    return np.full(len(df), default, dtype=float)
+
 def score_flood_df(df: pd.DataFrame) -> pd.DataFrame:
     """
     Expects columns from extract_flood_features:
@@ -18,24 +96,15 @@ def score_flood_df(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df.assign(flood_risk=pd.Series(dtype=float))
 
-    s24  = df.get("rainfall_recent_24h", 0).fillna(0)
-    s72  = df.get("rainfall_recent_72h", 0).fillna(0)
-    rain = df.get("rain_flag", 0).fillna(0)
-    anom = df.get("temp_anomaly", 0).fillna(0)
-    hist = df.get("flood_history", 0).fillna(0)
-    mult = df.get("flood_season_mult", 1.0).fillna(1.0)
-
-    # Heuristic components (weights tuned conservatively)
-    c_intensity   = s24.apply(lambda v: _normalize(v, 0, 6))            # 0–6 events/24h
-    c_persistence = s72.apply(lambda v: _normalize(v, 0, 12))           # 0–12 events/72h
-    c_rainflag    = rain.astype(float) * 0.6
-    c_temp        = anom.apply(lambda v: _normalize(v, 0, 6)) * 0.3     # warm anomalies boost convection
-    c_history     = hist.astype(float) * 0.5                            # prior floods nearby
-
-    raw = (0.35 * c_intensity + 0.25 * c_persistence + 0.20 * c_rainflag +
-           0.10 * c_temp + 0.10 * c_history)
-
-    return df.assign(flood_risk=(raw * mult).clip(0, 1))
+    risk = score_flood_arrays(
+        _column(df, "rainfall_recent_24h", 0),
+        _column(df, "rainfall_recent_72h", 0),
+        _column(df, "rain_flag", 0),
+        _column(df, "temp_anomaly", 0),
+        _column(df, "flood_history", 0),
+        _column(df, "flood_season_mult", 1.0),
+    )
+    return df.assign(flood_risk=pd.Series(risk, index=df.index))
 
 def score_drought_df(df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -46,17 +115,11 @@ def score_drought_df(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return df.assign(drought_risk=pd.Series(dtype=float))
 
-    deficit = df.get("rain_deficit", 0).fillna(0)            # expected - observed
-    temp    = df.get("temperature", 0).fillna(0)
-    humid   = df.get("humidity", 50).fillna(50)
-    anom    = df.get("temp_anomaly", 0).fillna(0)
-    mult    = df.get("drought_season_mult", 1.0).fillna(1.0)
-
-    c_deficit = deficit.apply(lambda v: _normalize(v, 0, 5))            # 0–5 missing rainy days
-    c_temp    = temp.apply(lambda v: _normalize(v, 20, 38))
-    c_anom    = anom.apply(lambda v: _normalize(v, 0, 8))
-    c_dryair  = humid.apply(lambda v: _normalize(60 - v, 0, 40))        # drier → higher risk
-
-    raw = (0.45 * c_deficit + 0.25 * c_temp + 0.20 * c_dryair + 0.10 * c_anom)
-
-    return df.assign(drought_risk=(raw * mult).clip(0, 1))
+    risk = score_drought_arrays(
+        _column(df, "rain_deficit", 0),
+        _column(df, "temperature", 0),
+        _column(df, "humidity", 50),
+        _column(df, "temp_anomaly", 0),
+        _column(df, "drought_season_mult", 1.0),
+    )
+    return df.assign(drought_risk=pd.Series(risk, index=df.index))
@@ -1,18 +1,94 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from django.db import connection
 from django.utils import timezone
 
 from disaster_management.apps.weather.models import WeatherLog
 from disaster_management.utils.climate_constants import (
-    SEASON_CONFIG, get_season, _rain_indicator
+    RAIN_REGEX, SEASON_CONFIG, get_season
 )
 
-def detect_drought_anomaly(city_name: str):
+# One grouped scan for every city: distinct local rainy dates, observation count and
+# the latest observation (representative point) per case-insensitive city name.
+_RAINY_DAYS_SQL = """
+    SELECT MIN(city_name),
+           COUNT(DISTINCT (recorded_at AT TIME ZONE %(tz)s)::date) FILTER (WHERE rainy),
+           COUNT(*),
+           MAX(recorded_at),
+           (ARRAY_AGG(ST_X(location::geometry) ORDER BY recorded_at DESC))[1],
+           (ARRAY_AGG(ST_Y(location::geometry) ORDER BY recorded_at DESC))[1]
+    FROM (
+        SELECT city_name, recorded_at, location,
+               (condition ~* %(rain_regex)s OR COALESCE(rainfall_mm, 0) > 0) AS rainy
+        FROM {logs}
+        WHERE recorded_at >= %(start)s AND recorded_at <= %(end)s
+          AND city_name IS NOT NULL AND city_name <> ''
+          {city_filter}
+    ) obs
+    GROUP BY LOWER(city_name)
+"""
+
+
+class RainyDays(NamedTuple):
+    city_name: str
+    rain_days: int          # distinct local dates with rain
+    observations: int       # raw log rows in the window
+    last_obs: datetime
+    lon: Optional[float]    # location of the latest observation
+    lat: Optional[float]
+
+
+def rainy_days_by_city(days: int = 14, now: Optional[datetime] = None,
+                       cities: Optional[Iterable[str]] = None) -> Dict[str, RainyDays]:
+    """
+    Distinct rainy days per city over the last `days` days, for all cities in one
+    grouped query (or only `cities`). Keys are lower-cased city names; cities
+    without any observation in the window are absent.
+    "Rainy" = condition matches RAIN_REGEX, or rainfall_mm > 0.
+    """
+    now = now or timezone.now()
+    params = {
+        "tz": timezone.get_current_timezone_name(),
+        "rain_regex": RAIN_REGEX,
+        "start": now - timedelta(days=days),
+        "end": now,
+    }
+    city_filter = ""
+    if cities is not None:
+        params["cities"] = sorted({c.lower() for c in cities})
+        city_filter = "AND LOWER(city_name) = ANY(%(cities)s)"
+
+    sql = _RAINY_DAYS_SQL.format(
+        logs=connection.ops.quote_name(WeatherLog._meta.db_table),
+        city_filter=city_filter,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    return {
+        name.lower(): RainyDays(name, int(rain_days), int(n_obs), last_obs, lon, lat)
+        for name, rain_days, n_obs, last_obs, lon, lat in rows
+    }
+
+
+def rainy_season_threshold(window_days: int = 14) -> int:
+    """Minimum expected rainy days over `window_days` in the rainy season, minus a 1-day tolerance."""
+    expected = SEASON_CONFIG["rainy"].expected_rain_days_last7 * window_days // 7  # ≈ 6 / 14 days
+    return max(0, expected - 1)
+
+
+def detect_drought_anomaly(city_name: str, counts: Optional[Dict[str, RainyDays]] = None,
+                           now: Optional[datetime] = None):
     """
     Flag drought-like anomaly if the last 14 days in a city have
     fewer rainy days than expected for the season.
     Only alerts during the rainy season.
+    Pass `counts` from `rainy_days_by_city(14)` when checking many cities so
+    they share one query. `now` defaults to the current time (set it for replays).
     """
-    now = timezone.now()
+    now = now or timezone.now()
     local_month = timezone.localtime(now).month
     season = get_season(local_month)
 
@@ -20,16 +96,11 @@ def detect_drought_anomaly(city_name: str):
     if season != "rainy":
         return None
 
-    past_14_days = now - timedelta(days=14)
-
-    # Pull minimal fields, guard against big payloads
-    logs = (
-        WeatherLog.objects
-        .filter(city_name__iexact=city_name, recorded_at__gte=past_14_days)
-        .only("recorded_at", "condition", "rainfall_mm")  # rainfall_mm if you have it
-    )
+    if counts is None:
+        counts = rainy_days_by_city(14, now=now, cities=[city_name])
+    entry = counts.get(city_name.lower())
 
-    if not logs:
+    if entry is None:
         # No data; you can return a low-confidence warning or None
         return {
             "city": city_name,
@@ -38,20 +109,11 @@ def detect_drought_anomaly(city_name: str):
             "message": f"No weather data for {city_name} in the past 14 days."
         }
 
-    # Count distinct local dates with rain
-    rainy_dates = set()
-    for log in logs:
-        # Prefer numeric rainfall if available; fall back to condition text
-        has_rain = (getattr(log, "rainfall_mm", None) or 0) > 0 or _rain_indicator(log) == 1
-        if has_rain and getattr(log, "recorded_at", None):
-            rainy_dates.add(timezone.localtime(log.recorded_at).date())
-
-    rain_days = len(rainy_dates)
+    rain_days = entry.rain_days
 
     # Expectation for rainy season: 3 rainy days / 7  → about 6 / 14
-    expected_14 = SEASON_CONFIG["rainy"].expected_rain_days_last7 * 2  # ≈ 6
     # Add a small tolerance so we don’t over-alert
-    threshold = max(0, expected_14 - 1)
+    threshold = rainy_season_threshold(14)
 
     if rain_days < threshold:
         return {
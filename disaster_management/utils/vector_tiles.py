@@ -0,0 +1,187 @@
+# forecasts/utils/vector_tiles.py
+from __future__ import annotations
+
+from typing import Dict, NamedTuple, Optional
+
+from django.core.cache import cache
+from django.db import connection
+
+from disaster_management.apps.forecasting.models import ForecastModel, ForecastResult
+from disaster_management.apps.incidents.models import Incident, IncidentType
+from disaster_management.apps.shelters.models import Shelter
+from disaster_management.apps.weather.models import RiskZone
+
+MVT_EXTENT = 4096
+MVT_BUFFER = 64
+MAX_ZOOM = 18
+WEB_MERCATOR_SIZE = 40075016.68557849          # metres spanned by zoom 0
+TILE_CACHE_PREFIX = "mvt"
+TILE_CACHE_TTL = 24 * 3600                      # versioned layers: evicted by a version bump
+CONTENT_TYPE = "application/vnd.mapbox-vector-tile"
+
+
+class TileLayer(NamedTuple):
+    source_sql: str         # SELECT yielding `geog` (geography) + the attribute columns; filtered with `_in_tile`
+    attributes: tuple       # feature properties, in order (`id` becomes the MVT feature id)
+    polygons: bool          # simplify per zoom before clipping
+    ttl: int                # seconds a cached tile may live
+    versioned: bool         # True when writers bump the layer version (see invalidate_layer)
+    private: bool = False   # only served to authenticated users, never cached by shared proxies
+
+
+def _t(model) -> str:
+    return connection.ops.quote_name(model._meta.db_table)
+
+
+def _in_tile(column: str) -> str:
+    """
+    Bbox test in Web Mercator, where the (buffered) tile envelope is a plain
+    rectangle. As geography, low-zoom envelopes span ±180° or antipodal edges
+    and stop covering the tile. Served by the matching *_3857_gist expression
+    indexes, so keep this expression in step with those migrations.
+    """
+    return f"ST_Transform({column}::geometry, 3857) && %(bbox)s"
+
+
+def _layers() -> Dict[str, TileLayer]:
+    # Built lazily so table names come from the models' Meta
+    return {
+        # Latest result per (model, area) forecast for yesterday onwards
+        "forecasts": TileLayer(f"""
+            SELECT DISTINCT ON (r.model_id, r.area_name)
+                   r.id, r.area_name, r.risk_level, r.confidence, r.forecast_date::text AS forecast_date,
+                   m.model_type, r.affected_area AS geog
+            FROM {_t(ForecastResult)} r
+            JOIN {_t(ForecastModel)} m ON m.id = r.model_id
+            WHERE r.affected_area IS NOT NULL
+              AND {_in_tile('r.affected_area')}
+              AND r.forecast_date >= CURRENT_DATE - 1
+            ORDER BY r.model_id, r.area_name, r.predicted_at DESC
+        """,
+            ("id", "area_name", "risk_level", "confidence", "forecast_date", "model_type"),
+            polygons=True, ttl=TILE_CACHE_TTL, versioned=True,
+        ),
+        "risk_zones": TileLayer(f"""
+            SELECT id, zone_name, risk_level, calculated_at::text AS calculated_at, geometry AS geog
+            FROM {_t(RiskZone)}
+            WHERE {_in_tile('geometry')}
+        """,
+            ("id", "zone_name", "risk_level", "calculated_at"),
+            polygons=True, ttl=TILE_CACHE_TTL, versioned=True,
+        ),
+        # Authenticated users only (like the incidents GraphQL queries); no description/reporter
+        "incidents": TileLayer(f"""
+            SELECT i.id, t.name AS incident_type, i.status, i.verified, i.risk_label,
+                   i.reported_at::text AS reported_at, i.location AS geog
+            FROM {_t(Incident)} i
+            JOIN {_t(IncidentType)} t ON t.id = i.incident_type_id
+            WHERE {_in_tile('i.location')} AND i.status <> 'resolved'
+        """,
+            ("id", "incident_type", "status", "verified", "risk_label", "reported_at"),
+            polygons=False, ttl=60, versioned=False, private=True,
+        ),
+        "shelters": TileLayer(f"""
+            SELECT id, name, capacity, current_occupants, location AS geog
+            FROM {_t(Shelter)}
+            WHERE is_active AND {_in_tile('location')}
+        """,
+            ("id", "name", "capacity", "current_occupants"),
+            polygons=False, ttl=300, versioned=False,
+        ),
+    }
+
+
+TILE_LAYERS = ("forecasts", "risk_zones", "incidents", "shelters")
+
+# The layer's rows clipped/quantised to tile space; polygons are simplified to
+# ~1 tile pixel first, so low zooms ship a few vertices per shape.
+_TILE_SQL = """
+    WITH bounds AS (
+        SELECT ST_TileEnvelope(%(z)s, %(x)s, %(y)s) AS env
+    ),
+    src AS ({source}),
+    mvtgeom AS (
+        SELECT ST_AsMVTGeom(
+                   {geom},
+                   bounds.env, %(extent)s, %(buffer)s, true
+               ) AS geom,
+               {attributes}
+        FROM src, bounds
+    )
+    SELECT ST_AsMVT(mvtgeom.*, %(layer)s, %(extent)s, 'geom', 'id')
+    FROM mvtgeom
+    WHERE geom IS NOT NULL
+"""
+
+
+def tile_in_range(z: int, x: int, y: int) -> bool:
+    return 0 <= z <= MAX_ZOOM and 0 <= x < 2 ** z and 0 <= y < 2 ** z
+
+
+def layer_is_private(layer: str) -> bool:
+    return layer in TILE_LAYERS and _layers()[layer].private
+
+
+def _pixel_size(z: int) -> float:
+    return WEB_MERCATOR_SIZE / (2 ** z) / MVT_EXTENT
+
+
+def render_tile(layer: str, z: int, x: int, y: int) -> bytes:
+    """One MVT tile straight from PostGIS: only rows whose geometry hits the tile are read."""
+    spec = _layers()[layer]
+    geom = "ST_Transform(src.geog::geometry, 3857)"
+    if spec.polygons:
+        geom = f"ST_SimplifyPreserveTopology({geom}, {_pixel_size(z)!r})"
+    # Tile bbox in 3857 (+ the MVT buffer), compared against the 3857 expression indexes
+    source = spec.source_sql.replace("%(bbox)s", "ST_TileEnvelope(%(z)s, %(x)s, %(y)s, margin => %(margin)s)")
+    sql = _TILE_SQL.format(source=source, geom=geom, attributes=", ".join(f"src.{a}" for a in spec.attributes))
+    params = {
+        "z": z, "x": x, "y": y,
+        "extent": MVT_EXTENT,
+        "buffer": MVT_BUFFER,
+        "margin": MVT_BUFFER / MVT_EXTENT,
+        "layer": layer,
+    }
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        row = cursor.fetchone()
+    return bytes(row[0]) if row and row[0] is not None else b""
+
+
+# --------------- Cache ----------------
+def _version_key(layer: str) -> str:
+    return f"{TILE_CACHE_PREFIX}:{layer}:version"
+
+
+def layer_version(layer: str) -> int:
+    version = cache.get(_version_key(layer))
+    if version is None:
+        cache.add(_version_key(layer), 1, None)
+        version = cache.get(_version_key(layer), 1)
+    return int(version)
+
+
+def invalidate_layer(*layers: str) -> None:
+    """
+    Drop every cached tile of `layers` by bumping their version (O(1); old keys
+    simply age out). Called after forecast runs and risk-zone recomputes.
+    """
+    for layer in layers:
+        try:
+            cache.incr(_version_key(layer))
+        except ValueError:  # no version yet → nothing cached
+            cache.add(_version_key(layer), 1, None)
+
+
+def get_tile(layer: str, z: int, x: int, y: int) -> Optional[bytes]:
+    """Cached tile bytes (b"" for an empty tile); None for an unknown layer."""
+    if layer not in TILE_LAYERS:
+        return None
+    spec = _layers()[layer]
+    version = layer_version(layer) if spec.versioned else 0
+    key = f"{TILE_CACHE_PREFIX}:{layer}:v{version}:{z}/{x}/{y}"
+    tile = cache.get(key)
+    if tile is None:
+        tile = render_tile(layer, z, x, y)
+        cache.set(key, tile, spec.ttl)
+    return tile
@@ -0,0 +1,119 @@
+# forecasts/utils/weather_analytics.py
+from __future__ import annotations
+
+from collections import Counter
+from typing import List, Optional
+
+from django.contrib.gis.geos import Point
+from django.contrib.gis.measure import D
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from disaster_management.apps.weather.models import RiskZone, WeatherLog
+
+ANALYTICS_CACHE_PREFIX = "weather-analytics:v1"  # bump when the panel layout changes
+ANALYTICS_CACHE_TTL = 2 * 3600                    # refreshed hourly by ingestion / risk zones
+ADMIN_RECENT_LOGS = 100
+NEARBY_RECENT_LOGS = 10
+RISK_LEVELS = ("high", "medium", "low")
+
+
+# --------------- Panels ----------------
+def _zone_counts(zones) -> dict:
+    """Total + per-level counts in one conditional-aggregation statement."""
+    counts = zones.aggregate(
+        total=Count("id"),
+        **{level: Count("id", filter=Q(risk_level=level)) for level in RISK_LEVELS},
+    )
+    return {
+        "total_risk_zones": counts["total"],
+        "high_risk_zones": counts["high"],
+        "medium_risk_zones": counts["medium"],
+        "low_risk_zones": counts["low"],
+    }
+
+
+def _log_stats(logs: List[WeatherLog], digits: Optional[int] = None) -> dict:
+    """Averages and the modal condition over already-fetched recent logs (no extra queries)."""
+    if not logs:
+        return {"avg_temperature": 0, "avg_humidity": 0, "common_condition": "N/A", "recent_weather_logs": []}
+    avg_temp = sum(log.temperature for log in logs) / len(logs)
+    avg_humidity = sum(log.humidity for log in logs) / len(logs)
+    if digits is not None:
+        avg_temp, avg_humidity = round(avg_temp, digits), round(avg_humidity, digits)
+    return {
+        "avg_temperature": avg_temp,
+        "avg_humidity": avg_humidity,
+        "common_condition": Counter(log.condition for log in logs).most_common(1)[0][0],
+        "recent_weather_logs": logs,
+    }
+
+
+def compute_admin_panel() -> dict:
+    """Country-wide panel: active zone counts + the latest ADMIN_RECENT_LOGS logs."""
+    logs = list(WeatherLog.objects.order_by("-recorded_at", "-id")[:ADMIN_RECENT_LOGS])
+    return {**_zone_counts(RiskZone.active()), **_log_stats(logs, digits=2)}
+
+
+def compute_nearby_panel(point: Point, radius_m: float) -> dict:
+    """Panel for zones/logs within `radius_m` of `point` (index-backed ST_DWithin)."""
+    zones = RiskZone.active().filter(geometry__dwithin=(point, D(m=radius_m)))
+    logs = list(
+        WeatherLog.objects.filter(location__dwithin=(point, D(m=radius_m)))
+        .order_by("-recorded_at", "-id")[:NEARBY_RECENT_LOGS]
+    )
+    return {**_zone_counts(zones), **_log_stats(logs)}
+
+
+# --------------- Cache ----------------
+def _generation_key() -> str:
+    return f"{ANALYTICS_CACHE_PREFIX}:generation"
+
+
+def _generation() -> int:
+    generation = cache.get(_generation_key())
+    if generation is None:
+        cache.add(_generation_key(), 1, None)
+        generation = cache.get(_generation_key(), 1)
+    return int(generation)
+
+
+def _panel_key(name: str) -> str:
+    return f"{ANALYTICS_CACHE_PREFIX}:g{_generation()}:{name}"
+
+
+def admin_panel() -> dict:
+    """Cached admin panel; computed on a miss (first load after a deploy or cache flush)."""
+    key = _panel_key("admin")
+    panel = cache.get(key)
+    if panel is None:
+        panel = compute_admin_panel()
+        cache.set(key, panel, ANALYTICS_CACHE_TTL)
+    return panel
+
+
+def nearby_panel(point: Point, radius_m: float, cache_id: str) -> dict:
+    """
+    Cached per-location panel. `cache_id` identifies the location (e.g. the
+    user's latest LocationLog id) so a user who hasn't moved gets an O(1) read
+    until the next refresh.
+    """
+    key = _panel_key(f"nearby:{cache_id}:{int(radius_m)}")
+    panel = cache.get(key)
+    if panel is None:
+        panel = compute_nearby_panel(point, radius_m)
+        cache.set(key, panel, ANALYTICS_CACHE_TTL)
+    return panel
+
+
+def refresh_weather_analytics() -> None:
+    """
+    Called after ingestion and risk-zone recomputes: start a new cache
+    generation (every per-location panel goes stale at once, O(1)) and
+    precompute the admin panel so dashboards never wait on it.
+    """
+    try:
+        cache.incr(_generation_key())
+    except ValueError:  # no generation yet → nothing cached
+        cache.add(_generation_key(), 1, None)
+    cache.set(_panel_key("admin"), compute_admin_panel(), ANALYTICS_CACHE_TTL)
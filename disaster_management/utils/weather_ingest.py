@@ -0,0 +1,171 @@
+# forecasts/utils/weather_ingest.py
+"""
+Concurrent weather fetching for ingestion.
+
+All stations are requested on one asyncio event loop with:
+  - bounded concurrency (semaphore + connector limit),
+  - a token-bucket rate limiter shared by every request to the provider
+    (sharded ingestion splits the limit across shards, see IngestConfig.per_shard),
+  - per-request total/connect timeouts,
+  - retries on network errors, timeouts, 429 and 5xx with full-jitter
+    exponential backoff (Retry-After is honoured), sleeping outside the
+    semaphore so other stations keep going.
+
+The network phase therefore takes about as long as the slowest station
+(plus whatever the rate limit imposes), not the sum of all of them.
+`url` is injectable, so the engine runs unchanged against a local stub server.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, replace
+from typing import Iterable, List, NamedTuple, Optional
+
+import aiohttp
+from django.conf import settings
+
+log = logging.getLogger(__name__)
+
+OPENWEATHER_URL = "https://api.openweathermap.org/data/2.5/weather"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class Station(NamedTuple):
+    name: str
+    lat: float
+    lon: float
+
+
+class FetchResult(NamedTuple):
+    station: Station
+    payload: Optional[dict]     # decoded JSON, None on failure
+    error: Optional[str]
+    attempts: int
+
+
+@dataclass(frozen=True)
+class IngestConfig:
+    concurrency: int = 32
+    rate_per_sec: float = 10.0      # provider limit; <= 0 disables limiting
+    burst: int = 10
+    timeout: float = 15.0           # seconds, whole request
+    connect_timeout: float = 5.0
+    max_retries: int = 3            # attempts per station
+    backoff_base: float = 1.0       # seconds; attempt n waits U(0, min(cap, base * 2**(n-1)))
+    backoff_cap: float = 6.0
+
+    @classmethod
+    def from_settings(cls) -> "IngestConfig":
+        return cls(
+            concurrency=getattr(settings, "WEATHER_INGEST_CONCURRENCY", cls.concurrency),
+            rate_per_sec=getattr(settings, "WEATHER_INGEST_RATE", cls.rate_per_sec),
+            burst=getattr(settings, "WEATHER_INGEST_BURST", cls.burst),
+            timeout=getattr(settings, "WEATHER_INGEST_TIMEOUT", cls.timeout),
+        )
+
+    def per_shard(self, shards: int) -> "IngestConfig":
+        """
+        Share of the provider limit for one of `shards` parallel shard tasks.
+        Every shard runs its own limiter, so together they stay within `rate_per_sec`.
+        """
+        if shards <= 1 or self.rate_per_sec <= 0:
+            return self
+        return replace(self, rate_per_sec=self.rate_per_sec / shards, burst=max(1, self.burst // shards))
+
+
+class RateLimiter:
+    """Token bucket: `rate` requests/second on average, at most `burst` at once."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.capacity = float(max(1, burst))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        async with self._lock:  # waiters are served in arrival order
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    try:
+        return max(0.0, float(value)) if value else None
+    except ValueError:  # HTTP-date form: fall back to our own backoff
+        return None
+
+
+def backoff_delay(attempt: int, config: IngestConfig, retry_after: Optional[float] = None) -> float:
+    """Full-jitter exponential backoff; never shorter than the provider's Retry-After."""
+    delay = random.uniform(0, min(config.backoff_cap, config.backoff_base * 2 ** (attempt - 1)))
+    return max(delay, retry_after or 0.0)
+
+
+async def _fetch_one(session: aiohttp.ClientSession, limiter: RateLimiter, semaphore: asyncio.Semaphore,
+                     url: str, api_key: str, station: Station, config: IngestConfig) -> FetchResult:
+    params = {"lat": station.lat, "lon": station.lon, "appid": api_key, "units": "metric"}
+    timeout = aiohttp.ClientTimeout(total=config.timeout, connect=config.connect_timeout)
+    error = None
+    for attempt in range(1, config.max_retries + 1):
+        retry_after = None
+        async with semaphore:
+            await limiter.acquire()
+            try:
+                async with session.get(url, params=params, timeout=timeout) as resp:
+                    if resp.status in RETRY_STATUSES:
+                        error = f"HTTP {resp.status}"
+                        retry_after = _retry_after(resp.headers.get("Retry-After"))
+                    else:
+                        resp.raise_for_status()
+                        return FetchResult(station, await resp.json(content_type=None), None, attempt)
+            except aiohttp.ClientResponseError as e:  # other 4xx (bad key, bad coords): retrying won't help
+                return FetchResult(station, None, f"HTTP {e.status}", attempt)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = f"{type(e).__name__}: {e}" if str(e) else type(e).__name__
+            except ValueError as e:
+                return FetchResult(station, None, f"Invalid JSON: {e}", attempt)
+        if attempt < config.max_retries:
+            await asyncio.sleep(backoff_delay(attempt, config, retry_after))
+
+    log.warning("[weather] %s: request failed after %d attempts: %s", station.name, config.max_retries, error)
+    return FetchResult(station, None, error, config.max_retries)
+
+
+async def fetch_stations_async(stations: Iterable[Station], api_key: str, url: str = OPENWEATHER_URL,
+                               config: Optional[IngestConfig] = None,
+                               session: Optional[aiohttp.ClientSession] = None) -> List[FetchResult]:
+    """Fetch every station concurrently; results come back in input order."""
+    config = config or IngestConfig.from_settings()
+    limiter = RateLimiter(config.rate_per_sec, config.burst)
+    semaphore = asyncio.Semaphore(config.concurrency)
+
+    own_session = session is None
+    if own_session:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=config.concurrency, ttl_dns_cache=300),
+        )
+    try:
+        return await asyncio.gather(*(
+            _fetch_one(session, limiter, semaphore, url, api_key, station, config) for station in stations
+        ))
+    finally:
+        if own_session:
+            await session.close()
+
+
+def fetch_stations(stations: Iterable[Station], api_key: str, url: str = OPENWEATHER_URL,
+                   config: Optional[IngestConfig] = None) -> List[FetchResult]:
+    """Blocking entry point for Celery tasks (runs its own event loop)."""
+    return asyncio.run(fetch_stations_async(list(stations), api_key, url, config))
@@ -0,0 +1,189 @@
+# forecasts/utils/weather_rollups.py
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta
+from functools import reduce
+from operator import or_
+from typing import Iterable, Optional, Sequence
+
+import pandas as pd
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+
+from disaster_management.apps.weather.models import DailyWeatherSummary, MonthlyRainfallClimatology, WeatherLog
+from disaster_management.utils.climate_constants import RAIN_REGEX
+from disaster_management.utils.rainfall_climatology import _local_months, refresh_climatology
+
+# Rollup chain: WeatherLog (hourly) → DailyWeatherSummary → MonthlyRainfallClimatology
+DAILY_COLUMNS = (
+    "observations",
+    "temp_min", "temp_mean", "temp_max",
+    "humidity_min", "humidity_mean", "humidity_max",
+    "wind_min", "wind_mean", "wind_max",
+    "rain_hours", "rainfall_mm", "rainy",
+)
+# Metrics each level can answer (rain_days/logged_days are per-period day counts)
+MONTHLY_METRICS = ("rain_days", "logged_days", "rainfall_mm")
+DAILY_METRICS = DAILY_COLUMNS + ("rain_days", "logged_days")
+
+# Per (city, local date) aggregate of raw logs in [start, end); also answers "raw" windows live
+_DAILY_SELECT = """
+    SELECT city_name,
+           local_ts::date AS date,
+           COUNT(*) AS observations,
+           MIN(temperature) AS temp_min, AVG(temperature) AS temp_mean, MAX(temperature) AS temp_max,
+           MIN(humidity) AS humidity_min, AVG(humidity) AS humidity_mean, MAX(humidity) AS humidity_max,
+           MIN(wind_speed) AS wind_min, AVG(wind_speed) AS wind_mean, MAX(wind_speed) AS wind_max,
+           COUNT(DISTINCT date_trunc('hour', local_ts)) FILTER (WHERE rainy) AS rain_hours,
+           COALESCE(SUM(rainfall_mm), 0) AS rainfall_mm,
+           BOOL_OR(rainy) AS rainy,
+           AVG(ST_X(location::geometry)) AS lon,
+           AVG(ST_Y(location::geometry)) AS lat
+    FROM (
+        SELECT city_name, temperature, humidity, wind_speed, rainfall_mm, location,
+               recorded_at AT TIME ZONE %(tz)s AS local_ts,
+               (condition ~* %(rain_regex)s OR COALESCE(rainfall_mm, 0) > 0) AS rainy
+        FROM {logs}
+        WHERE recorded_at >= %(start)s AND recorded_at < %(end)s
+          AND city_name IS NOT NULL AND city_name <> ''
+          {city_filter}
+    ) obs
+    GROUP BY 1, 2
+"""
+
+_DAILY_REFRESH_SQL = """
+    INSERT INTO {daily} (city_name, date, {columns}, lon, lat, updated_at)
+    SELECT city_name, date, {columns}, lon, lat, NOW()
+    FROM ({select}) agg
+    ON CONFLICT (city_name, date) DO UPDATE
+       SET {updates}, lon = EXCLUDED.lon, lat = EXCLUDED.lat, updated_at = EXCLUDED.updated_at
+"""
+
+
+def _local_midnight(day: date) -> datetime:
+    return timezone.make_aware(datetime.combine(day, datetime.min.time()), timezone.get_current_timezone())
+
+
+def _daily_sql(start: datetime, end: datetime, cities: Optional[Iterable[str]]):
+    params = {
+        "tz": timezone.get_current_timezone_name(),
+        "rain_regex": RAIN_REGEX,
+        "start": start,
+        "end": end,
+    }
+    city_filter = ""
+    if cities is not None:
+        params["cities"] = sorted(set(cities))
+        city_filter = "AND city_name = ANY(%(cities)s)"
+    select = _DAILY_SELECT.format(logs=connection.ops.quote_name(WeatherLog._meta.db_table), city_filter=city_filter)
+    return select, params
+
+
+def refresh_daily(start: datetime, end: datetime, cities: Optional[Iterable[str]] = None) -> int:
+    """
+    Recompute daily rows for every local date overlapping [start, end]
+    (optionally only `cities`) with one INSERT ... SELECT ... ON CONFLICT.
+    Returns the number of rows upserted.
+    """
+    if cities is not None and not set(cities):
+        return 0
+    first = _local_midnight(timezone.localtime(start).date())
+    last = _local_midnight(timezone.localtime(end).date() + timedelta(days=1))
+    select, params = _daily_sql(first, last, cities)
+    sql = _DAILY_REFRESH_SQL.format(
+        daily=connection.ops.quote_name(DailyWeatherSummary._meta.db_table),
+        columns=", ".join(DAILY_COLUMNS),
+        updates=", ".join(f"{c} = EXCLUDED.{c}" for c in DAILY_COLUMNS),
+        select=select,
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return cursor.rowcount
+
+
+def refresh_rollups(start: datetime, end: datetime, cities: Optional[Iterable[str]] = None) -> int:
+    """Daily rows first, then the monthly climatology recounted from them. Returns daily rows upserted."""
+    if cities is not None:
+        cities = sorted(set(cities))
+    days = refresh_daily(start, end, cities)
+    refresh_climatology(start, end, cities)
+    return days
+
+
+def rebuild_rollups() -> int:
+    """Full rebuild of both levels from the raw log table (initial backfill / after bulk imports)."""
+    bounds = WeatherLog.objects.order_by("recorded_at").values_list("recorded_at", flat=True)
+    first, last = bounds.first(), bounds.last()
+    if first is None:
+        return 0
+    return refresh_rollups(first, last)
+
+
+# --------------- Readers ----------------
+def _is_midnight(dt: datetime) -> bool:
+    local = timezone.localtime(dt)
+    return (local.hour, local.minute, local.second, local.microsecond) == (0, 0, 0, 0)
+
+
+def rollup_level(start: datetime, end: datetime, metrics: Sequence[str]) -> str:
+    """
+    Coarsest level that answers `metrics` over [start, end) exactly:
+    "monthly" (whole local months), "daily" (whole local days) or "raw".
+    """
+    metrics = set(metrics)
+    if _is_midnight(start) and _is_midnight(end):
+        if metrics <= set(MONTHLY_METRICS) and timezone.localtime(start).day == 1 and timezone.localtime(end).day == 1:
+            return "monthly"
+        if metrics <= set(DAILY_METRICS):
+            return "daily"
+    return "raw"
+
+
+def rollup_frame(start: datetime, end: datetime, metrics: Sequence[str],
+                 cities: Optional[Iterable[str]] = None) -> tuple[str, pd.DataFrame]:
+    """
+    (level, DataFrame[city, period, *metrics]) for [start, end), read from the
+    coarsest rollup that can answer it. `period` is the local date (daily/raw) or
+    the first day of the month (monthly). The raw level aggregates WeatherLog to
+    (possibly partial) days on the fly, so every level returns the same shape.
+    """
+    metrics = list(metrics)
+    level = rollup_level(start, end, metrics)
+    city_list = sorted(set(cities)) if cities is not None else None
+
+    if level == "monthly":
+        months = _local_months(start, end)[:-1]  # `end` is the first day of the month after the window
+        if not months:
+            return level, pd.DataFrame(columns=["city", "period", *metrics])
+        qs = MonthlyRainfallClimatology.objects.filter(reduce(or_, (Q(year=y, month=m) for y, m in months)))
+        if city_list is not None:
+            qs = qs.filter(city_name__in=city_list)
+        df = pd.DataFrame.from_records(
+            qs.values_list("city_name", "year", "month", *MONTHLY_METRICS),
+            columns=["city", "year", "month", *MONTHLY_METRICS],
+        )
+        df["period"] = [date(int(y), int(m), 1) for y, m in zip(df["year"], df["month"])]
+        return level, df[["city", "period", *metrics]]
+
+    if level == "daily":
+        qs = DailyWeatherSummary.objects.filter(
+            date__gte=timezone.localtime(start).date(), date__lt=timezone.localtime(end).date(),
+        )
+        if city_list is not None:
+            qs = qs.filter(city_name__in=city_list)
+        df = pd.DataFrame.from_records(
+            qs.values_list("city_name", "date", *DAILY_COLUMNS),
+            columns=["city", "period", *DAILY_COLUMNS],
+        )
+    else:
+        select, params = _daily_sql(start, end, city_list)
+        with connection.cursor() as cursor:
+            cursor.execute(select, params)
+            names = [col[0] for col in cursor.description]
+            df = pd.DataFrame.from_records(cursor.fetchall(), columns=names)
+        df = df.rename(columns={"city_name": "city", "date": "period"})
+
+    df["rain_days"] = df["rainy"].astype(int)
+    df["logged_days"] = 1
+    return level, df[["city", "period", *metrics]]
@@ -0,0 +1,229 @@
+# forecasts/utils/weather_snapshot.py
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
+from django.utils import timezone
+
+from disaster_management.apps.weather.models import WeatherLog
+from disaster_management.utils.climate_constants import RAIN_CONDITIONS
+
+# Widest window any consumer needs (drought features look back 7 days)
+SNAPSHOT_WINDOW = timedelta(days=7)
+SNAPSHOT_CACHE_PREFIX = "weather-snapshot:v2"  # bump when the snapshot layout changes
+
+_SNAPSHOT_SQL = """
+    SELECT id,
+           ST_X(location::geometry),
+           ST_Y(location::geometry),
+           temperature,
+           humidity,
+           wind_speed,
+           condition,
+           city_name,
+           rainfall_mm,
+           EXTRACT(EPOCH FROM recorded_at)
+    FROM {table}
+    WHERE recorded_at >= %s AND recorded_at <= %s
+    ORDER BY recorded_at, id
+"""
+
+
+@dataclass(frozen=True)
+class WeatherSnapshot:
+    """
+    Columnar, read-only view of WeatherLog rows for [start, end].
+    Every array has one entry per log, in recorded_at order:
+      ids, lon, lat, temperature, humidity, wind_speed, condition, city_name,
+      rainfall_mm (NaN where not reported), rain (0/1 flag, same rule as `_rain_indicator`),
+      recorded_at (UTC epoch seconds), local_month / local_date (Africa/Lusaka).
+    """
+    start: datetime
+    end: datetime
+    ids: np.ndarray
+    lon: np.ndarray
+    lat: np.ndarray
+    temperature: np.ndarray
+    humidity: np.ndarray
+    wind_speed: np.ndarray
+    condition: np.ndarray
+    city_name: np.ndarray
+    rainfall_mm: np.ndarray
+    rain: np.ndarray
+    recorded_at: np.ndarray
+    local_month: np.ndarray
+    local_date: np.ndarray
+
+    _COLUMNS = (
+        "ids", "lon", "lat", "temperature", "humidity", "wind_speed", "condition",
+        "city_name", "rainfall_mm", "rain", "recorded_at", "local_month", "local_date",
+    )
+
+    def __len__(self) -> int:
+        return int(self.ids.shape[0])
+
+    @property
+    def empty(self) -> bool:
+        return len(self) == 0
+
+    def select(self, mask: np.ndarray) -> "WeatherSnapshot":
+        """Row subset (boolean mask or index array); arrays are copied, never re-queried."""
+        return WeatherSnapshot(
+            start=self.start,
+            end=self.end,
+            **{name: getattr(self, name)[mask] for name in self._COLUMNS},
+        )
+
+    def since(self, dt: datetime) -> "WeatherSnapshot":
+        """Rows with recorded_at >= dt (the `recorded_at__gte` filter the tasks used)."""
+        return self.select(self.recorded_at >= dt.timestamp())
+
+    def between(self, start: datetime, end: datetime) -> "WeatherSnapshot":
+        """Rows with start <= recorded_at <= end, re-windowed to [start, end]."""
+        mask = (self.recorded_at >= start.timestamp()) & (self.recorded_at <= end.timestamp())
+        return WeatherSnapshot(
+            start=start,
+            end=end,
+            **{name: getattr(self, name)[mask] for name in self._COLUMNS},
+        )
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        return self.start <= start and end <= self.end
+
+    def timestamps(self) -> pd.DatetimeIndex:
+        """recorded_at as a tz-aware (UTC) DatetimeIndex."""
+        return pd.to_datetime(self.recorded_at, unit="s", utc=True)
+
+    def rounded(self, values: np.ndarray, decimals: int) -> np.ndarray:
+        """
+        Python `round()` applied per distinct coordinate, so bucket keys match the
+        `round(log.location.y, 2)` style keys used elsewhere bit-for-bit.
+        """
+        if values.size == 0:
+            return values.astype(float)
+        uniq, inverse = np.unique(values, return_inverse=True)
+        return np.array([round(float(v), decimals) for v in uniq])[inverse.ravel()]
+
+
+def _empty_snapshot(start: datetime, end: datetime) -> WeatherSnapshot:
+    return WeatherSnapshot(
+        start=start,
+        end=end,
+        ids=np.empty(0, dtype=np.int64),
+        lon=np.empty(0),
+        lat=np.empty(0),
+        temperature=np.empty(0),
+        humidity=np.empty(0),
+        wind_speed=np.empty(0),
+        condition=np.empty(0, dtype=object),
+        city_name=np.empty(0, dtype=object),
+        rainfall_mm=np.empty(0),
+        rain=np.empty(0, dtype=np.int8),
+        recorded_at=np.empty(0),
+        local_month=np.empty(0, dtype=np.int8),
+        local_date=np.empty(0, dtype="datetime64[D]"),
+    )
+
+
+def load_weather_snapshot(start: datetime, end: datetime) -> WeatherSnapshot:
+    """Single DB scan of WeatherLog into NumPy arrays (no model instances, no GEOS)."""
+    sql = _SNAPSHOT_SQL.format(table=connection.ops.quote_name(WeatherLog._meta.db_table))
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [start, end])
+        rows = cursor.fetchall()
+
+    if not rows:
+        return _empty_snapshot(start, end)
+
+    ids, lon, lat, temp, hum, wind, cond, city, rain_mm, epoch = zip(*rows)
+    condition = np.array(cond, dtype=object)
+    rainfall_mm = np.array(rain_mm, dtype=float)  # None → NaN
+
+    # Rain flag evaluated once per distinct condition string, OR measured rainfall
+    uniq, inverse = np.unique(condition.astype(str), return_inverse=True)
+    uniq_rain = np.array([1 if (c or "").strip().lower() in RAIN_CONDITIONS else 0 for c in uniq], dtype=np.int8)
+    rain = uniq_rain[inverse.ravel()] | (np.nan_to_num(rainfall_mm) > 0).astype(np.int8)
+
+    recorded_at = np.asarray(epoch, dtype=float)
+    local = pd.to_datetime(recorded_at, unit="s", utc=True).tz_convert(timezone.get_current_timezone())
+
+    return WeatherSnapshot(
+        start=start,
+        end=end,
+        ids=np.asarray(ids, dtype=np.int64),
+        lon=np.asarray(lon, dtype=float),
+        lat=np.asarray(lat, dtype=float),
+        temperature=np.asarray(temp, dtype=float),
+        humidity=np.asarray(hum, dtype=float),
+        wind_speed=np.asarray(wind, dtype=float),
+        condition=condition,
+        city_name=np.array(city, dtype=object),
+        rainfall_mm=rainfall_mm,
+        rain=rain,
+        recorded_at=recorded_at,
+        local_month=local.month.to_numpy(dtype=np.int8),
+        local_date=local.tz_localize(None).normalize().to_numpy().astype("datetime64[D]"),
+    )
+
+
+_preloaded: ContextVar[Optional[WeatherSnapshot]] = ContextVar("preloaded_weather_snapshot", default=None)
+
+
+@contextmanager
+def preloaded_snapshot(snapshot: WeatherSnapshot):
+    """
+    Serve `get_weather_snapshot(now)` from `snapshot` (sliced to the window ending
+    at `now`) while inside the block. Backfills load one wide snapshot per chunk
+    and replay every hour from it, without touching the DB or the cache.
+    """
+    token = _preloaded.set(snapshot)
+    try:
+        yield snapshot
+    finally:
+        _preloaded.reset(token)
+
+
+def _cache_key(now: datetime) -> str:
+    # One snapshot per beat cycle (the hour `now` falls in)
+    cycle = timezone.localtime(now).strftime("%Y%m%d%H")
+    return f"{SNAPSHOT_CACHE_PREFIX}:{int(SNAPSHOT_WINDOW.total_seconds())}:{cycle}"
+
+
+def get_weather_snapshot(now: Optional[datetime] = None) -> WeatherSnapshot:
+    """
+    Return the shared snapshot covering [now - SNAPSHOT_WINDOW, now].
+    Cached per hourly cycle for WEATHER_SNAPSHOT_TTL seconds, so every forecasting
+    task in the same cycle slices one DB scan instead of querying WeatherLog again.
+    """
+    if now is None:
+        now = timezone.now()
+
+    preloaded = _preloaded.get()
+    if preloaded is not None and preloaded.covers(now - SNAPSHOT_WINDOW, now):
+        return preloaded.between(now - SNAPSHOT_WINDOW, now)
+
+    key = _cache_key(now)
+
+    snapshot = cache.get(key)
+    if snapshot is None:
+        snapshot = load_weather_snapshot(now - SNAPSHOT_WINDOW, now)
+        cache.set(key, snapshot, _ttl())
+    return snapshot
+
+
+def invalidate_weather_snapshot(now: Optional[datetime] = None) -> None:
+    """Drop the cached snapshot for the current cycle (call after new logs are written)."""
+    cache.delete(_cache_key(now or timezone.now()))
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "WEATHER_SNAPSHOT_TTL", 55 * 60))